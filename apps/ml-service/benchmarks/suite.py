@@ -0,0 +1,449 @@
+"""Offline micro-benchmarks for the inference and training hot paths.
+
+Everything runs against a temporary file-based MLflow store, so no services are
+needed. Results are written as JSON and can be compared against a saved
+baseline; a metric that is worse than the baseline by more than the tolerance
+is reported as a regression and makes the command exit non-zero.
+
+Usage::
+
+    poetry run python -m benchmarks.suite run --output bench.json
+    poetry run python -m benchmarks.suite run --save-baseline
+    poetry run python -m benchmarks.suite run --baseline benchmarks/baseline.json
+    poetry run python -m benchmarks.suite compare bench.json benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+BATCH_SIZES = (1, 10, 100, 1000)
+INFERENCE_BACKENDS = ("sklearn", "compiled")
+JSON_CODECS = ("standard", "fast")
+FEATURES = [30.0, 1.0, 20.0, 0.3, 4.0]
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class Measurement:
+    name: str
+    value: float
+    unit: str
+    lower_is_better: bool = True
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline: float
+    current: float
+    change: float
+
+
+def _timings(fn: Callable[[], object], repeat: int, warmup: int = 1) -> np.ndarray:
+    for _ in range(warmup):
+        fn()
+    samples = np.empty(repeat)
+    for index in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples[index] = time.perf_counter() - started
+    return samples
+
+
+_COLD_START_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import src.main
+from src.models.registry import ModelRepository
+imported = time.perf_counter()
+repository = ModelRepository(settings=src.main.settings)
+ready = time.perf_counter()
+repository.wait_until_synced()
+print(json.dumps([imported - started, ready - started, time.perf_counter() - started]))
+"""
+
+
+def _asgi_timings(
+    app: Any,
+    path: str,
+    body: bytes,
+    repeat: int,
+    warmup: int = 20,
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> np.ndarray:
+    """Seconds per POST of ``body`` to ``path``, calling the ASGI app in process."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers or [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1),
+        "server": ("testserver", 80),
+    }
+
+    async def post() -> None:
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        statuses: list[int] = []
+
+        async def receive() -> dict[str, Any]:
+            return messages.pop() if messages else {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        await app(scope, receive, send)
+        if statuses != [200]:
+            raise RuntimeError(f"{path} answered {statuses}")
+
+    async def run() -> np.ndarray:
+        for _ in range(warmup):
+            await post()
+        samples = np.empty(repeat)
+        for index in range(repeat):
+            started = time.perf_counter()
+            await post()
+            samples[index] = time.perf_counter() - started
+        return samples
+
+    return asyncio.run(run())
+
+
+def _cold_start(env: dict[str, str]) -> tuple[float, float, float]:
+    """Seconds from a fresh interpreter to (app imported, model served, registry synced)."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _COLD_START_SCRIPT],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, **env, "LOG_LEVEL": "WARNING"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported, ready, synced = json.loads(completed.stdout.strip().splitlines()[-1])
+    return imported, ready, synced
+
+
+def run_suite(workspace: Path, quick: bool = False) -> list[Measurement]:
+    import mlflow
+    from fastapi import FastAPI
+    from mlflow.tracking import MlflowClient
+
+    from src.api.routes import inference
+    from src.api.tensor import TENSOR_MEDIA_TYPE, decode_tensor_batch, write_tensor
+    from src.core.config import Settings
+    from src.models.executor import InferenceExecutor
+    from src.models.local_artifact import load_local_artifact
+    from src.models.registry import ModelRepository
+    from src.schemas.prediction import BatchFailurePredictionRequest
+    from src.services.data_loader import generate_synthetic_dataset
+    from src.services.trainer import train_and_register_model
+
+    scale = 1 if quick else 5
+    measurements: list[Measurement] = []
+
+    def settings(store: str, **overrides: Any) -> Settings:
+        return Settings(
+            mlflow_tracking_uri=f"file:{workspace / store}",
+            model_name="benchmark-failure-risk",
+            model_local_artifact=str(workspace / f"{store}-artifacts" / "model.joblib"),
+            model_refresh_interval_seconds=0,
+            **overrides,
+        )
+
+    # Training: the first run also bootstraps the registry used below.
+    training_settings = settings("mlruns")
+    data = generate_synthetic_dataset(num_samples=500)
+    train_seconds = _timings(
+        lambda: train_and_register_model(training_settings, data=data), repeat=scale, warmup=0
+    )
+    measurements.append(Measurement("train_and_register_s", float(np.median(train_seconds)), "s"))
+
+    dataset_seconds = _timings(lambda: generate_synthetic_dataset(num_samples=10_000), 10 * scale)
+    measurements.append(
+        Measurement("synthetic_dataset_10k_ms", float(np.median(dataset_seconds)) * 1e3, "ms")
+    )
+
+    # Model load from the file-based MLflow registry. Without the local copy
+    # (which the registry path would otherwise reuse) every load downloads.
+    artifact_dir = Path(training_settings.model_local_artifact).parent
+
+    def load_from_registry() -> None:
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+        ModelRepository(settings=training_settings)
+
+    load_seconds = _timings(load_from_registry, 2 * scale)
+    measurements.append(
+        Measurement("model_load_mlflow_ms", float(np.median(load_seconds)) * 1e3, "ms")
+    )
+
+    # Model load from the local artifact: the registry answers but has no
+    # promoted version, which is when _load_model falls back to the artifact.
+    local_settings = settings("local-mlruns")
+    local_artifact = Path(local_settings.model_local_artifact)
+    local_artifact.parent.mkdir(parents=True, exist_ok=True)
+    local_artifact.write_bytes(Path(training_settings.model_local_artifact).read_bytes())
+    mlflow.set_tracking_uri(local_settings.mlflow_tracking_uri)
+    MlflowClient().create_registered_model(local_settings.model_name)
+    load_seconds = _timings(lambda: ModelRepository(settings=local_settings), 5 * scale)
+    measurements.append(
+        Measurement("model_load_local_artifact_ms", float(np.median(load_seconds)) * 1e3, "ms")
+    )
+    # The registry-synced copy left by the last registry load, mapped from its flat file.
+    load_seconds = _timings(
+        lambda: load_local_artifact(training_settings.model_local_artifact, prefer_flat=True),
+        20 * scale,
+    )
+    measurements.append(
+        Measurement("model_load_flat_artifact_ms", float(np.median(load_seconds)) * 1e3, "ms")
+    )
+
+    # Cold start in a fresh interpreter against the registry trained above,
+    # whose local artifact is now a registry-synced copy (joblib and flat).
+    cold_starts = (
+        ("registry_first", "sklearn"),
+        ("local_first", "sklearn"),
+        ("local_first", "compiled"),
+    )
+    for mode, backend in cold_starts:
+        env = {
+            "MLFLOW_TRACKING_URI": training_settings.mlflow_tracking_uri,
+            "MODEL_NAME": training_settings.model_name,
+            "MODEL_LOCAL_ARTIFACT": training_settings.model_local_artifact,
+            "MODEL_STARTUP_MODE": mode,
+            "INFERENCE_BACKEND": backend,
+        }
+        imported, ready, synced = np.median([_cold_start(env) for _ in range(scale)], axis=0)
+        if mode == "registry_first":
+            measurements.append(Measurement("cold_start_import_s", float(imported), "s"))
+        measurements += [
+            Measurement(f"cold_start_{mode}_{backend}_ready_s", float(ready), "s"),
+            Measurement(f"cold_start_{mode}_{backend}_synced_s", float(synced), "s"),
+        ]
+
+    rng = np.random.default_rng(0)
+    for backend in INFERENCE_BACKENDS:
+        repository = ModelRepository(settings=settings("mlruns", inference_backend=backend))
+        predict, predict_batch = repository.predict, repository.predict_batch
+
+        latency = _timings(lambda predict=predict: predict(FEATURES), 200 * scale, warmup=20)
+        measurements += [
+            Measurement(f"predict_{backend}_p50_us", float(np.percentile(latency, 50)) * 1e6, "us"),
+            Measurement(f"predict_{backend}_p95_us", float(np.percentile(latency, 95)) * 1e6, "us"),
+        ]
+
+        for size in BATCH_SIZES:
+            rows = (np.asarray(FEATURES) * rng.uniform(0.5, 1.5, (size, len(FEATURES)))).tolist()
+            seconds = _timings(
+                lambda rows=rows, predict_batch=predict_batch: predict_batch(rows), 20 * scale
+            )
+            measurements.append(
+                Measurement(
+                    f"predict_batch_{backend}_{size}_rows_per_s",
+                    size / float(np.median(seconds)),
+                    "rows/s",
+                    lower_is_better=False,
+                )
+            )
+
+    # Request parsing, validation and response rendering around the fastest
+    # backend, through the inference routes, for each INFERENCE_JSON_CODEC.
+    app = FastAPI()
+    app.include_router(inference.router)
+    app.state.model_repository = repository
+    app.state.inference_executor = InferenceExecutor(
+        workers=1, max_in_flight=64, max_queue_ms=60_000
+    )
+    app.state.micro_batcher = None
+    single = json.dumps({"asset_id": "asset-1", "features": FEATURES}).encode()
+    batch = json.dumps(
+        {"items": [{"asset_id": f"asset-{index}", "features": FEATURES} for index in range(100)]}
+    ).encode()
+    for codec in JSON_CODECS:
+        app.state.json_codec = codec
+        for name, path, body in (
+            ("predict", "/inference/predict-failure", single),
+            ("predict_batch_100", "/inference/predict-failure/batch", batch),
+        ):
+            latency = _asgi_timings(app, path, body, 200 * scale)
+            measurements.append(
+                Measurement(
+                    f"api_{name}_{codec}_json_p50_us", float(np.median(latency)) * 1e6, "us"
+                )
+            )
+    tensor_type = TENSOR_MEDIA_TYPE.encode()
+    tensor_batch = write_tensor(
+        {"asset_ids": [f"asset-{index}" for index in range(100)], "rows": 100, "features": 5},
+        np.tile(np.asarray(FEATURES, dtype=np.float32), (100, 1)),
+    )
+    latency = _asgi_timings(
+        app,
+        "/inference/predict-failure/tensor",
+        tensor_batch,
+        200 * scale,
+        headers=[(b"content-type", tensor_type), (b"accept", tensor_type)],
+    )
+    measurements.append(
+        Measurement("api_predict_batch_100_tensor_p50_us", float(np.median(latency)) * 1e6, "us")
+    )
+    app.state.inference_executor.shutdown()
+
+    # Request decoding alone for wide rows (e.g. vibration spectra), which the
+    # five-feature model cannot score.
+    wide = np.random.default_rng(0).random((100, 2048), dtype=np.float32)
+    wide_json = json.dumps(
+        {
+            "items": [
+                {"asset_id": f"asset-{index}", "features": row.tolist()}
+                for index, row in enumerate(wide)
+            ]
+        }
+    ).encode()
+    wide_tensor = write_tensor(
+        {"asset_ids": [f"asset-{index}" for index in range(100)], "rows": 100, "features": 2048},
+        wide,
+    )
+    for name, decode in (
+        ("json", lambda: BatchFailurePredictionRequest.model_validate_json(wide_json)),
+        ("tensor", lambda: decode_tensor_batch(wide_tensor)),
+    ):
+        seconds = _timings(decode, 10 * scale)
+        measurements.append(
+            Measurement(f"decode_100x2048_{name}_us", float(np.median(seconds)) * 1e6, "us")
+        )
+
+    return measurements
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> list[Regression]:
+    """Return metrics in both runs that got worse by more than ``tolerance``."""
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        reference = baseline_results.get(result["name"])
+        if reference is None or reference["value"] == 0:
+            continue
+        change = result["value"] / reference["value"] - 1
+        worse = change > tolerance if result["lower_is_better"] else change < -tolerance
+        if worse:
+            regressions.append(
+                Regression(result["name"], reference["value"], result["value"], change)
+            )
+    return regressions
+
+
+def _report(payload: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    reference = {result["name"]: result["value"] for result in (baseline or {}).get("results", [])}
+    for result in payload["results"]:
+        line = f"{result['name']:<44} {result['value']:>14.2f} {result['unit']}"
+        if result["name"] in reference and reference[result["name"]]:
+            line += f"  ({result['value'] / reference[result['name']] - 1:+.1%} vs baseline)"
+        print(line)
+
+
+def _print_regressions(regressions: list[Regression], tolerance: float) -> None:
+    if not regressions:
+        print(f"No regressions beyond {tolerance:.0%}.")
+        return
+    print(f"{len(regressions)} regression(s) beyond {tolerance:.0%}:")
+    for regression in regressions:
+        print(
+            f"  {regression.name}: {regression.baseline:.2f} -> {regression.current:.2f} "
+            f"({regression.change:+.1%})"
+        )
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run or compare ml-service micro-benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the suite")
+    run.add_argument("--quick", action="store_true", help="Fewer repetitions (smoke runs)")
+    run.add_argument("--output", type=Path, help="Write results JSON to this path")
+    run.add_argument("--baseline", type=Path, help="Flag regressions against this results file")
+    run.add_argument(
+        "--save-baseline", action="store_true", help=f"Also write results to {DEFAULT_BASELINE}"
+    )
+    run.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+
+    diff = commands.add_parser("compare", help="Compare two results files")
+    diff.add_argument("current", type=Path)
+    diff.add_argument("baseline", type=Path)
+    diff.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        current = json.loads(args.current.read_text())
+        baseline = json.loads(args.baseline.read_text())
+        _report(current, baseline)
+        regressions = compare(current, baseline, args.tolerance)
+        _print_regressions(regressions, args.tolerance)
+        return 1 if regressions else 0
+
+    from src.core.logging import configure_logging
+
+    configure_logging("WARNING")
+    # MLflow's registry-stage deprecation warnings would drown out the report.
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    with tempfile.TemporaryDirectory(prefix="ml-service-bench-") as workspace:
+        measurements = run_suite(Path(workspace), quick=args.quick)
+    payload = {
+        "environment": _environment(),
+        "results": [asdict(measurement) for measurement in measurements],
+    }
+
+    outputs = [args.output] if args.output else []
+    if args.save_baseline:
+        outputs.append(DEFAULT_BASELINE)
+    for output in outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(payload, indent=2) + "\n")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    _report(payload, baseline)
+    if baseline is None:
+        return 0
+    regressions = compare(payload, baseline, args.tolerance)
+    _print_regressions(regressions, args.tolerance)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
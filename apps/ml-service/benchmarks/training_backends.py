@@ -0,0 +1,64 @@
+"""Compare fit time and hold-out AUC of the training backends.
+
+Usage::
+
+    poetry run python -m benchmarks.training_backends --rows 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from typing import Any
+
+from src.services.data_loader import TrainingData, generate_synthetic_dataset
+from src.services.trainer import _build_pipeline, _split_holdout
+
+BACKENDS = ("gradient_boosting", "hist_gradient_boosting")
+
+
+def benchmark(rows: int, backends: tuple[str, ...] = BACKENDS) -> list[dict[str, Any]]:
+    from sklearn.metrics import roc_auc_score  # type: ignore[import-untyped]
+
+    dataset: TrainingData = generate_synthetic_dataset(num_samples=rows)
+    split = _split_holdout(dataset, fraction=0.2)
+    assert split is not None, "benchmark datasets must be large enough to split"
+    x_train, x_holdout, y_train, y_holdout = split
+
+    results = []
+    for backend in backends:
+        pipeline = _build_pipeline(backend=backend)  # type: ignore[arg-type]
+        started = time.perf_counter()
+        pipeline.fit(x_train, y_train)
+        fit_seconds = time.perf_counter() - started
+        auc = roc_auc_score(y_holdout, pipeline.predict_proba(x_holdout)[:, 1])
+        results.append(
+            {
+                "rows": rows,
+                "backend": backend,
+                "fit_seconds": round(fit_seconds, 3),
+                "holdout_auc": round(float(auc), 4),
+            }
+        )
+        print(f"{rows:>9} rows  {backend:<24} fit {fit_seconds:8.2f}s  AUC {auc:.4f}", flush=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}")
+    results = [row for rows in args.rows for row in benchmark(rows, tuple(args.backends))]
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Optional fast JSON codec for the inference routes (``INFERENCE_JSON_CODEC=fast``).
+
+Request bodies are decoded and validated in one step by pydantic's JSON
+parser (``model_validate_json``) straight into the route's request model,
+instead of ``json.loads`` building a dict that FastAPI then validates.
+Responses are rendered by pydantic's own serializer rather than FastAPI's
+validate, convert and ``json.dumps`` steps. The request models, validation
+rules and OpenAPI schema are the same for both codecs.
+"""
+
+from collections.abc import Callable, Coroutine
+from typing import Any, Literal, TypeVar
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+
+from .routing import InstrumentedRoute
+
+JSONCodec = Literal["standard", "fast"]
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+class _DecodedRequest(Request):
+    """Request whose JSON body has already been decoded into the route's model."""
+
+    def __init__(self, request: Request, body: bytes, payload: BaseModel) -> None:
+        super().__init__(request.scope, request.receive)
+        self._body = body
+        # FastAPI validates what json() returns; a model instance passes through as is.
+        self._json = payload
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response rendering a pydantic model with the model's serializer."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return super().render(content)
+
+
+class CodecRoute(InstrumentedRoute):
+    """Instrumented route that decodes JSON bodies with the app's configured codec."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        body_model = self._body_model()
+        if body_model is None:
+            return handler
+
+        async def route_handler(request: Request) -> Response:
+            if getattr(request.app.state, "json_codec", "standard") == "fast" and _is_json(request):
+                body = await request.body()
+                if body:
+                    try:
+                        payload = body_model.model_validate_json(body)
+                    except ValidationError as exc:
+                        errors = exc.errors(include_url=False)
+                        raise RequestValidationError(
+                            [{**error, "loc": ("body", *error["loc"])} for error in errors],
+                            body=body,
+                        ) from None
+                    request = _DecodedRequest(request, body, payload)
+            return await handler(request)
+
+        return route_handler
+
+    def _body_model(self) -> type[BaseModel] | None:
+        """The request model when the body is exactly one, non-embedded, pydantic model."""
+        params = self.dependant.body_params
+        if len(params) != 1 or getattr(params[0].field_info, "embed", False):
+            return None
+        annotation = params[0].field_info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return annotation
+        return None
+
+
+def _is_json(request: Request) -> bool:
+    # Mirrors FastAPI: a missing content type is parsed as JSON too.
+    content_type = request.headers.get("content-type", "application/json")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+def encode_response(codec: JSONCodec, model: _ModelT) -> _ModelT | Response:
+    """Return ``model`` for FastAPI to serialize, or an already rendered response.
+
+    A rendered response skips FastAPI's re-validation of the return value; the
+    model's constraints were already checked when it was constructed.
+    """
+    if codec == "fast":
+        return ModelJSONResponse(model)
+    return model
@@ -0,0 +1,40 @@
+from fastapi import Request
+
+from ..models.batcher import MicroBatcher
+from ..models.executor import InferenceExecutor
+from ..models.registry import ModelRepository
+from ..services.jobs import TrainingJobManager
+from .codec import JSONCodec
+
+# The getters are coroutines only so FastAPI calls them inline: a plain ``def``
+# dependency is run on the thread pool, one thread hop per dependency per request.
+
+
+async def get_repository(request: Request) -> ModelRepository:
+    """Return the process-wide model repository created at application startup."""
+    repository: ModelRepository = request.app.state.model_repository
+    return repository
+
+
+async def get_inference_executor(request: Request) -> InferenceExecutor:
+    """Return the process-wide executor that scores inference requests."""
+    executor: InferenceExecutor = request.app.state.inference_executor
+    return executor
+
+
+async def get_json_codec(request: Request) -> JSONCodec:
+    """Return the JSON codec configured for the inference routes."""
+    codec: JSONCodec = request.app.state.json_codec
+    return codec
+
+
+async def get_micro_batcher(request: Request) -> MicroBatcher | None:
+    """Return the micro-batcher, or ``None`` when micro-batching is disabled."""
+    micro_batcher: MicroBatcher | None = request.app.state.micro_batcher
+    return micro_batcher
+
+
+async def get_training_jobs(request: Request) -> TrainingJobManager:
+    """Return the process-wide training job manager."""
+    training_jobs: TrainingJobManager = request.app.state.training_jobs
+    return training_jobs
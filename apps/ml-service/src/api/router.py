@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 
-from .routes import health, inference, training
+from .routes import health, inference, metrics, training
 
 api_router = APIRouter()
 api_router.include_router(health.router)
 api_router.include_router(inference.router)
 api_router.include_router(training.router)
+api_router.include_router(metrics.router)
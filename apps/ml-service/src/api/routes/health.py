@@ -1,10 +1,51 @@
-from fastapi import APIRouter
+from typing import Literal
 
-from ...schemas.system import HealthResponse
+from fastapi import APIRouter, Depends, Request, Response
 
-router = APIRouter(prefix="/health", tags=["Health"])
+from ...core.config import Settings, get_settings
+from ...models.registry import ModelRepository
+from ...schemas.system import HealthResponse, ReadinessResponse
+from ..dependencies import get_repository
+from ..routing import InstrumentedRoute
+
+router = APIRouter(prefix="/health", tags=["Health"], route_class=InstrumentedRoute)
 
 
 @router.get("", response_model=HealthResponse)
 def health_check() -> HealthResponse:
     return HealthResponse(status="ok")
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "No model loaded yet"}},
+)
+def readiness_check(
+    request: Request,
+    response: Response,
+    repository: ModelRepository = Depends(get_repository),  # noqa: B008
+    settings: Settings = Depends(get_settings),  # noqa: B008
+) -> ReadinessResponse:
+    """Report whether a model is being served, and whether it is the registry's.
+
+    Returns 503 until the first model is loaded.
+    """
+    active = repository.active
+    status: Literal["loading", "serving_local", "serving_registry"]
+    if active is None:
+        response.status_code = 503
+        status = "loading"
+    elif active.source == "local_artifact":
+        status = "serving_local"
+    else:
+        status = "serving_registry"
+
+    return ReadinessResponse(
+        status=status,
+        model_version=active.model_version if active else None,
+        model_source=active.source if active else None,
+        registry_sync=repository.sync_state,
+        startup_mode=settings.model_startup_mode,
+        startup_seconds=getattr(request.app.state, "startup_seconds", None),
+    )
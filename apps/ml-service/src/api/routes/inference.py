@@ -1,41 +1,508 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import ExitStack
+from dataclasses import asdict
+
 import structlog
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 
 from ...core.config import Settings, get_settings
-from ...models.registry import ModelRepository
+from ...core.metrics import observe_request_validation
+from ...models.batcher import MicroBatcher
+from ...models.executor import (
+    InferenceExecutor,
+    InferenceOverloadedError,
+    TooManyInFlightError,
+)
+from ...models.registry import (
+    BatchItemResult,
+    LoadedModel,
+    MatrixPrediction,
+    ModelNotFoundError,
+    ModelRepository,
+    ModelUnavailableError,
+)
 from ...schemas.prediction import (
+    BatchFailurePredictionRequest,
+    BatchFailurePredictionResponse,
+    BatchFailurePredictionResult,
+    BatchPredictionItem,
     FailurePrediction,
     FailurePredictionRequest,
     FailurePredictionResponse,
+    InferenceExecutorStats,
+    InferenceStatsResponse,
+    LoadedModelCacheStats,
+    MicroBatchingStats,
+    ModelSelection,
+    PredictionCacheStats,
+    ShadowScoringStats,
+    StreamScoringError,
+    StreamScoringSummary,
+)
+from ..codec import CodecRoute, JSONCodec, encode_response
+from ..dependencies import (
+    get_inference_executor,
+    get_json_codec,
+    get_micro_batcher,
+    get_repository,
+)
+from ..tensor import (
+    TENSOR_MEDIA_TYPE,
+    TensorBatch,
+    TensorPayloadError,
+    decode_tensor_batch,
+    encode_tensor_predictions,
 )
 
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/inference", tags=["Inference"])
+router = APIRouter(prefix="/inference", tags=["Inference"], route_class=CodecRoute)
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
-def get_repository(
-    settings: Settings = Depends(get_settings),  # noqa: B008
-) -> ModelRepository:
-    return ModelRepository(settings=settings)
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """Streaming response whose body iterator consumes the request body.
+
+    ``StreamingResponse`` normally watches for client disconnects by calling
+    ``receive`` concurrently, which would steal the request body messages the
+    iterator is still reading. Disconnects surface through ``request.stream()``
+    instead. ``on_close`` runs once the response is finished, however it ends.
+    """
+
+    def __init__(
+        self,
+        content: AsyncIterator[bytes],
+        status_code: int = 200,
+        media_type: str | None = None,
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        # Keeps ``status_code`` in the signature: FastAPI reads its default for OpenAPI.
+        super().__init__(content, status_code=status_code, media_type=media_type)
+        self._on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+        if self.background is not None:
+            await self.background()
+
+
+def _model_unavailable(exc: ModelUnavailableError) -> HTTPException:
+    # Only possible while a local_first startup is still fetching or training a model.
+    return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "5"})
+
+
+def _overloaded(exc: InferenceOverloadedError) -> HTTPException:
+    # 429 when too many requests are in flight, 503 when one queued past its deadline.
+    status_code = 429 if isinstance(exc, TooManyInFlightError) else 503
+    return HTTPException(status_code=status_code, detail=str(exc), headers={"Retry-After": "1"})
+
+
+def _select_model(
+    repository: ModelRepository, selection: ModelSelection | None
+) -> LoadedModel | None:
+    """Resolve a request's model selection; None means the served model.
+
+    Blocking: a version not used before is loaded from the registry.
+    """
+    if selection is None:
+        return None
+    try:
+        return repository.resolve(selection.name, selection.version, selection.stage)
+    except ModelNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ModelUnavailableError as exc:
+        raise _model_unavailable(exc) from exc
+
+
+def _observe_validation(repository: ModelRepository, selection: ModelSelection | None) -> None:
+    # The model that will serve the request is only known up front for default
+    # traffic and explicit version pins; stage selections are labelled "".
+    if selection is None:
+        active = repository.active
+        observe_request_validation(active.model_version if active is not None else "")
+    else:
+        observe_request_validation(selection.version or "")
+
+
+def _score_batch(
+    repository: ModelRepository,
+    payload: BatchFailurePredictionRequest,
+    model: LoadedModel | None,
+    codec: JSONCodec,
+) -> BatchFailurePredictionResponse | Response:
+    outcomes = repository.predict_batch([item.features for item in payload.items], model)
+    # Rendered here, on the executor thread, when the fast codec is on.
+    return encode_response(
+        codec,
+        BatchFailurePredictionResponse(
+            results=[
+                _to_batch_result(item.asset_id, outcome)
+                for item, outcome in zip(payload.items, outcomes, strict=True)
+            ]
+        ),
+    )
+
+
+def _score_tensor(
+    repository: ModelRepository,
+    batch: TensorBatch,
+    model: LoadedModel | None,
+    codec: JSONCodec,
+    packed: bool,
+) -> BatchFailurePredictionResponse | Response:
+    outcome = repository.predict_matrix(batch.matrix, model)
+    if packed:
+        return Response(
+            encode_tensor_predictions(batch.asset_ids, outcome), media_type=TENSOR_MEDIA_TYPE
+        )
+    return encode_response(
+        codec,
+        BatchFailurePredictionResponse(
+            results=[
+                _to_matrix_result(asset_id, index, outcome)
+                for index, asset_id in enumerate(batch.asset_ids)
+            ]
+        ),
+    )
+
+
+def _to_matrix_result(
+    asset_id: str, index: int, outcome: MatrixPrediction
+) -> BatchFailurePredictionResult:
+    error = outcome.errors.get(index)
+    return BatchFailurePredictionResult(
+        asset_id=asset_id,
+        prediction=FailurePrediction(
+            probability=float(outcome.probabilities[index]),
+            model_version=outcome.model_version,
+            run_id=outcome.run_id,
+        )
+        if error is None
+        else None,
+        error=error,
+    )
+
+
+def _check_batch_size(size: int, settings: Settings) -> None:
+    if size > settings.inference_max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                f"Batch of {size} items exceeds the maximum of "
+                f"{settings.inference_max_batch_size}"
+            ),
+        )
+
+
+def _to_batch_result(asset_id: str, outcome: BatchItemResult) -> BatchFailurePredictionResult:
+    prediction = outcome.prediction
+    return BatchFailurePredictionResult(
+        asset_id=asset_id,
+        prediction=FailurePrediction(
+            probability=prediction.probability,
+            model_version=prediction.model_version,
+            run_id=prediction.run_id,
+        )
+        if prediction is not None
+        else None,
+        error=outcome.error,
+    )
 
 
 @router.post("/predict-failure", response_model=FailurePredictionResponse)
-def predict_failure(
+async def predict_failure(
     payload: FailurePredictionRequest,
     repository: ModelRepository = Depends(get_repository),  # noqa: B008
-) -> FailurePredictionResponse:
+    executor: InferenceExecutor = Depends(get_inference_executor),  # noqa: B008
+    micro_batcher: MicroBatcher | None = Depends(get_micro_batcher),  # noqa: B008
+    codec: JSONCodec = Depends(get_json_codec),  # noqa: B008
+) -> FailurePredictionResponse | Response:
+    _observe_validation(repository, payload.model)
+    model = (
+        await run_in_threadpool(_select_model, repository, payload.model)
+        if payload.model is not None
+        else None
+    )
     try:
-        prediction = repository.predict(payload.features)
+        if micro_batcher is not None and model is None:
+            with executor.admit():
+                prediction = await asyncio.wrap_future(micro_batcher.submit(payload.features))
+        else:
+            prediction = await executor.run(repository.predict, payload.features, model)
+    except InferenceOverloadedError as exc:
+        raise _overloaded(exc) from exc
+    except ModelUnavailableError as exc:
+        raise _model_unavailable(exc) from exc
     except ValueError as exc:
         logger.warning("prediction.failed", asset_id=payload.asset_id, exc_info=exc)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    return FailurePredictionResponse(
-        asset_id=payload.asset_id,
-        prediction=FailurePrediction(
-            probability=prediction.probability,
-            model_version=prediction.model_version,
-            run_id=prediction.run_id,
+    return encode_response(
+        codec,
+        FailurePredictionResponse(
+            asset_id=payload.asset_id,
+            prediction=FailurePrediction(
+                probability=prediction.probability,
+                model_version=prediction.model_version,
+                run_id=prediction.run_id,
+            ),
+        ),
+    )
+
+
+@router.post("/predict-failure/batch", response_model=BatchFailurePredictionResponse)
+async def predict_failure_batch(
+    payload: BatchFailurePredictionRequest,
+    repository: ModelRepository = Depends(get_repository),  # noqa: B008
+    executor: InferenceExecutor = Depends(get_inference_executor),  # noqa: B008
+    settings: Settings = Depends(get_settings),  # noqa: B008
+    codec: JSONCodec = Depends(get_json_codec),  # noqa: B008
+) -> BatchFailurePredictionResponse | Response:
+    _observe_validation(repository, payload.model)
+    _check_batch_size(len(payload.items), settings)
+
+    model = (
+        await run_in_threadpool(_select_model, repository, payload.model)
+        if payload.model is not None
+        else None
+    )
+    try:
+        return await executor.run(_score_batch, repository, payload, model, codec)
+    except InferenceOverloadedError as exc:
+        raise _overloaded(exc) from exc
+    except ModelUnavailableError as exc:
+        raise _model_unavailable(exc) from exc
+    except ValueError as exc:
+        logger.warning("prediction.batch_failed", batch_size=len(payload.items), exc_info=exc)
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+_TENSOR_SCHEMA = {"type": "string", "format": "binary"}
+
+
+@router.post(
+    "/predict-failure/tensor",
+    response_model=BatchFailurePredictionResponse,
+    responses={200: {"content": {TENSOR_MEDIA_TYPE: {"schema": _TENSOR_SCHEMA}}}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {TENSOR_MEDIA_TYPE: {"schema": _TENSOR_SCHEMA}},
+        }
+    },
+)
+async def predict_failure_tensor(
+    request: Request,
+    repository: ModelRepository = Depends(get_repository),  # noqa: B008
+    executor: InferenceExecutor = Depends(get_inference_executor),  # noqa: B008
+    settings: Settings = Depends(get_settings),  # noqa: B008
+    codec: JSONCodec = Depends(get_json_codec),  # noqa: B008
+) -> BatchFailurePredictionResponse | Response:
+    """Score a packed float32 feature matrix (see ``src/api/tensor.py`` for the layout).
+
+    The matrix is scored straight from the request body. The response is a
+    packed tensor of probabilities when the request accepts
+    ``application/vnd.biotrakr.tensor``, and a batch JSON response otherwise.
+    """
+    if request.headers.get("content-type", "").split(";")[0].strip() != TENSOR_MEDIA_TYPE:
+        raise HTTPException(status_code=415, detail=f"Content-Type must be {TENSOR_MEDIA_TYPE}")
+    try:
+        batch = decode_tensor_batch(await request.body())
+    except TensorPayloadError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    _observe_validation(repository, batch.model)
+    _check_batch_size(len(batch.asset_ids), settings)
+    packed = TENSOR_MEDIA_TYPE in request.headers.get("accept", "")
+
+    model = (
+        await run_in_threadpool(_select_model, repository, batch.model)
+        if batch.model is not None
+        else None
+    )
+    try:
+        return await executor.run(_score_tensor, repository, batch, model, codec, packed)
+    except InferenceOverloadedError as exc:
+        raise _overloaded(exc) from exc
+    except ModelUnavailableError as exc:
+        raise _model_unavailable(exc) from exc
+    except ValueError as exc:
+        logger.warning("prediction.batch_failed", batch_size=len(batch.asset_ids), exc_info=exc)
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post(
+    "/predict-failure/stream",
+    response_class=_DuplexStreamingResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {"schema": {"$ref": "#/components/schemas/BatchPredictionItem"}}
+            },
+        }
+    },
+)
+async def predict_failure_stream(
+    request: Request,
+    repository: ModelRepository = Depends(get_repository),  # noqa: B008
+    executor: InferenceExecutor = Depends(get_inference_executor),  # noqa: B008
+    settings: Settings = Depends(get_settings),  # noqa: B008
+) -> StreamingResponse:
+    """Score newline-delimited JSON records as they arrive.
+
+    Each input line is a ``BatchPredictionItem``. Rows are scored in chunks of
+    ``INFERENCE_STREAM_CHUNK_SIZE`` and each result line is written as soon as its
+    chunk is done, in input order. The last line is a ``{"summary": ...}`` record.
+    The stream holds one of the executor's in-flight slots until it ends, so it
+    is rejected with 429 up front when the executor is saturated.
+    """
+    slot = ExitStack()
+    try:
+        slot.enter_context(executor.admit())
+    except InferenceOverloadedError as exc:
+        raise _overloaded(exc) from exc
+
+    return _DuplexStreamingResponse(
+        _score_ndjson(
+            request,
+            repository,
+            settings.inference_stream_chunk_size,
+            settings.inference_stream_max_line_bytes,
         ),
+        media_type=NDJSON_MEDIA_TYPE,
+        on_close=slot.close,
+    )
+
+
+@router.get("/stats", response_model=InferenceStatsResponse)
+def inference_stats(
+    repository: ModelRepository = Depends(get_repository),  # noqa: B008
+    executor: InferenceExecutor = Depends(get_inference_executor),  # noqa: B008
+    micro_batcher: MicroBatcher | None = Depends(get_micro_batcher),  # noqa: B008
+) -> InferenceStatsResponse:
+    cache = repository.cache
+    shadow = repository.shadow
+    return InferenceStatsResponse(
+        executor=InferenceExecutorStats(**asdict(executor.stats())),
+        micro_batching=MicroBatchingStats(**asdict(micro_batcher.stats()))
+        if micro_batcher is not None
+        else None,
+        cache=PredictionCacheStats(**asdict(cache.stats())) if cache is not None else None,
+        loaded_models=LoadedModelCacheStats(**asdict(repository.models.stats())),
+        shadow=ShadowScoringStats(**asdict(shadow.stats())) if shadow is not None else None,
+    )
+
+
+async def _iter_lines(request: Request, max_line_bytes: int) -> AsyncIterator[bytes | None]:
+    """Yield the body's lines; ``None`` stands for a line over ``max_line_bytes``.
+
+    At most ``max_line_bytes`` of a line are buffered: the rest of an
+    overlong line is discarded as it arrives.
+    """
+    buffer = bytearray()
+    discarding = False
+    async for chunk in request.stream():
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if discarding:
+                discarding = False
+            elif len(buffer) + end - start > max_line_bytes:
+                yield None
+            else:
+                buffer += chunk[start:end]
+                yield bytes(buffer)
+            buffer.clear()
+            start = end + 1
+
+        if discarding:
+            continue
+        if len(buffer) + len(chunk) - start > max_line_bytes:
+            yield None
+            buffer.clear()
+            discarding = True
+        else:
+            buffer += chunk[start:]
+    if not discarding:
+        yield bytes(buffer)
+
+
+def _parse_stream_record(line: bytes) -> BatchPredictionItem | str:
+    """Parse one NDJSON record, or describe its first validation error."""
+    try:
+        return BatchPredictionItem.model_validate_json(line)
+    except ValidationError as exc:
+        first = exc.errors()[0]
+        location = ".".join(str(part) for part in first["loc"])
+        return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+async def _score_ndjson(
+    request: Request, repository: ModelRepository, chunk_size: int, max_line_bytes: int
+) -> AsyncIterator[bytes]:
+    started = time.perf_counter()
+    rows = failed = 0
+    # (line number, parsed item or the parse error), flushed every ``chunk_size`` rows
+    pending: list[tuple[int, BatchPredictionItem | str]] = []
+
+    async def flush() -> AsyncIterator[bytes]:
+        nonlocal failed
+        items = [entry for _, entry in pending if isinstance(entry, BatchPredictionItem)]
+        outcomes = iter(
+            await run_in_threadpool(repository.predict_batch, [item.features for item in items])
+            if items
+            else []
+        )
+        for line_number, entry in pending:
+            if isinstance(entry, BatchPredictionItem):
+                result = _to_batch_result(entry.asset_id, next(outcomes))
+                failed += result.error is not None
+                yield result.model_dump_json().encode() + b"\n"
+            else:
+                failed += 1
+                error = StreamScoringError(line=line_number, error=entry)
+                yield error.model_dump_json().encode() + b"\n"
+        pending.clear()
+
+    line_number = 0
+    async for line in _iter_lines(request, max_line_bytes):
+        line_number += 1
+        if line is None:
+            rows += 1
+            pending.append((line_number, f"Line exceeds {max_line_bytes} bytes"))
+        elif line.strip():
+            rows += 1
+            pending.append((line_number, _parse_stream_record(line)))
+
+        if len(pending) >= chunk_size:
+            async for output in flush():
+                yield output
+
+    async for output in flush():
+        yield output
+
+    elapsed = time.perf_counter() - started
+    summary = StreamScoringSummary(
+        rows=rows,
+        scored=rows - failed,
+        errors=failed,
+        elapsed_seconds=elapsed,
+        rows_per_second=rows / elapsed if elapsed > 0 else 0.0,
     )
+    logger.info("prediction.stream_completed", **summary.model_dump())
+    yield b'{"summary":' + summary.model_dump_json().encode() + b"}\n"
@@ -1,29 +1,81 @@
 import structlog
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 
-from ...core.config import Settings, get_settings
-from ...schemas.training import TrainingResponse
-from ...services.data_loader import generate_synthetic_dataset
-from ...services.trainer import train_and_register_model
+from ...schemas.training import TrainingJobRequest, TrainingJobResponse, TrainingResponse
+from ...services.jobs import (
+    TrainingJob,
+    TrainingJobManager,
+    TrainingJobParams,
+    TrainingJobStatus,
+    TrainingQueueFullError,
+)
+from ..dependencies import get_training_jobs
+from ..routing import InstrumentedRoute
 
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/training", tags=["Training"])
+router = APIRouter(prefix="/training", tags=["Training"], route_class=InstrumentedRoute)
 
 
-@router.post("/trigger", response_model=TrainingResponse)
-def trigger_training(
-    settings: Settings = Depends(get_settings),  # noqa: B008
-) -> TrainingResponse:
-    dataset = generate_synthetic_dataset()
-    info = train_and_register_model(settings=settings, data=dataset)
-
-    logger.info("training.triggered", model_version=info.model_version, run_id=info.run_id)
-
-    return TrainingResponse(
-        model_version=info.model_version,
-        run_id=info.run_id,
-        auc=info.metrics.get("auc", 0.0),
-        accuracy=info.metrics.get("accuracy", 0.0),
-        f1=info.metrics.get("f1", 0.0),
+def _to_response(job: TrainingJob) -> TrainingJobResponse:
+    result = None
+    if job.status == TrainingJobStatus.SUCCEEDED and job.model_version and job.run_id:
+        result = TrainingResponse(
+            model_version=job.model_version,
+            run_id=job.run_id,
+            auc=job.metrics.get("auc", 0.0),
+            accuracy=job.metrics.get("accuracy", 0.0),
+            f1=job.metrics.get("f1", 0.0),
+        )
+
+    return TrainingJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        num_samples=job.params.num_samples,
+        random_state=job.params.random_state,
+        search=job.params.search,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=result,
+        error=job.error,
     )
+
+
+@router.post("/trigger", response_model=TrainingJobResponse, status_code=202)
+def trigger_training(
+    payload: TrainingJobRequest | None = None,
+    training_jobs: TrainingJobManager = Depends(get_training_jobs),  # noqa: B008
+) -> TrainingJobResponse:
+    request = payload or TrainingJobRequest()
+    try:
+        job = training_jobs.submit(
+            TrainingJobParams(
+                num_samples=request.num_samples,
+                random_state=request.random_state,
+                search=request.search,
+            )
+        )
+    except TrainingQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+    logger.info("training.triggered", job_id=job.job_id, status=job.status.value)
+    return _to_response(job)
+
+
+@router.get("/jobs", response_model=list[TrainingJobResponse])
+def list_training_jobs(
+    training_jobs: TrainingJobManager = Depends(get_training_jobs),  # noqa: B008
+) -> list[TrainingJobResponse]:
+    return [_to_response(job) for job in training_jobs.list_jobs()]
+
+
+@router.get("/jobs/{job_id}", response_model=TrainingJobResponse)
+def get_training_job(
+    job_id: str,
+    training_jobs: TrainingJobManager = Depends(get_training_jobs),  # noqa: B008
+) -> TrainingJobResponse:
+    job = training_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Training job {job_id} not found")
+    return _to_response(job)
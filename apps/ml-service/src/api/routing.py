@@ -0,0 +1,48 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.metrics import CURRENT_ROUTE, HTTP_REQUEST_SECONDS, REQUEST_STARTED
+
+
+class InstrumentedRoute(APIRoute):
+    """API route that records its latency and labels the metrics recorded while it runs.
+
+    The timing wraps the route's ASGI app, so it also covers error responses
+    and the body of streaming responses. Inference metrics recorded while the
+    request is handled, including in thread-pool calls, carry the route's
+    path template as their ``route`` label.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, endpoint, **kwargs)
+        self.app = self._instrument(self.app)
+
+    def _instrument(self, app: ASGIApp) -> ASGIApp:
+        route = self.path_format
+
+        async def instrumented(scope: Scope, receive: Receive, send: Send) -> None:
+            started = time.perf_counter()
+            status = "500"
+
+            async def send_with_status(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = str(message["status"])
+                await send(message)
+
+            route_token = CURRENT_ROUTE.set(route)
+            started_token = REQUEST_STARTED.set(started)
+            try:
+                await app(scope, receive, send_with_status)
+            finally:
+                REQUEST_STARTED.reset(started_token)
+                CURRENT_ROUTE.reset(route_token)
+                HTTP_REQUEST_SECONDS.labels(route, scope["method"], status).observe(
+                    time.perf_counter() - started
+                )
+
+        return instrumented
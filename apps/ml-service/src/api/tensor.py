@@ -0,0 +1,129 @@
+"""Packed float32 tensor payloads for ``/inference/predict-failure/tensor``.
+
+A payload is the magic ``BTTENS01``, the header length (uint32 LE), a UTF-8
+JSON header and a C-order little-endian float32 matrix of ``rows`` x
+``features`` values that starts right after the header. Writers pad the
+header with spaces so the matrix is 8-byte aligned; readers accept any
+offset. Request headers carry ``asset_ids``, ``rows``, ``features`` and an
+optional ``model`` selection. Response headers carry ``asset_ids``, ``rows``,
+``features`` (always 1), ``model_version``, ``run_id`` and ``errors``, a map
+from row index to message for rows that could not be scored; the matrix holds
+one probability per row, NaN for those rows.
+
+The request matrix is a read-only view of the request body: it is never
+copied into Python floats.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from pydantic import ValidationError
+
+from ..models.registry import MatrixPrediction
+from ..schemas.prediction import ModelSelection
+
+TENSOR_MEDIA_TYPE = "application/vnd.biotrakr.tensor"
+TENSOR_FORMAT_MAGIC = b"BTTENS01"
+TENSOR_DTYPE = np.dtype("<f4")
+_PREFIX_LENGTH = len(TENSOR_FORMAT_MAGIC) + 4
+_ALIGNMENT = 8
+
+
+class TensorPayloadError(ValueError):
+    """Raised when a tensor payload is malformed."""
+
+
+@dataclass(frozen=True)
+class TensorBatch:
+    asset_ids: list[str]
+    # (rows, features) float32, read-only view of the request body
+    matrix: np.ndarray
+    model: ModelSelection | None = None
+
+
+def write_tensor(header: dict[str, Any], matrix: np.ndarray) -> bytes:
+    """Pack ``header`` and ``matrix`` (cast to little-endian float32)."""
+    encoded = json.dumps(header, separators=(",", ":")).encode()
+    encoded += b" " * (-(_PREFIX_LENGTH + len(encoded)) % _ALIGNMENT)
+    return b"".join(
+        (
+            TENSOR_FORMAT_MAGIC,
+            len(encoded).to_bytes(4, "little"),
+            encoded,
+            np.ascontiguousarray(matrix, dtype=TENSOR_DTYPE).tobytes(),
+        )
+    )
+
+
+def read_tensor(body: bytes) -> tuple[dict[str, Any], np.ndarray]:
+    """Unpack a payload into its header and a zero-copy ``(rows, features)`` view."""
+    if body[: len(TENSOR_FORMAT_MAGIC)] != TENSOR_FORMAT_MAGIC:
+        raise TensorPayloadError("Not a tensor payload")
+    if len(body) < _PREFIX_LENGTH:
+        raise TensorPayloadError("Truncated tensor header")
+    header_length = int.from_bytes(body[len(TENSOR_FORMAT_MAGIC) : _PREFIX_LENGTH], "little")
+    data_start = _PREFIX_LENGTH + header_length
+    try:
+        header = json.loads(body[_PREFIX_LENGTH:data_start])
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise TensorPayloadError(f"Invalid tensor header: {exc}") from exc
+    if not isinstance(header, dict):
+        raise TensorPayloadError("Tensor header must be a JSON object")
+
+    rows, features = header.get("rows", 0), header.get("features", 0)
+    if not (_is_count(rows) and _is_count(features)):
+        raise TensorPayloadError("Header rows and features must be positive integers")
+    expected = data_start + rows * features * TENSOR_DTYPE.itemsize
+    if len(body) != expected:
+        raise TensorPayloadError(
+            f"Expected {expected} bytes for {rows}x{features} float32 values "
+            f"but received {len(body)}"
+        )
+
+    matrix = np.frombuffer(body, dtype=TENSOR_DTYPE, count=rows * features, offset=data_start)
+    return header, matrix.reshape(rows, features)
+
+
+def decode_tensor_batch(body: bytes) -> TensorBatch:
+    """Parse and validate a tensor request payload."""
+    header, matrix = read_tensor(body)
+    asset_ids = header.get("asset_ids")
+    if not isinstance(asset_ids, list) or not all(isinstance(value, str) for value in asset_ids):
+        raise TensorPayloadError("Header asset_ids must be a list of strings")
+    if len(asset_ids) != len(matrix):
+        raise TensorPayloadError(f"Header has {len(asset_ids)} asset_ids for {len(matrix)} rows")
+
+    model = None
+    if header.get("model") is not None:
+        try:
+            model = ModelSelection.model_validate(header["model"])
+        except ValidationError as exc:
+            raise TensorPayloadError(f"Invalid model selection: {exc.errors()[0]['msg']}") from exc
+    return TensorBatch(asset_ids=asset_ids, matrix=matrix, model=model)
+
+
+def encode_tensor_predictions(asset_ids: list[str], prediction: MatrixPrediction) -> bytes:
+    """Pack ``prediction`` as a ``(rows, 1)`` tensor response."""
+    probabilities = prediction.probabilities
+    return write_tensor(
+        {
+            "asset_ids": asset_ids,
+            "rows": len(probabilities),
+            "features": 1,
+            "model_version": prediction.model_version,
+            "run_id": prediction.run_id,
+            "errors": {str(index): error for index, error in prediction.errors.items()},
+        },
+        probabilities.reshape(-1, 1),
+    )
+
+
+# ------------------------------------------------------------------
+# Internal helpers
+# ------------------------------------------------------------------
+
+
+def _is_count(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
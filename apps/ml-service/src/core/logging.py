@@ -1,30 +1,227 @@
+import atexit
 import logging
+import queue
+import random
 import sys
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Literal, TextIO
 
 import structlog
 
+from .metrics import REGISTRY
 
-def configure_logging(log_level: str = "INFO") -> None:
-    """Configure structlog + stdlib logging for the service."""
+LogMode = Literal["sync", "queue"]
+
+# Info events logged once per scored request; these are the ones sampled.
+PREDICTION_EVENT_PREFIX = "prediction."
+# How long a warning or error waits for room in a full queue before it is dropped.
+PRIORITY_PUT_TIMEOUT_SECONDS = 1.0
+
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "log_records_dropped",
+    "Log records discarded because the logging queue was full.",
+    ("level",),
+)
+LOG_EVENTS_SAMPLED_OUT = REGISTRY.counter(
+    "log_events_sampled_out",
+    "Per-prediction log events skipped by LOG_PREDICTION_SAMPLE_RATE.",
+    ("event",),
+)
+
+_URGENT_LEVELS = frozenset({"warning", "error", "critical", "exception"})
+
+_writer: "LogWriter | None" = None
+
+
+class PredictionEventSampler:
+    """structlog processor keeping a ``rate`` share of info/debug ``prediction.*`` events.
+
+    Kept events carry ``sample_rate`` so counts derived from the logs can be
+    scaled back up. Warnings and errors are never sampled.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        if method_name not in ("info", "debug"):
+            return event_dict
+        event = event_dict.get("event")
+        if not isinstance(event, str) or not event.startswith(PREDICTION_EVENT_PREFIX):
+            return event_dict
+        if random.random() >= self._rate:  # noqa: S311
+            LOG_EVENTS_SAMPLED_OUT.labels(event).inc()
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = self._rate
+        return event_dict
+
+
+class LogWriter:
+    """Render and write log events on a background thread.
+
+    Callers only enqueue: structlog event dicts are rendered to JSON by the
+    worker, which flushes the stream whenever the queue runs empty. When the
+    bounded queue is full, info and debug events are dropped at once, and
+    warnings and errors wait up to ``PRIORITY_PUT_TIMEOUT_SECONDS`` for room.
+    Dropped events are counted in ``log_records_dropped_total``.
+    """
+
+    def __init__(self, stream: TextIO, max_queued: int) -> None:
+        self._stream = stream
+        self._queue: queue.Queue[MutableMapping[str, Any] | str] = queue.Queue(
+            maxsize=max(1, max_queued)
+        )
+        self._renderer = structlog.processors.JSONRenderer()
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the worker once the events already queued have been written."""
+        worker = self._worker
+        if worker is None:
+            return
+
+        self._stop.set()
+        worker.join()
+        self._worker = None
+
+    def submit(self, entry: MutableMapping[str, Any] | str, level: str) -> None:
+        """Queue a structlog event dict, or an already formatted line."""
+        try:
+            if level in _URGENT_LEVELS:
+                self._queue.put(entry, timeout=PRIORITY_PUT_TIMEOUT_SECONDS)
+            else:
+                self._queue.put_nowait(entry)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels(level).inc()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                entry = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            try:
+                self._write(entry)
+                if self._queue.empty():
+                    self._stream.flush()
+            except Exception:  # noqa: BLE001, S112
+                # Nowhere left to report a broken log stream; keep draining.
+                continue
+
+    def _write(self, entry: MutableMapping[str, Any] | str) -> None:
+        if not isinstance(entry, str):
+            rendered = self._renderer(None, "", entry)
+            entry = rendered if isinstance(rendered, str) else rendered.decode()
+        self._stream.write(entry + "\n")
+
+
+class _QueueLogger:
+    """structlog logger that hands finished event dicts to a :class:`LogWriter`."""
+
+    def __init__(self, writer: LogWriter) -> None:
+        self._writer = writer
+
+    def msg(self, event_dict: MutableMapping[str, Any]) -> None:
+        self._writer.submit(event_dict, event_dict.get("level", "info"))
+
+    debug = info = warning = warn = error = critical = exception = fatal = log = msg
+
+
+class _QueueHandler(logging.Handler):
+    """Send records from stdlib loggers (uvicorn, MLflow, ...) through the writer too."""
+
+    def __init__(self, writer: LogWriter) -> None:
+        super().__init__()
+        self._writer = writer
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._writer.submit(self.format(record), record.levelname.lower())
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+
+def configure_logging(
+    log_level: str = "INFO",
+    mode: LogMode = "sync",
+    queue_size: int = 10_000,
+    prediction_sample_rate: float = 1.0,
+) -> None:
+    """Configure structlog + stdlib logging for the service.
+
+    In ``sync`` mode events go through the stdlib logging handlers and are
+    rendered and written to stdout by the calling thread. In ``queue`` mode the
+    caller only runs the structlog processors and enqueues the event; a
+    :class:`LogWriter` thread renders and writes it.
+    """
+    global _writer
+
+    shutdown_logging()
+    level = getattr(logging, log_level.upper(), logging.INFO)
     timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
 
-    structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            timestamper,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
-        ],
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
-
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper(), logging.INFO),
-        format="%(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    processors: list[Any] = [structlog.contextvars.merge_contextvars]
+    if prediction_sample_rate < 1.0:
+        # Ahead of the other processors, so skipped events cost next to nothing.
+        processors.append(PredictionEventSampler(prediction_sample_rate))
+    processors += [
+        timestamper,
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+
+    handler: logging.Handler
+    if mode == "queue":
+        writer = LogWriter(sys.stdout, max_queued=queue_size)
+        writer.start()
+        _writer = writer
+        structlog.configure(
+            # The bare event dict reaches _QueueLogger.msg; rendering happens in the writer.
+            processors=[*processors, lambda _, __, event_dict: ((event_dict,), {})],
+            logger_factory=lambda *_: _QueueLogger(writer),
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            cache_logger_on_first_use=True,
+        )
+        handler = _QueueHandler(writer)
+    else:
+        structlog.configure(
+            processors=[*processors, structlog.processors.JSONRenderer()],
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
+        handler = logging.StreamHandler(sys.stdout)
+
+    logging.basicConfig(level=level, format="%(message)s", handlers=[handler], force=True)
+
+
+def shutdown_logging() -> None:
+    """Write out the events still queued and stop the log writer thread, if any."""
+    global _writer
+
+    writer = _writer
+    if writer is None:
+        return
+    _writer = None
+    writer.stop()
+
+
+atexit.register(shutdown_logging)
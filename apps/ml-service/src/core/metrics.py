@@ -0,0 +1,335 @@
+"""In-process counters and histograms rendered in the Prometheus text format.
+
+Each labelled series is created once and cached, so recording a value costs a
+dict lookup, a bisect over the bucket bounds and an uncontended lock: about a
+microsecond. Series are process-local; with several uvicorn workers each one
+exposes its own numbers, as with any per-process Prometheus client.
+
+Inference code reads the route label from :data:`CURRENT_ROUTE`, which the
+instrumented API routes set for the duration of a request (thread-pool calls
+inherit it). Work done outside a request, such as micro-batches, shadow
+scoring and registry polling, is labelled ``background``.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from tens of microseconds (single compiled predictions) to minutes (training).
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)  # fmt: skip
+
+CURRENT_ROUTE: ContextVar[str] = ContextVar("current_route", default="background")
+# perf_counter() when the current request reached the instrumented route.
+REQUEST_STARTED: ContextVar[float | None] = ContextVar("request_started", default=None)
+
+
+class _CounterSeries:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeSeries:
+    __slots__ = ("_function", "value")
+
+    def __init__(self) -> None:
+        self._function: Callable[[], float] | None = None
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from ``function`` at scrape time instead."""
+        self._function = function
+
+    def current(self) -> float:
+        function = self._function
+        return function() if function is not None else self.value
+
+
+class _HistogramSeries:
+    __slots__ = ("_bounds", "_lock", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        # One slot per bucket plus +Inf; made cumulative only when rendered.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, ...], object] = {}
+
+    def _get(self, values: tuple[str, ...]) -> object:
+        series = self._series.get(values)
+        if series is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                series = self._series.setdefault(values, self._new_series())
+        return series
+
+    def _new_series(self) -> object:
+        raise NotImplementedError
+
+    def _label_text(self, values: tuple[str, ...], extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"'
+            for name, value in zip(self.labelnames, values, strict=True)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._series.items())
+        for values, series in items:
+            lines.extend(self._render_series(values, series))
+        return lines
+
+    def _render_series(self, values: tuple[str, ...], series: object) -> list[str]:
+        raise NotImplementedError
+
+
+_MetricT = TypeVar("_MetricT", bound=_Metric)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def labels(self, *values: str) -> _CounterSeries:
+        series: _CounterSeries = self._get(values)  # type: ignore[assignment]
+        return series
+
+    def _new_series(self) -> _CounterSeries:
+        return _CounterSeries()
+
+    def _render_series(self, values: tuple[str, ...], series: object) -> list[str]:
+        assert isinstance(series, _CounterSeries)
+        return [f"{self.name}_total{self._label_text(values)} {_number(series.value)}"]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def labels(self, *values: str) -> _GaugeSeries:
+        series: _GaugeSeries = self._get(values)  # type: ignore[assignment]
+        return series
+
+    def _new_series(self) -> _GaugeSeries:
+        return _GaugeSeries()
+
+    def _render_series(self, values: tuple[str, ...], series: object) -> list[str]:
+        assert isinstance(series, _GaugeSeries)
+        return [f"{self.name}{self._label_text(values)} {_number(series.current())}"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def labels(self, *values: str) -> _HistogramSeries:
+        series: _HistogramSeries = self._get(values)  # type: ignore[assignment]
+        return series
+
+    def _new_series(self) -> _HistogramSeries:
+        return _HistogramSeries(self.buckets)
+
+    def _render_series(self, values: tuple[str, ...], series: object) -> list[str]:
+        assert isinstance(series, _HistogramSeries)
+        with series._lock:
+            counts, total = list(series.counts), series.sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+            cumulative += count
+            le = f'le="{_number(bound)}"'
+            lines.append(f"{self.name}_bucket{self._label_text(values, le)} {cumulative}")
+        lines.append(f"{self.name}_sum{self._label_text(values)} {_number(total)}")
+        lines.append(f"{self.name}_count{self._label_text(values)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _MetricT) -> _MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Time from route entry until the response (headers, for streams) is ready.",
+    ("route", "method", "status"),
+)
+INFERENCE_STAGE_SECONDS = REGISTRY.histogram(
+    "inference_stage_duration_seconds",
+    "Time spent per inference stage: request_validation, input_checks, dataframe, "
+    "predict_proba, logging.",
+    ("stage", "model_version", "route"),
+)
+PREDICTIONS = REGISTRY.counter(
+    "predictions",
+    "Rows scored, by the model version that scored them.",
+    ("model_version", "route"),
+)
+PREDICTION_ROW_ERRORS = REGISTRY.counter(
+    "prediction_row_errors",
+    "Rows rejected by input checks (wrong feature count, non-finite values).",
+    ("model_version", "route"),
+)
+MODEL_LIFECYCLE_SECONDS = REGISTRY.histogram(
+    "model_lifecycle_duration_seconds",
+    "Duration of model loading and training steps.",
+    ("step",),
+)
+MODEL_LIFECYCLE_FAILURES = REGISTRY.counter(
+    "model_lifecycle_failures",
+    "Model loading and training steps that raised.",
+    ("step",),
+)
+TRAINING_JOB_SECONDS = REGISTRY.histogram(
+    "training_job_duration_seconds",
+    "Wall time of background training jobs, from start to completion.",
+    ("status",),
+)
+
+
+def observe_stage(stage: str, model_version: str, started: float) -> float:
+    """Record ``stage`` as having run from ``started`` until now; returns now."""
+    now = time.perf_counter()
+    INFERENCE_STAGE_SECONDS.labels(stage, model_version, CURRENT_ROUTE.get()).observe(now - started)
+    return now
+
+
+def observe_request_validation(model_version: str) -> None:
+    """Record the time from route entry until now as the request_validation stage.
+
+    Called first thing in an endpoint, this covers receiving the body and the
+    parsing, validation and dependency resolution FastAPI does beforehand.
+    """
+    started = REQUEST_STARTED.get()
+    if started is not None:
+        observe_stage("request_validation", model_version, started)
+
+
+def count_predictions(model_version: str, scored: int, failed: int = 0) -> None:
+    route = CURRENT_ROUTE.get()
+    if scored:
+        PREDICTIONS.labels(model_version, route).inc(scored)
+    if failed:
+        PREDICTION_ROW_ERRORS.labels(model_version, route).inc(failed)
+
+
+@contextmanager
+def time_lifecycle_step(step: str) -> Iterator[None]:
+    """Record the duration of ``step``, and count it as failed if it raises.
+
+    Usable as a decorator, e.g. ``@time_lifecycle_step("download")``.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        MODEL_LIFECYCLE_FAILURES.labels(step).inc()
+        raise
+    finally:
+        MODEL_LIFECYCLE_SECONDS.labels(step).observe(time.perf_counter() - started)
+
+
+# ------------------------------------------------------------------
+# Internal helpers
+# ------------------------------------------------------------------
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
@@ -1,13 +1,95 @@
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import structlog
 from fastapi import FastAPI
 
 from .api.router import api_router
 from .core.config import get_settings
 from .core.logging import configure_logging
+from .models.batcher import MicroBatcher
+from .models.executor import InferenceExecutor
+from .models.registry import LoadedModel, ModelRepository
+from .models.shadow import ShadowScorer
+from .services.jobs import TrainingJobManager
 
 settings = get_settings()
-configure_logging(settings.log_level)
+configure_logging(
+    settings.log_level,
+    mode=settings.log_mode,
+    queue_size=settings.log_queue_size,
+    prediction_sample_rate=settings.log_prediction_sample_rate,
+)
+logger = structlog.get_logger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    started = time.perf_counter()
+    repository = ModelRepository(settings=settings)
+    repository.start_polling(settings.model_refresh_interval_seconds)
+    app.state.model_repository = repository
+
+    shadow_scorer: ShadowScorer | None = None
+    if settings.shadow_scoring_enabled:
+        shadow_scorer = ShadowScorer(
+            repository,
+            stage=settings.shadow_model_stage,
+            max_queued=settings.shadow_queue_size,
+            max_queued_bytes=int(settings.shadow_queue_max_mb * 1024**2),
+        )
+        shadow_scorer.start()
+        repository.set_shadow_scorer(shadow_scorer)
+
+    inference_executor = InferenceExecutor(
+        workers=settings.inference_workers,
+        max_in_flight=settings.inference_max_in_flight,
+        max_queue_ms=settings.inference_max_queue_ms,
+    )
+    app.state.inference_executor = inference_executor
+    app.state.json_codec = settings.inference_json_codec
+
+    micro_batcher: MicroBatcher | None = None
+    if settings.micro_batching_enabled:
+        micro_batcher = MicroBatcher(
+            repository,
+            max_batch_size=settings.micro_batching_max_batch_size,
+            max_wait_ms=settings.micro_batching_max_wait_ms,
+            max_queue_size=settings.micro_batching_max_queue_size,
+        )
+        micro_batcher.start()
+    app.state.micro_batcher = micro_batcher
+
+    training_jobs = TrainingJobManager(
+        settings, on_success=lambda info: repository.activate(LoadedModel.from_training(info))
+    )
+    app.state.training_jobs = training_jobs
+
+    app.state.startup_seconds = time.perf_counter() - started
+    active = repository.active
+    logger.info(
+        "service.started",
+        startup_mode=settings.model_startup_mode,
+        startup_seconds=round(app.state.startup_seconds, 3),
+        model_version=active.model_version if active else None,
+        model_source=active.source if active else None,
+    )
+
+    try:
+        yield
+    finally:
+        training_jobs.shutdown()
+        if micro_batcher is not None:
+            micro_batcher.stop()
+        inference_executor.shutdown()
+        if shadow_scorer is not None:
+            repository.set_shadow_scorer(None)
+            shadow_scorer.stop()
+        repository.stop_polling()
+
 
-app = FastAPI(title=settings.api_title, version=settings.api_version)
+app = FastAPI(title=settings.api_title, version=settings.api_version, lifespan=lifespan)
 app.include_router(api_router)
 
 
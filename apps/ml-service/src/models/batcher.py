@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import structlog
+
+from ..core.metrics import CURRENT_ROUTE
+from .executor import INFERENCE_REJECTIONS, TooManyInFlightError
+from .registry import ModelRepository, PredictionResult
+
+logger = structlog.get_logger(__name__)
+
+
+class MicroBatchQueueFullError(TooManyInFlightError):
+    """Raised when ``max_queue_size`` predictions are already waiting for a batch."""
+
+
+@dataclass(frozen=True)
+class MicroBatchStats:
+    batches: int
+    items: int
+    mean_batch_size: float
+    max_batch_size: int
+    # Upper bucket bound (powers of two up to the configured maximum) -> number of batches
+    batch_size_histogram: dict[int, int]
+
+
+@dataclass
+class _PendingPrediction:
+    features: Sequence[float]
+    future: Future[PredictionResult]
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-row predictions into vectorized model calls.
+
+    Callers enqueue a feature vector and receive a future. A worker thread waits
+    up to ``max_wait_ms`` after the first queued request (or until
+    ``max_batch_size`` requests are queued), scores them with one
+    :meth:`ModelRepository.predict_batch` call and resolves each future. At
+    most ``max_queue_size`` predictions wait at once; further submissions fail
+    with :class:`MicroBatchQueueFullError`.
+    """
+
+    def __init__(
+        self,
+        repository: ModelRepository,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_size: int = 1024,
+    ) -> None:
+        self._repository = repository
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: queue.Queue[_PendingPrediction] = queue.Queue(maxsize=max(1, max_queue_size))
+        self._stop = threading.Event()
+        # Guards ``_worker`` so that no submit can enqueue after stop() drains.
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._stats_lock = threading.Lock()
+        self._histogram: Counter[int] = Counter()
+        self._batches = 0
+        self._items = 0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._worker is not None:
+                return
+
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+            self._worker.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            worker = self._worker
+            if worker is None:
+                return
+            self._worker = None
+            self._stop.set()
+
+        worker.join()
+        self._drain()
+
+    def submit(self, features: Sequence[float]) -> Future[PredictionResult]:
+        future: Future[PredictionResult] = Future()
+        error: Exception
+        with self._lock:
+            if self._worker is None:
+                error = RuntimeError("Micro-batcher is not running")
+            else:
+                try:
+                    self._queue.put_nowait(_PendingPrediction(features=features, future=future))
+                    return future
+                except queue.Full:
+                    error = MicroBatchQueueFullError(
+                        f"{self._queue.maxsize} predictions are already waiting for a micro-batch"
+                    )
+                    INFERENCE_REJECTIONS.labels("queue_full", CURRENT_ROUTE.get()).inc()
+
+        future.set_exception(error)
+        return future
+
+    def stats(self) -> MicroBatchStats:
+        with self._stats_lock:
+            buckets = {bound: self._histogram.get(bound, 0) for bound in self._bucket_bounds()}
+            return MicroBatchStats(
+                batches=self._batches,
+                items=self._items,
+                mean_batch_size=self._items / self._batches if self._batches else 0.0,
+                max_batch_size=self._max_batch_size,
+                batch_size_histogram=buckets,
+            )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+
+            self._score(batch)
+
+    def _score(self, batch: list[_PendingPrediction]) -> None:
+        try:
+            outcomes = self._repository.predict_batch([pending.features for pending in batch])
+        except Exception as exc:  # noqa: BLE001
+            for pending in batch:
+                pending.future.set_exception(exc)
+            return
+        finally:
+            self._record(len(batch))
+
+        for pending, outcome in zip(batch, outcomes, strict=True):
+            if outcome.prediction is not None:
+                pending.future.set_result(outcome.prediction)
+            else:
+                pending.future.set_exception(ValueError(outcome.error))
+
+    def _record(self, size: int) -> None:
+        bound = 1
+        while bound < size:
+            bound *= 2
+
+        with self._stats_lock:
+            self._histogram[min(bound, self._max_batch_size)] += 1
+            self._batches += 1
+            self._items += size
+
+    def _bucket_bounds(self) -> list[int]:
+        bounds = []
+        bound = 1
+        while bound < self._max_batch_size:
+            bounds.append(bound)
+            bound *= 2
+        bounds.append(self._max_batch_size)
+        return bounds
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            pending.future.set_exception(RuntimeError("Micro-batcher stopped"))
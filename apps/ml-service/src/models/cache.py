@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PredictionCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+
+
+class PredictionCache:
+    """Thread-safe LRU cache of probabilities with a per-entry TTL.
+
+    Keys are a 16-byte digest of the model version and the raw feature bytes,
+    and values are a probability plus an expiry time, so every entry has the
+    same small footprint and ``max_entries`` bounds the cache's memory.
+    Every :meth:`clear` starts a new generation; writers pass the generation
+    they read before scoring so that results computed across a clear are
+    dropped rather than cached.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @staticmethod
+    def keys(model_version: str, matrix: np.ndarray) -> list[bytes]:
+        """Return one cache key per row of ``matrix`` for ``model_version``."""
+        prefix = model_version.encode() + b"\0"
+        rows = np.ascontiguousarray(matrix, dtype=np.float64)
+        return [hashlib.blake2b(prefix + row.tobytes(), digest_size=16).digest() for row in rows]
+
+    def get_many(self, keys: list[bytes]) -> list[float | None]:
+        now = time.monotonic()
+        values: list[float | None] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._misses += 1
+                    values.append(None)
+                elif entry[1] <= now:
+                    del self._entries[key]
+                    self._expirations += 1
+                    self._misses += 1
+                    values.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    values.append(entry[0])
+        return values
+
+    def put_many(
+        self, keys: list[bytes], values: np.ndarray, generation: int | None = None
+    ) -> None:
+        expires_at = time.monotonic() + self._ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            for key, value in zip(keys, values.tolist(), strict=True):
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+
+            overflow = len(self._entries) - self._max_entries
+            for _ in range(max(0, overflow)):
+                self._entries.popitem(last=False)
+            self._evictions += max(0, overflow)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> PredictionCacheStats:
+        with self._lock:
+            return PredictionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_entries=self._max_entries,
+            )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CompiledGradientBoosting:
+    """Flattened, scaler-folded form of a ``StandardScaler`` + GBM pipeline.
+
+    All trees share contiguous node arrays indexed from ``roots``. Leaves point
+    to themselves so every sample can be advanced ``max_depth`` times in
+    lockstep, and leaf values already include the learning rate.
+    """
+
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    max_depth: int
+    init_raw: float
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Any) -> CompiledGradientBoosting:
+        """Compile a fitted pipeline from ``trainer._build_pipeline``.
+
+        Raises:
+            ValueError: If the pipeline is not an optional ``StandardScaler``
+                followed by a binary ``GradientBoostingClassifier``.
+        """
+        from sklearn.ensemble import GradientBoostingClassifier  # type: ignore[import-untyped]
+        from sklearn.pipeline import Pipeline  # type: ignore[import-untyped]
+        from sklearn.preprocessing import StandardScaler  # type: ignore[import-untyped]
+
+        steps = (
+            [step for _, step in pipeline.steps] if isinstance(pipeline, Pipeline) else [pipeline]
+        )
+        scaler = steps[0] if len(steps) == 2 else None
+        classifier = steps[-1]
+
+        if len(steps) > 2 or (scaler is not None and not isinstance(scaler, StandardScaler)):
+            raise ValueError("Only StandardScaler preprocessing can be compiled")
+        if not isinstance(classifier, GradientBoostingClassifier):
+            raise ValueError("Only GradientBoostingClassifier models can be compiled")
+        if classifier.estimators_.shape[1] != 1:
+            raise ValueError("Only binary classifiers can be compiled")
+
+        n_features = int(classifier.n_features_in_)
+        mean = np.zeros(n_features)
+        scale = np.ones(n_features)
+        if scaler is not None:
+            if scaler.mean_ is not None:
+                mean = np.asarray(scaler.mean_, dtype=np.float64)
+            if scaler.scale_ is not None:
+                scale = np.asarray(scaler.scale_, dtype=np.float64)
+
+        trees = [estimator.tree_ for estimator in classifier.estimators_[:, 0]]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees])
+        learning_rate = float(classifier.learning_rate)
+
+        feature = np.concatenate([tree.feature for tree in trees]).astype(np.intp)
+        threshold = np.concatenate([tree.threshold for tree in trees]).astype(np.float64)
+        left = np.concatenate(
+            [tree.children_left + offset for tree, offset in zip(trees, offsets, strict=False)]
+        ).astype(np.intp)
+        right = np.concatenate(
+            [tree.children_right + offset for tree, offset in zip(trees, offsets, strict=False)]
+        ).astype(np.intp)
+        value = np.concatenate([tree.value[:, 0, 0] for tree in trees]) * learning_rate
+
+        # sklearn marks leaves with child index -1; redirect them to themselves.
+        is_leaf = np.concatenate([tree.children_left == -1 for tree in trees])
+        node_ids = np.arange(len(feature), dtype=np.intp)
+        left[is_leaf] = node_ids[is_leaf]
+        right[is_leaf] = node_ids[is_leaf]
+        feature[is_leaf] = 0
+        threshold[is_leaf] = 0.0
+
+        split = ~is_leaf
+        threshold[split] = _fold_thresholds(
+            threshold[split], mean[feature[split]], scale[feature[split]]
+        )
+
+        probe = np.zeros((1, n_features))
+        init_raw = float(
+            classifier.decision_function(probe)[0]
+            - sum(tree.predict(probe)[0] for tree in classifier.estimators_[:, 0]) * learning_rate
+        )
+
+        return cls(
+            feature=feature,
+            threshold=threshold,
+            left=left,
+            right=right,
+            value=value,
+            roots=offsets[:-1].astype(np.intp),
+            max_depth=max(int(tree.max_depth) for tree in trees),
+            init_raw=init_raw,
+        )
+
+    def predict_proba(self, matrix: np.ndarray) -> np.ndarray:
+        """Return the positive-class probability for each row of ``matrix``."""
+        matrix = np.asarray(matrix, dtype=np.float64)
+        rows = np.arange(matrix.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (matrix.shape[0], len(self.roots)))
+
+        for _ in range(self.max_depth):
+            go_left = matrix[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        raw = self.init_raw + self.value[nodes].sum(axis=1)
+        probabilities: np.ndarray = 1.0 / (1.0 + np.exp(-raw))
+        return probabilities
+
+
+def _fold_thresholds(threshold: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Map scaled-space split thresholds to raw feature space.
+
+    sklearn trees compare ``float32((x - mean) / scale) <= threshold``, and
+    thresholds frequently sit within float32 rounding of training values, so the
+    algebraic fold ``threshold * scale + mean`` flips a few decisions. Instead,
+    bisect for the largest raw value that still goes left; the predicate is
+    monotone in ``x`` because ``scale`` is positive.
+    """
+
+    def goes_left(x: np.ndarray) -> np.ndarray:
+        result: np.ndarray = ((x - mean) / scale).astype(np.float32) <= threshold
+        return result
+
+    guess = threshold * scale + mean
+    width = 8 * float(np.finfo(np.float32).eps) * (np.abs(threshold) + 1.0) * scale
+    low, high = guess - width, guess + width
+    while not (goes_left(low).all() and not goes_left(high).any()):
+        width *= 2
+        low, high = guess - width, guess + width
+
+    # Each halving gains one bit; float64 has 52, so this reaches adjacent values.
+    for _ in range(64):
+        middle = (low + high) / 2
+        left = goes_left(middle)
+        low = np.where(left, middle, low)
+        high = np.where(left, high, middle)
+
+    boundaries: np.ndarray = low
+    return boundaries
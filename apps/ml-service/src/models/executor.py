@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from ..core.metrics import CURRENT_ROUTE, REGISTRY
+
+_T = TypeVar("_T")
+
+INFERENCE_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "inference_queue_wait_seconds",
+    "Time admitted inference requests waited for an executor thread.",
+    ("route",),
+)
+INFERENCE_REJECTIONS = REGISTRY.counter(
+    "inference_rejections",
+    "Inference requests shed by admission control: in_flight or queue_full (429), "
+    "queue_timeout (503).",
+    ("reason", "route"),
+)
+INFERENCE_IN_FLIGHT = REGISTRY.gauge(
+    "inference_in_flight", "Inference requests admitted and not yet finished."
+)
+INFERENCE_QUEUE_DEPTH = REGISTRY.gauge(
+    "inference_queue_depth", "Admitted inference requests waiting for an executor thread."
+)
+
+
+class InferenceOverloadedError(RuntimeError):
+    """Raised when admission control sheds an inference request."""
+
+
+class TooManyInFlightError(InferenceOverloadedError):
+    """Raised when the maximum number of in-flight requests is already admitted."""
+
+
+class QueueDeadlineExceededError(InferenceOverloadedError):
+    """Raised when an admitted request waited too long for a free thread."""
+
+
+@dataclass(frozen=True)
+class InferenceExecutorStats:
+    workers: int
+    max_in_flight: int
+    max_queue_ms: float
+    in_flight: int
+    # Admitted requests not running on a worker thread, including micro-batched ones
+    queued: int
+    running: int
+    completed: int
+    rejected_in_flight: int
+    rejected_queue_timeout: int
+
+
+class InferenceExecutor:
+    """Dedicated scoring threads with admission control.
+
+    At most ``max_in_flight`` calls are admitted at once, queued or running;
+    :meth:`run` rejects further calls immediately. An admitted call still
+    waiting for one of the ``workers`` threads after ``max_queue_ms`` is
+    cancelled and rejected, rather than run for a client that has likely
+    given up. Either way the caller gets an :class:`InferenceOverloadedError`
+    instead of an ever-growing latency. Work scored elsewhere, such as by the
+    micro-batcher, takes an in-flight slot with :meth:`admit`.
+    """
+
+    def __init__(self, workers: int, max_in_flight: int, max_queue_ms: float) -> None:
+        self._workers = workers or os.cpu_count() or 1
+        self._max_in_flight = max(1, max_in_flight)
+        self._max_queue_ms = max_queue_ms
+        self._max_queue_wait = max_queue_ms / 1000
+        self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="inference")
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected_in_flight = 0
+        self._rejected_queue_timeout = 0
+
+        INFERENCE_IN_FLIGHT.labels().set_function(lambda: self._in_flight)
+        INFERENCE_QUEUE_DEPTH.labels().set_function(lambda: self._in_flight - self._running)
+
+    async def run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run ``fn(*args)`` on an executor thread, if admitted, and await its result."""
+        self._acquire()
+        # Copied so metrics recorded by ``fn`` keep the request's route label.
+        context = contextvars.copy_context()
+        try:
+            future = self._pool.submit(context.run, self._call, time.perf_counter(), fn, *args)
+        except RuntimeError:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        expired = False
+
+        def expire() -> None:
+            # Only succeeds while the call is still queued.
+            nonlocal expired
+            expired = future.cancel()
+
+        expiry = asyncio.get_running_loop().call_later(self._max_queue_wait, expire)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not expired:
+                raise
+            raise self._queue_timeout(self._max_queue_wait) from None
+        finally:
+            expiry.cancel()
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """Hold an in-flight slot while a request is scored outside the executor."""
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> InferenceExecutorStats:
+        with self._stats_lock:
+            return InferenceExecutorStats(
+                workers=self._workers,
+                max_in_flight=self._max_in_flight,
+                max_queue_ms=self._max_queue_ms,
+                in_flight=self._in_flight,
+                queued=self._in_flight - self._running,
+                running=self._running,
+                completed=self._completed,
+                rejected_in_flight=self._rejected_in_flight,
+                rejected_queue_timeout=self._rejected_queue_timeout,
+            )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _acquire(self) -> None:
+        with self._stats_lock:
+            if self._in_flight >= self._max_in_flight:
+                self._rejected_in_flight += 1
+                rejected = True
+            else:
+                self._in_flight += 1
+                rejected = False
+        if rejected:
+            INFERENCE_REJECTIONS.labels("in_flight", CURRENT_ROUTE.get()).inc()
+            raise TooManyInFlightError(
+                f"{self._max_in_flight} inference requests are already in flight"
+            )
+
+    def _call(self, enqueued: float, fn: Callable[..., _T], *args: Any) -> _T:
+        waited = time.perf_counter() - enqueued
+        INFERENCE_QUEUE_WAIT_SECONDS.labels(CURRENT_ROUTE.get()).observe(waited)
+        # The loop cancels calls still queued at the deadline; this catches
+        # the ones a worker picked up just before that timer ran.
+        if waited > self._max_queue_wait:
+            raise self._queue_timeout(waited)
+
+        with self._stats_lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._stats_lock:
+                self._running -= 1
+                self._completed += 1
+
+    def _queue_timeout(self, waited: float) -> QueueDeadlineExceededError:
+        with self._stats_lock:
+            self._rejected_queue_timeout += 1
+        INFERENCE_REJECTIONS.labels("queue_timeout", CURRENT_ROUTE.get()).inc()
+        return QueueDeadlineExceededError(
+            f"Request waited {waited * 1000:.0f} ms for an inference thread"
+        )
+
+    def _release(self, _: Future[Any] | None = None) -> None:
+        with self._stats_lock:
+            self._in_flight -= 1
@@ -0,0 +1,211 @@
+"""The local on-disk copy of the most recently trained or loaded model.
+
+It is a joblib payload holding the fitted pipeline and its feature names, plus
+a ``feature_names.json`` sidecar that is only read for payloads without
+embedded names. When the copy came from the registry, the
+payload also records the registry version and run it was loaded from, so a
+service that starts from the local copy can later confirm it against the
+registry without downloading the model again.
+
+Models that :class:`CompiledGradientBoosting` supports are also written in a
+flat format next to the joblib file (same name, ``.flat`` suffix): a small JSON
+header followed by the compiled tree arrays, with the scaler already folded
+into the split thresholds. Loading maps the file read-only instead of
+unpickling it, so every worker process on a host shares one copy of the
+arrays through the page cache, and scikit-learn is never imported. Loaders
+that score with the compiled evaluator prefer the flat file when it exists.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+
+from .compiled import CompiledGradientBoosting
+
+logger = structlog.get_logger(__name__)
+
+FEATURE_NAMES_ARTIFACT = "feature_names.json"
+FLAT_ARTIFACT_SUFFIX = ".flat"
+FLAT_FORMAT_MAGIC = b"BTFLAT01"
+# Array offsets are aligned so every mapped array starts on a cache line.
+_FLAT_ALIGNMENT = 64
+_FLAT_ARRAYS = {
+    "feature": np.int64,
+    "threshold": np.float64,
+    "left": np.int64,
+    "right": np.int64,
+    "value": np.float64,
+    "roots": np.int64,
+}
+
+
+@dataclass(frozen=True)
+class LocalArtifact:
+    # None when the artifact was read from the flat file.
+    model: Any
+    feature_names: list[str]
+    # Registry provenance; None for models written before they were registered.
+    model_version: str | None = None
+    run_id: str | None = None
+    compiled: CompiledGradientBoosting | None = None
+
+
+def flat_artifact_path(path: str | Path) -> Path:
+    return Path(path).with_suffix(FLAT_ARTIFACT_SUFFIX)
+
+
+def save_local_artifact(path: str | Path, artifact: LocalArtifact) -> None:
+    """Write the joblib payload, the feature names and, if possible, the flat file.
+
+    Each file is replaced atomically, but the set is not: a reader can find a
+    new payload without its flat file, or next to an older sidecar. The payload
+    and the flat file therefore each carry their own feature names, which the
+    loader trusts over the sidecar. Workers that already mapped the previous
+    flat file keep reading it until they load again.
+    """
+    import joblib  # type: ignore[import-untyped]
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    flat_path = flat_artifact_path(path)
+    # Never leave a flat file from the previous model next to the new payload.
+    flat_path.unlink(missing_ok=True)
+
+    _replace(
+        path.parent / FEATURE_NAMES_ARTIFACT,
+        lambda target: target.write_text(json.dumps(artifact.feature_names)),
+    )
+    payload: dict[str, Any] = {"model": artifact.model, "feature_names": artifact.feature_names}
+    if artifact.model_version is not None:
+        payload.update(model_version=artifact.model_version, run_id=artifact.run_id)
+    _replace(path, lambda target: joblib.dump(payload, target))
+
+    compiled = artifact.compiled
+    if compiled is None:
+        try:
+            compiled = CompiledGradientBoosting.from_pipeline(artifact.model)
+        except ValueError:
+            return
+    _replace(flat_path, lambda target: _write_flat(target, compiled, artifact))
+
+
+def load_local_artifact(path: str | Path, prefer_flat: bool = False) -> LocalArtifact | None:
+    """Read the artifact at ``path``, or return None when there is none.
+
+    With ``prefer_flat``, a flat file next to ``path`` is mapped instead of
+    unpickling the joblib payload; the result then has ``compiled`` but no
+    ``model``.
+    """
+    path = Path(path)
+    flat_path = flat_artifact_path(path)
+    if prefer_flat and flat_path.exists():
+        try:
+            return _read_flat(flat_path)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("model.flat_artifact_unreadable", path=str(flat_path), error=str(exc))
+
+    if not path.exists():
+        return None
+
+    import joblib  # type: ignore[import-untyped]
+
+    payload: dict[str, Any] = joblib.load(path)
+    feature_names = payload.get("feature_names")
+    if feature_names is None:
+        # Only payloads that do not embed their names fall back to the sidecar,
+        # which may belong to a model written since.
+        feature_names = json.loads((path.parent / FEATURE_NAMES_ARTIFACT).read_text())
+
+    return LocalArtifact(
+        model=payload["model"],
+        feature_names=list(feature_names),
+        model_version=payload.get("model_version"),
+        run_id=payload.get("run_id"),
+    )
+
+
+# ------------------------------------------------------------------
+# Internal helpers
+# ------------------------------------------------------------------
+
+
+def _replace(path: Path, write: Callable[[Path], object]) -> None:
+    staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        write(staging)
+        os.replace(staging, path)
+    finally:
+        staging.unlink(missing_ok=True)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _FLAT_ALIGNMENT) * _FLAT_ALIGNMENT
+
+
+def _write_flat(path: Path, compiled: CompiledGradientBoosting, artifact: LocalArtifact) -> None:
+    """Layout: magic, header length (uint64 LE), JSON header, aligned arrays."""
+    arrays = {
+        name: np.ascontiguousarray(getattr(compiled, name), dtype=dtype)
+        for name, dtype in _FLAT_ARRAYS.items()
+    }
+    specs: dict[str, dict[str, Any]] = {}
+    offset = 0
+    for name, array in arrays.items():
+        specs[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps(
+        {
+            "feature_names": artifact.feature_names,
+            "model_version": artifact.model_version,
+            "run_id": artifact.run_id,
+            "max_depth": compiled.max_depth,
+            "init_raw": compiled.init_raw,
+            "arrays": specs,
+        }
+    ).encode()
+    data_start = _align(len(FLAT_FORMAT_MAGIC) + 8 + len(header))
+
+    with path.open("wb") as handle:
+        handle.write(FLAT_FORMAT_MAGIC + len(header).to_bytes(8, "little") + header)
+        for name, array in arrays.items():
+            handle.seek(data_start + specs[name]["offset"])
+            handle.write(array.tobytes())
+
+
+def _read_flat(path: Path) -> LocalArtifact:
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    prefix = len(FLAT_FORMAT_MAGIC)
+    if bytes(buffer[:prefix]) != FLAT_FORMAT_MAGIC:
+        raise ValueError("Not a flat model artifact")
+    header_length = int.from_bytes(bytes(buffer[prefix : prefix + 8]), "little")
+    header = json.loads(bytes(buffer[prefix + 8 : prefix + 8 + header_length]))
+    data_start = _align(prefix + 8 + header_length)
+
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        # Read-only views into the mapping: no copy, shared across processes.
+        arrays[name] = np.frombuffer(
+            buffer, dtype=dtype, count=count, offset=data_start + spec["offset"]
+        ).reshape(spec["shape"])
+
+    compiled = CompiledGradientBoosting(
+        **arrays, max_depth=int(header["max_depth"]), init_raw=float(header["init_raw"])
+    )
+    return LocalArtifact(
+        model=None,
+        feature_names=list(header["feature_names"]),
+        model_version=header["model_version"],
+        run_id=header["run_id"],
+        compiled=compiled,
+    )
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .registry import LoadedModel
+
+# (registered model name, version)
+ModelKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class LoadedModelCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    bytes: int
+    max_bytes: int
+    # "name:version" of the cached models, least recently used first
+    models: list[str]
+
+
+def estimate_model_bytes(model: LoadedModel) -> int:
+    """Approximate memory held by ``model``: its pickled pipeline plus compiled arrays."""
+    size = 0
+    if model.pipeline is not None:
+        size += len(pickle.dumps(model.pipeline, protocol=pickle.HIGHEST_PROTOCOL))
+    compiled = model.compiled
+    if compiled is not None:
+        size += sum(
+            array.nbytes
+            for array in (
+                compiled.feature,
+                compiled.threshold,
+                compiled.left,
+                compiled.right,
+                compiled.value,
+                compiled.roots,
+            )
+        )
+    return size
+
+
+class LoadedModelCache:
+    """Thread-safe LRU of loaded model snapshots bounded by their estimated size.
+
+    A model larger than the whole budget is not cached at all; callers still
+    serve it, but load it again on the next request.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max(1, max_bytes)
+        self._entries: OrderedDict[ModelKey, tuple[LoadedModel, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: ModelKey) -> LoadedModel | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: ModelKey, model: LoadedModel, size: int) -> None:
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            while self._entries and self._bytes + size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+            self._entries[key] = (model, size)
+            self._bytes += size
+
+    def stats(self) -> LoadedModelCacheStats:
+        with self._lock:
+            return LoadedModelCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self._max_bytes,
+                models=[f"{name}:{version}" for name, version in self._entries],
+            )
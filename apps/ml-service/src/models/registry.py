@@ -1,23 +1,60 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Any
-
-import joblib  # type: ignore[import-untyped]
-import mlflow
-import mlflow.sklearn
-import pandas as pd
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+import numpy as np
 import structlog
-from mlflow import artifacts
-from mlflow.tracking import MlflowClient
 
 from ..core.config import Settings
-from ..services.trainer import FEATURE_NAMES_ARTIFACT, train_and_register_model
+from ..core.metrics import (
+    MODEL_LIFECYCLE_FAILURES,
+    count_predictions,
+    observe_stage,
+    time_lifecycle_step,
+)
+from .cache import PredictionCache
+from .compiled import CompiledGradientBoosting
+from .local_artifact import (
+    FEATURE_NAMES_ARTIFACT,
+    LocalArtifact,
+    load_local_artifact,
+    save_local_artifact,
+)
+from .model_cache import LoadedModelCache, ModelKey, estimate_model_bytes
+
+# MLflow, pandas and the trainer (scikit-learn) take seconds to import, so they
+# are imported where first needed rather than on the service's import path.
+if TYPE_CHECKING:
+    from mlflow.entities.model_registry import ModelVersion
+    from mlflow.tracking import MlflowClient
+
+    from ..services.trainer import TrainedModelInfo
+    from .shadow import ShadowScorer
 
 logger = structlog.get_logger(__name__)
 
+REGISTRY_STAGES = ("Production", "Staging")
+
+_T = TypeVar("_T")
+
+# Where the active snapshot came from. A "local_artifact" model has not (yet)
+# been confirmed to be the registry's current version and may be stale.
+ModelSource = Literal["registry", "local_artifact", "training"]
+RegistrySyncState = Literal["pending", "synced", "failed"]
+
+
+class ModelUnavailableError(ValueError):
+    """Raised when a prediction is requested before any model is loaded."""
+
+
+class ModelNotFoundError(LookupError):
+    """Raised when a requested model name, version or stage is not registered."""
+
 
 @dataclass(frozen=True)
 class PredictionResult:
@@ -26,127 +63,718 @@ class PredictionResult:
     run_id: str | None
 
 
+@dataclass(frozen=True)
+class BatchItemResult:
+    """Outcome for one row of :meth:`ModelRepository.predict_batch`."""
+
+    prediction: PredictionResult | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class MatrixPrediction:
+    """Outcome of :meth:`ModelRepository.predict_matrix`."""
+
+    # One per row; NaN for the rows in ``errors``.
+    probabilities: np.ndarray
+    errors: dict[int, str]
+    model_version: str
+    run_id: str | None
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """Immutable snapshot of the model currently used for inference.
+
+    The repository swaps whole snapshots so a request never observes a pipeline
+    paired with the feature names or version of another model.
+    """
+
+    # None for models mapped from the flat artifact, which only carry ``compiled``.
+    pipeline: Any
+    feature_names: list[str]
+    model_version: str
+    run_id: str | None
+    compiled: CompiledGradientBoosting | None = None
+    source: ModelSource = "registry"
+
+    @classmethod
+    def from_training(cls, info: TrainedModelInfo) -> LoadedModel:
+        return cls(
+            pipeline=info.pipeline,
+            feature_names=list(info.feature_names),
+            model_version=info.model_version,
+            run_id=info.run_id,
+            source="training",
+        )
+
+
 class ModelRepository:
+    """Process-wide holder of the active model.
+
+    A single instance is created at application startup. Requests only read the
+    current :class:`LoadedModel` snapshot; loading happens at construction time,
+    in :meth:`refresh` (optionally driven by a background poller) or through
+    :meth:`activate`, and each of these replaces the snapshot atomically.
+
+    With ``model_startup_mode="local_first"`` construction only reads the local
+    artifact; the registry lookup (and bootstrap training when there is no model
+    anywhere) runs on a background thread that swaps in its result.
+
+    Requests may also select another registered model, version or stage
+    through :meth:`resolve`. Those models are loaded on first use and kept in
+    a :class:`LoadedModelCache` bounded by ``model_cache_max_mb``; stage names
+    are re-resolved against the registry every ``model_refresh_interval_seconds``.
+    """
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
-        self._model: Any | None = None
-        self._feature_names: list[str] = []
-        self._model_version: str = "unknown"
-        self._run_id: str | None = None
-        self._load_model()
+        self._active: LoadedModel | None = None
+        self._lock = threading.Lock()
+        self._stop_polling = threading.Event()
+        self._poller: threading.Thread | None = None
+        self._cache: PredictionCache | None = None
+        if settings.prediction_cache_enabled:
+            self._cache = PredictionCache(
+                max_entries=settings.prediction_cache_max_entries,
+                ttl_seconds=settings.prediction_cache_ttl_seconds,
+            )
+        self._models = LoadedModelCache(max_bytes=int(settings.model_cache_max_mb * 1024**2))
+        # (name, stage) -> (version, resolved at); guarded by ``_resolution_lock``
+        # together with the per-model load locks.
+        self._stage_versions: dict[tuple[str, str], tuple[str, float]] = {}
+        self._load_locks: dict[ModelKey, threading.Lock] = {}
+        self._resolution_lock = threading.Lock()
+        self._shadow: ShadowScorer | None = None
+        self._sync_state: RegistrySyncState = "pending"
+        self._synced = threading.Event()
+        if settings.model_startup_mode == "local_first":
+            self._start_local_first()
+        else:
+            self._load_model()
+            self._finish_sync("synced")
+
+    @property
+    def active(self) -> LoadedModel | None:
+        return self._active
+
+    @property
+    def cache(self) -> PredictionCache | None:
+        return self._cache
+
+    @property
+    def models(self) -> LoadedModelCache:
+        """Models loaded on request besides the active one."""
+        return self._models
+
+    @property
+    def shadow(self) -> ShadowScorer | None:
+        return self._shadow
+
+    def set_shadow_scorer(self, scorer: ShadowScorer | None) -> None:
+        """Hand rows scored by the active model to ``scorer`` (None disables)."""
+        self._shadow = scorer
+
+    @property
+    def sync_state(self) -> RegistrySyncState:
+        """Whether the startup registry lookup is still running, done or failed."""
+        return self._sync_state
 
-    def predict(self, features: list[float]) -> PredictionResult:
-        if self._model is None:
-            raise ValueError("Model is not available for inference")
+    def wait_until_synced(self, timeout: float | None = None) -> bool:
+        """Block until the startup registry lookup has finished (or failed)."""
+        return self._synced.wait(timeout)
 
-        if len(features) != len(self._feature_names):
+    def resolve(
+        self, name: str | None = None, version: str | None = None, stage: str | None = None
+    ) -> LoadedModel:
+        """Return the model for a per-request selection, loading it if needed.
+
+        ``name`` defaults to the served model; without ``version`` or ``stage``
+        that is the active snapshot, while other names default to their
+        Production version. The active snapshot is returned whenever the
+        selection resolves to its version.
+
+        Raises:
+            ModelNotFoundError: If the name, version or stage is not registered.
+            ModelUnavailableError: If no model is loaded yet, or the registry
+                cannot be reached.
+        """
+        active = self._active
+        if active is None:
+            raise ModelUnavailableError("Model is not available for inference")
+
+        name = name or self._settings.model_name
+        default_model = name == self._settings.model_name
+        if default_model and version is None and stage is None:
+            return active
+
+        if version is None:
+            version = self._resolve_stage(name, stage or REGISTRY_STAGES[0])
+        if default_model and version == active.model_version:
+            return active
+
+        key = (name, version)
+        cached = self._models.get(key)
+        if cached is not None:
+            return cached
+
+        with self._resolution_lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            # Another request may have loaded it while this one waited.
+            cached = self._models.get(key)
+            if cached is not None:
+                return cached
+            loaded = self._compile(self._load_version(name, version))
+            self._models.put(key, loaded, estimate_model_bytes(loaded))
+        return loaded
+
+    def predict_proba(self, model: LoadedModel, matrix: np.ndarray) -> np.ndarray:
+        """Positive-class probabilities of ``model`` for ``matrix``, uncached and unlogged."""
+        return self._predict_proba(model, matrix)
+
+    def predict(self, features: list[float], model: LoadedModel | None = None) -> PredictionResult:
+        """Score one feature vector with ``model`` (default: the active snapshot)."""
+        active = model or self._active
+        if active is None:
+            raise ModelUnavailableError("Model is not available for inference")
+
+        started = time.perf_counter()
+        if len(features) != len(active.feature_names):
+            count_predictions(active.model_version, scored=0, failed=1)
             raise ValueError(
-                f"Expected {len(self._feature_names)} features but received {len(features)}"
+                f"Expected {len(active.feature_names)} features but received {len(features)}"
             )
 
         # The pipeline expects a 2D array with shape (n_samples, n_features)
-        frame = pd.DataFrame([features], columns=self._feature_names)
-        probability = float(self._model.predict_proba(frame)[0][1])
+        matrix = np.asarray([features], dtype=np.float64)
+        if not np.isfinite(matrix).all():
+            # The compiled evaluator would route NaN down the right branches.
+            count_predictions(active.model_version, scored=0, failed=1)
+            raise ValueError("Features must be finite numbers")
+        observe_stage("input_checks", active.model_version, started)
+        probabilities = self._score(active, matrix, shadow=model is None)
+        probability = float(probabilities[0])
 
+        started = time.perf_counter()
         logger.info(
             "prediction.success",
-            model_version=self._model_version,
-            run_id=self._run_id,
+            model_version=active.model_version,
+            run_id=active.run_id,
             probability=probability,
         )
+        observe_stage("logging", active.model_version, started)
+        count_predictions(active.model_version, scored=1)
 
         return PredictionResult(
             probability=probability,
-            model_version=self._model_version,
-            run_id=self._run_id,
+            model_version=active.model_version,
+            run_id=active.run_id,
+        )
+
+    def predict_batch(
+        self, rows: Sequence[Sequence[float]], model: LoadedModel | None = None
+    ) -> list[BatchItemResult]:
+        """Score many feature vectors with a single ``predict_proba`` call.
+
+        Rows with the wrong number of features or non-finite values get a
+        per-row error instead of failing the whole batch. ``model`` defaults to
+        the active snapshot.
+        """
+        active = model or self._active
+        if active is None:
+            raise ModelUnavailableError("Model is not available for inference")
+
+        started = time.perf_counter()
+        n_features = len(active.feature_names)
+        errors: list[str | None] = [None] * len(rows)
+
+        try:
+            matrix = np.asarray(rows, dtype=np.float64)
+        except ValueError:
+            matrix = np.empty((0,))
+
+        if matrix.ndim == 2 and matrix.shape[1] == n_features:
+            valid_rows = np.arange(len(rows))
+        else:
+            # Ragged or uniformly mis-sized input: validate row by row and stack
+            # only the rows that can be scored.
+            valid = []
+            for index, row in enumerate(rows):
+                if len(row) == n_features:
+                    valid.append(index)
+                else:
+                    errors[index] = f"Expected {n_features} features but received {len(row)}"
+            valid_rows = np.asarray(valid, dtype=np.intp)
+            matrix = np.asarray([rows[index] for index in valid], dtype=np.float64).reshape(
+                len(valid), n_features
+            )
+
+        probabilities = self._score_rows(
+            active, matrix, valid_rows, errors, started, shadow=model is None
+        )
+        return [
+            BatchItemResult(error=error)
+            if error is not None
+            else BatchItemResult(
+                prediction=PredictionResult(
+                    probability=float(probabilities[index]),
+                    model_version=active.model_version,
+                    run_id=active.run_id,
+                )
+            )
+            for index, error in enumerate(errors)
+        ]
+
+    def predict_matrix(
+        self, matrix: np.ndarray, model: LoadedModel | None = None
+    ) -> MatrixPrediction:
+        """Score a 2D feature matrix without converting it to Python rows.
+
+        ``matrix`` may be a read-only view of a request body, of any float
+        dtype. Rows with non-finite values get a per-row error; a matrix with
+        the wrong number of columns raises ``ValueError``.
+        """
+        active = model or self._active
+        if active is None:
+            raise ModelUnavailableError("Model is not available for inference")
+
+        started = time.perf_counter()
+        n_features = len(active.feature_names)
+        if matrix.ndim != 2 or matrix.shape[1] != n_features:
+            count_predictions(active.model_version, scored=0, failed=len(matrix))
+            raise ValueError(f"Expected {n_features} features but received {matrix.shape[-1]}")
+
+        errors: list[str | None] = [None] * len(matrix)
+        probabilities = self._score_rows(
+            active, matrix, np.arange(len(matrix)), errors, started, shadow=model is None
+        )
+        return MatrixPrediction(
+            probabilities=probabilities,
+            errors={index: error for index, error in enumerate(errors) if error is not None},
+            model_version=active.model_version,
+            run_id=active.run_id,
+        )
+
+    def activate(self, model: LoadedModel) -> None:
+        """Atomically make ``model`` the snapshot served to new requests."""
+        with self._lock:
+            self._swap(model)
+
+    def refresh(self) -> bool:
+        """Load the newest registry version if it differs from the active one.
+
+        Returns ``True`` when a new model was swapped in.
+        """
+        with self._lock:
+            latest = self._latest_registry_version()
+            if latest is None:
+                return False
+
+            stage, version = latest
+            active = self._active
+            if (
+                active is not None
+                and active.model_version == str(version.version)
+                and active.run_id == version.run_id
+            ):
+                if active.source == "local_artifact":
+                    # The local copy is the registry's current version: confirm
+                    # it instead of downloading the same model again.
+                    self._active = replace(active, source="registry")
+                    logger.info("model.local_confirmed", model_version=active.model_version)
+                return False
+
+            loaded = self._load_registry_version(stage, version)
+            if loaded is None:
+                return False
+
+            self._swap(loaded)
+            return True
+
+    def start_polling(self, interval_seconds: float) -> None:
+        """Poll the registry for newer versions every ``interval_seconds``."""
+        if interval_seconds <= 0 or self._poller is not None:
+            return
+
+        self._stop_polling.clear()
+        self._poller = threading.Thread(
+            target=self._poll_registry,
+            args=(interval_seconds,),
+            name="model-registry-poller",
+            daemon=True,
         )
+        self._poller.start()
+
+    def stop_polling(self) -> None:
+        poller = self._poller
+        if poller is None:
+            return
+
+        self._stop_polling.set()
+        poller.join()
+        self._poller = None
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _load_model(self) -> None:
+    def _start_local_first(self) -> None:
+        local = self._try_load_local_artifact()
+        if local is not None:
+            self._swap(local)
+        threading.Thread(
+            target=self._sync_registry, name="model-registry-sync", daemon=True
+        ).start()
+
+    def _sync_registry(self) -> None:
+        started = time.perf_counter()
+        try:
+            self._configure_mlflow()
+            self.refresh()
+            if self._active is None:
+                logger.warning(
+                    "model.registry_unavailable",
+                    model_name=self._settings.model_name,
+                    action="bootstrap",
+                )
+                self.activate(LoadedModel.from_training(self._train()))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("model.registry_sync_failed", error=str(exc))
+            self._finish_sync("failed")
+            return
+
+        active = self._active
+        logger.info(
+            "model.registry_synced",
+            model_version=active.model_version if active else None,
+            source=active.source if active else None,
+            elapsed_seconds=round(time.perf_counter() - started, 3),
+        )
+        self._finish_sync("synced")
+
+    def _finish_sync(self, state: RegistrySyncState) -> None:
+        self._sync_state = state
+        self._synced.set()
+
+    def _configure_mlflow(self) -> None:
+        import mlflow
+
         mlflow.set_tracking_uri(self._settings.mlflow_tracking_uri)
         if self._settings.mlflow_registry_uri:
             mlflow.set_registry_uri(self._settings.mlflow_registry_uri)
 
-        if self._try_load_from_registry():
+    @time_lifecycle_step("train")
+    def _train(self) -> TrainedModelInfo:
+        from ..services.trainer import train_and_register_model
+
+        return train_and_register_model(self._settings)
+
+    def _poll_registry(self, interval_seconds: float) -> None:
+        while not self._stop_polling.wait(interval_seconds):
+            try:
+                self.refresh()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("model.refresh_failed", error=str(exc))
+
+    def _score_rows(
+        self,
+        model: LoadedModel,
+        matrix: np.ndarray,
+        valid_rows: np.ndarray,
+        errors: list[str | None],
+        started: float,
+        shadow: bool,
+    ) -> np.ndarray:
+        """Score ``matrix``, whose rows are request rows ``valid_rows``, and log the batch.
+
+        Rows with non-finite values are recorded in ``errors``. Returns one
+        probability per request row, NaN for every row with an error.
+        """
+        finite = np.isfinite(matrix).all(axis=1)
+        for index in valid_rows[~finite]:
+            errors[index] = "Features must be finite numbers"
+        observe_stage("input_checks", model.model_version, started)
+
+        probabilities = np.full(len(errors), np.nan, dtype=np.float64)
+        if finite.any():
+            # Masking copies the matrix; skip it on the common all-valid path.
+            scored = matrix if finite.all() else matrix[finite]
+            probabilities[valid_rows[finite]] = self._score(model, scored, shadow=shadow)
+
+        failed = sum(error is not None for error in errors)
+        started = time.perf_counter()
+        logger.info(
+            "prediction.batch",
+            model_version=model.model_version,
+            run_id=model.run_id,
+            batch_size=len(errors),
+            failed=failed,
+        )
+        observe_stage("logging", model.model_version, started)
+        count_predictions(model.model_version, scored=len(errors) - failed, failed=failed)
+        return probabilities
+
+    def _score(self, model: LoadedModel, matrix: np.ndarray, shadow: bool = False) -> np.ndarray:
+        probabilities = self._score_cached(model, matrix)
+        shadow_scorer = self._shadow
+        if shadow and shadow_scorer is not None:
+            shadow_scorer.submit(model.model_version, matrix, probabilities)
+        return probabilities
+
+    def _score_cached(self, model: LoadedModel, matrix: np.ndarray) -> np.ndarray:
+        """Score ``matrix``, serving repeated feature vectors from the cache."""
+        cache = self._cache
+        if cache is None:
+            return self._predict_proba(model, matrix)
+        # The cache is keyed by version only, and cleared on every swap, so it
+        # holds the active model's probabilities alone. Read before checking the
+        # active model: a swap after the check bumps it, and the put is dropped.
+        generation = cache.generation
+        if model is not self._active:
+            return self._predict_proba(model, matrix)
+
+        keys = cache.keys(model.model_version, matrix)
+        cached = cache.get_many(keys)
+        missing = [index for index, value in enumerate(cached) if value is None]
+        probabilities = np.array(
+            [np.nan if value is None else value for value in cached], dtype=np.float64
+        )
+        if missing:
+            computed = self._predict_proba(model, matrix[missing])
+            probabilities[missing] = computed
+            cache.put_many([keys[index] for index in missing], computed, generation)
+        return probabilities
+
+    @staticmethod
+    def _predict_proba(model: LoadedModel, matrix: np.ndarray) -> np.ndarray:
+        """Return the positive-class probability for each row of ``matrix``."""
+        probabilities: np.ndarray
+        if model.compiled is not None:
+            started = time.perf_counter()
+            probabilities = model.compiled.predict_proba(matrix)
+            observe_stage("predict_proba", model.model_version, started)
+            return probabilities
+
+        import pandas as pd
+
+        started = time.perf_counter()
+        # Wrapping the array (no copy for float64 input) keeps the column names
+        # the pipeline was fitted with, which avoids sklearn's feature-name
+        # warning per call. float32 tensors are widened like JSON input.
+        frame = pd.DataFrame(
+            np.asarray(matrix, dtype=np.float64), columns=model.feature_names, copy=False
+        )
+        started = observe_stage("dataframe", model.model_version, started)
+        probabilities = model.pipeline.predict_proba(frame)[:, 1]
+        observe_stage("predict_proba", model.model_version, started)
+        return probabilities
+
+    def _compile(self, model: LoadedModel) -> LoadedModel:
+        if self._settings.inference_backend != "compiled" or model.compiled is not None:
+            return model
+
+        try:
+            compiled = CompiledGradientBoosting.from_pipeline(model.pipeline)
+        except ValueError as exc:
+            logger.warning(
+                "model.compile_skipped", model_version=model.model_version, reason=str(exc)
+            )
+            return model
+
+        return replace(model, compiled=compiled)
+
+    def _swap(self, model: LoadedModel) -> None:
+        model = self._compile(model)
+        previous = self._active
+        self._active = model
+        if self._cache is not None:
+            # Versions such as "local" can be reused by different models, so
+            # never let cached probabilities outlive the snapshot they came from.
+            self._cache.clear()
+        if previous is not None and previous.model_version != model.model_version:
+            logger.info(
+                "model.swapped",
+                previous_version=previous.model_version,
+                model_version=model.model_version,
+                run_id=model.run_id,
+            )
+
+    @time_lifecycle_step("load_model")
+    def _load_model(self) -> None:
+        self._configure_mlflow()
+
+        loaded = self._try_load_from_registry()
+        if loaded is not None:
+            self._swap(loaded)
             return
 
         logger.warning(
             "model.registry_unavailable", model_name=self._settings.model_name, action="bootstrap"
         )
-        info = train_and_register_model(self._settings)
-        self._model = info.pipeline
-        self._feature_names = info.feature_names
-        self._model_version = info.model_version
-        self._run_id = info.run_id
+        self._swap(LoadedModel.from_training(self._train()))
+
+    def _latest_registry_version(self) -> tuple[str, ModelVersion] | None:
+        import mlflow
+        from mlflow.tracking import MlflowClient
 
-    def _try_load_from_registry(self) -> bool:
         client = MlflowClient()
-        for stage in ("Production", "Staging"):
+        for stage in REGISTRY_STAGES:
             try:
                 versions = client.get_latest_versions(self._settings.model_name, stages=[stage])
             except mlflow.exceptions.MlflowException:
-                return False
+                return None
 
-            if not versions:
-                continue
+            if versions:
+                return stage, versions[0]
 
-            version = versions[0]
-            model_uri = f"models:/{self._settings.model_name}/{stage}"
+        return None
+
+    @time_lifecycle_step("load_from_registry")
+    def _try_load_from_registry(self) -> LoadedModel | None:
+        import mlflow
+        from mlflow.tracking import MlflowClient
+
+        client = MlflowClient()
+        for stage in REGISTRY_STAGES:
             try:
-                model = mlflow.sklearn.load_model(model_uri)
-                feature_names_raw = artifacts.load_text(
-                    artifact_uri=f"runs:/{version.run_id}/{FEATURE_NAMES_ARTIFACT}"
-                )
-                feature_names = json.loads(feature_names_raw)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning(
-                    "model.load_failed",
-                    stage=stage,
-                    model_uri=model_uri,
-                    error=str(exc),
-                )
+                versions = client.get_latest_versions(self._settings.model_name, stages=[stage])
+            except mlflow.exceptions.MlflowException:
+                return None
+
+            if not versions:
                 continue
 
-            self._model = model
-            self._feature_names = list(feature_names)
-            self._model_version = str(version.version)
-            self._run_id = version.run_id
+            loaded = self._load_registry_version(stage, versions[0])
+            if loaded is not None:
+                return loaded
 
-            local_artifact = Path(self._settings.model_local_artifact)
-            local_artifact.parent.mkdir(parents=True, exist_ok=True)
-            joblib.dump({"model": model, "feature_names": self._feature_names}, local_artifact)
-            feature_artifact = local_artifact.parent / FEATURE_NAMES_ARTIFACT
-            feature_artifact.write_text(json.dumps(self._feature_names))
+        return self._try_load_local_artifact()
 
-            logger.info(
-                "model.loaded",
-                model_version=version.version,
+    def _load_registry_version(self, stage: str, version: ModelVersion) -> LoadedModel | None:
+        # Another worker (or an earlier run) may already have written this
+        # version locally; mapping the flat artifact beats another download.
+        local = self._try_load_local_artifact()
+        if (
+            local is not None
+            and local.model_version == str(version.version)
+            and local.run_id == version.run_id
+        ):
+            return replace(local, source="registry")
+
+        loaded = self._download(version, stage=stage)
+        if loaded is None:
+            return None
+
+        save_local_artifact(
+            self._settings.model_local_artifact,
+            LocalArtifact(
+                model=loaded.pipeline,
+                feature_names=loaded.feature_names,
+                model_version=loaded.model_version,
+                run_id=loaded.run_id,
+            ),
+        )
+        return loaded
+
+    @time_lifecycle_step("download")
+    def _download(self, version: ModelVersion, stage: str | None = None) -> LoadedModel | None:
+        import mlflow.sklearn
+        from mlflow import artifacts
+
+        model_uri = f"models:/{version.name}/{version.version}"
+        try:
+            model = mlflow.sklearn.load_model(model_uri)
+            feature_names_raw = artifacts.load_text(
+                artifact_uri=f"runs:/{version.run_id}/{FEATURE_NAMES_ARTIFACT}"
+            )
+            feature_names = list(json.loads(feature_names_raw))
+        except Exception as exc:  # noqa: BLE001
+            MODEL_LIFECYCLE_FAILURES.labels("download").inc()
+            logger.warning(
+                "model.load_failed",
                 stage=stage,
-                run_id=version.run_id,
+                model_uri=model_uri,
+                error=str(exc),
             )
-            return True
+            return None
 
-        return self._try_load_local_artifact()
+        logger.info(
+            "model.loaded",
+            model_name=version.name,
+            model_version=version.version,
+            stage=stage,
+            run_id=version.run_id,
+        )
+        return LoadedModel(
+            pipeline=model,
+            feature_names=feature_names,
+            model_version=str(version.version),
+            run_id=version.run_id,
+        )
+
+    def _resolve_stage(self, name: str, stage: str) -> str:
+        """Version currently in ``stage``, cached for one refresh interval."""
+        ttl = self._settings.model_refresh_interval_seconds
+        now = time.monotonic()
+        with self._resolution_lock:
+            resolved = self._stage_versions.get((name, stage))
+        # With polling disabled (interval 0) a resolution is kept for good,
+        # just as the active model is.
+        if resolved is not None and (ttl <= 0 or now - resolved[1] < ttl):
+            return resolved[0]
 
-    def _try_load_local_artifact(self) -> bool:
-        local_artifact = Path(self._settings.model_local_artifact)
-        if not local_artifact.exists():
-            return False
+        versions = self._registry_call(
+            lambda client: client.get_latest_versions(name, stages=[stage]), name
+        )
+        if not versions:
+            raise ModelNotFoundError(f"Model {name!r} has no {stage} version")
 
-        payload: dict[str, Any] = joblib.load(local_artifact)
-        self._model = payload["model"]
-        self._feature_names = list(payload["feature_names"])
-        feature_file = local_artifact.parent / FEATURE_NAMES_ARTIFACT
-        self._model_version = "local"
-        self._run_id = None
+        version = str(versions[0].version)
+        with self._resolution_lock:
+            self._stage_versions[(name, stage)] = (version, now)
+        return version
 
-        if feature_file.exists():
-            try:
-                self._feature_names = json.loads(feature_file.read_text())
-            except json.JSONDecodeError:
-                pass
+    def _load_version(self, name: str, version: str) -> LoadedModel:
+        model_version = self._registry_call(
+            lambda client: client.get_model_version(name, version), name
+        )
+        loaded = self._download(model_version)
+        if loaded is None:
+            raise ModelUnavailableError(f"Version {version} of model {name!r} could not be loaded")
+        return loaded
+
+    def _registry_call(self, call: Callable[[MlflowClient], _T], name: str) -> _T:
+        """Run ``call`` with a registry client, mapping MLflow errors to ours."""
+        import mlflow
+        from mlflow.tracking import MlflowClient
+
+        try:
+            return call(MlflowClient())
+        except mlflow.exceptions.MlflowException as exc:
+            if exc.error_code == "RESOURCE_DOES_NOT_EXIST":
+                raise ModelNotFoundError(f"Model {name!r}: {exc.message}") from exc
+            raise ModelUnavailableError(f"Model registry unavailable: {exc.message}") from exc
 
-        logger.info("model.loaded_local", artifact=str(local_artifact))
-        return True
+    @time_lifecycle_step("load_local_artifact")
+    def _try_load_local_artifact(self) -> LoadedModel | None:
+        local_artifact = self._settings.model_local_artifact
+        artifact = load_local_artifact(
+            local_artifact, prefer_flat=self._settings.inference_backend == "compiled"
+        )
+        if artifact is None:
+            return None
+
+        logger.info(
+            "model.loaded_local",
+            artifact=local_artifact,
+            model_version=artifact.model_version,
+            format="joblib" if artifact.compiled is None else "flat",
+        )
+        return LoadedModel(
+            pipeline=artifact.model,
+            feature_names=artifact.feature_names,
+            model_version=artifact.model_version or "local",
+            run_id=artifact.run_id,
+            compiled=artifact.compiled,
+            source="local_artifact",
+        )
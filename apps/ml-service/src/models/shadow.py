@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import structlog
+
+if TYPE_CHECKING:
+    from .registry import ModelRepository
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ShadowComparisonStats:
+    primary_version: str
+    shadow_version: str
+    rows: int
+    # Rows where both models fall on the same side of the decision threshold
+    agreements: int
+    agreement_rate: float
+    mean_abs_difference: float
+    max_abs_difference: float
+
+
+@dataclass(frozen=True)
+class ShadowScoringStats:
+    stage: str
+    submitted: int
+    dropped: int
+    dropped_rows: int
+    queued_bytes: int
+    max_queued_bytes: int
+    errors: int
+    comparisons: list[ShadowComparisonStats]
+
+
+@dataclass
+class _Comparison:
+    rows: int = 0
+    agreements: int = 0
+    abs_difference_sum: float = 0.0
+    max_abs_difference: float = 0.0
+
+
+@dataclass(frozen=True)
+class _ShadowTask:
+    primary_version: str
+    matrix: np.ndarray
+    probabilities: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.matrix.nbytes + self.probabilities.nbytes)
+
+
+class ShadowScorer:
+    """Score already-served rows with the ``stage`` model, off the request path.
+
+    :meth:`submit` only enqueues the rows and the probabilities that were
+    returned; a worker thread scores them with the shadow model and accumulates
+    agreement statistics per (served version, shadow version) pair. The queue
+    holds at most ``max_queued`` batches and ``max_queued_bytes`` of rows;
+    beyond either bound the rows are dropped and counted, so shadow scoring
+    can never slow down or back up the served traffic.
+    """
+
+    def __init__(
+        self,
+        repository: ModelRepository,
+        stage: str,
+        max_queued: int,
+        max_queued_bytes: int = 64 * 1024**2,
+        threshold: float = 0.5,
+    ) -> None:
+        self._repository = repository
+        self._stage = stage
+        self._threshold = threshold
+        self._max_queued_bytes = max_queued_bytes
+        self._queued_bytes = 0
+        self._dropped_rows = 0
+        self._queue: queue.Queue[_ShadowTask] = queue.Queue(maxsize=max(1, max_queued))
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._stats_lock = threading.Lock()
+        self._comparisons: dict[tuple[str, str], _Comparison] = {}
+        self._submitted = 0
+        self._dropped = 0
+        self._errors = 0
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the worker once the rows already queued have been scored."""
+        worker = self._worker
+        if worker is None:
+            return
+
+        self._stop.set()
+        worker.join()
+        self._worker = None
+
+    def submit(self, primary_version: str, matrix: np.ndarray, probabilities: np.ndarray) -> None:
+        task = _ShadowTask(primary_version, matrix, probabilities)
+        with self._stats_lock:
+            if self._queued_bytes + task.nbytes > self._max_queued_bytes:
+                self._drop(task)
+                return
+            try:
+                self._queue.put_nowait(task)
+            except queue.Full:
+                self._drop(task)
+                return
+            self._queued_bytes += task.nbytes
+            self._submitted += 1
+
+    def stats(self) -> ShadowScoringStats:
+        with self._stats_lock:
+            return ShadowScoringStats(
+                stage=self._stage,
+                submitted=self._submitted,
+                dropped=self._dropped,
+                dropped_rows=self._dropped_rows,
+                queued_bytes=self._queued_bytes,
+                max_queued_bytes=self._max_queued_bytes,
+                errors=self._errors,
+                comparisons=[
+                    ShadowComparisonStats(
+                        primary_version=primary,
+                        shadow_version=shadow,
+                        rows=comparison.rows,
+                        agreements=comparison.agreements,
+                        agreement_rate=comparison.agreements / comparison.rows,
+                        mean_abs_difference=comparison.abs_difference_sum / comparison.rows,
+                        max_abs_difference=comparison.max_abs_difference,
+                    )
+                    for (primary, shadow), comparison in self._comparisons.items()
+                    if comparison.rows
+                ],
+            )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                task = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            with self._stats_lock:
+                self._queued_bytes -= task.nbytes
+
+            try:
+                self._score(task)
+            except Exception as exc:  # noqa: BLE001
+                with self._stats_lock:
+                    self._errors += 1
+                logger.warning("shadow.scoring_failed", stage=self._stage, error=str(exc))
+
+    def _drop(self, task: _ShadowTask) -> None:
+        # Called with ``_stats_lock`` held.
+        self._dropped += 1
+        self._dropped_rows += len(task.probabilities)
+
+    def _score(self, task: _ShadowTask) -> None:
+        shadow = self._repository.resolve(stage=self._stage)
+        if shadow.model_version == task.primary_version:
+            # The served model is the shadow candidate: nothing to compare.
+            return
+
+        shadow_probabilities = self._repository.predict_proba(shadow, task.matrix)
+        differences = np.abs(shadow_probabilities - task.probabilities)
+        agreements = int(
+            np.count_nonzero(
+                (shadow_probabilities >= self._threshold) == (task.probabilities >= self._threshold)
+            )
+        )
+
+        with self._stats_lock:
+            comparison = self._comparisons.setdefault(
+                (task.primary_version, shadow.model_version), _Comparison()
+            )
+            comparison.rows += len(differences)
+            comparison.agreements += agreements
+            comparison.abs_difference_sum += float(differences.sum())
+            comparison.max_abs_difference = max(
+                comparison.max_abs_difference, float(differences.max(initial=0.0))
+            )
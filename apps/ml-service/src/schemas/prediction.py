@@ -1,6 +1,22 @@
-from typing import Annotated, List
+from typing import Annotated, Dict, List, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+
+class ModelSelection(BaseModel):
+    name: str | None = Field(
+        default=None, description="Registered model name (defaults to the served model)"
+    )
+    version: str | None = Field(default=None, description="Registry version to pin")
+    stage: Literal["Production", "Staging"] | None = Field(
+        default=None, description="Registry stage whose current version should score"
+    )
+
+    @model_validator(mode="after")
+    def _version_or_stage(self) -> "ModelSelection":
+        if self.version is not None and self.stage is not None:
+            raise ValueError("Select a model by version or by stage, not both")
+        return self
 
 
 class FailurePredictionRequest(BaseModel):
@@ -9,6 +25,9 @@ class FailurePredictionRequest(BaseModel):
         List[float],
         Field(min_length=1, description="Feature vector for prediction"),
     ]
+    model: ModelSelection | None = Field(
+        default=None, description="Score with this model instead of the served one"
+    )
 
 
 class FailurePrediction(BaseModel):
@@ -20,3 +39,114 @@ class FailurePrediction(BaseModel):
 class FailurePredictionResponse(BaseModel):
     asset_id: str
     prediction: FailurePrediction
+
+
+class BatchPredictionItem(BaseModel):
+    asset_id: str = Field(..., description="Unique asset identifier")
+    features: Annotated[
+        List[float],
+        Field(min_length=1, description="Feature vector for prediction"),
+    ]
+
+
+class BatchFailurePredictionRequest(BaseModel):
+    items: Annotated[
+        List[BatchPredictionItem],
+        Field(min_length=1, description="Assets to score in a single model call"),
+    ]
+    model: ModelSelection | None = Field(
+        default=None, description="Score with this model instead of the served one"
+    )
+
+
+class BatchFailurePredictionResult(BaseModel):
+    asset_id: str
+    prediction: FailurePrediction | None = None
+    error: str | None = Field(default=None, description="Why this item could not be scored")
+
+
+class BatchFailurePredictionResponse(BaseModel):
+    results: List[BatchFailurePredictionResult]
+
+
+class StreamScoringError(BaseModel):
+    line: int = Field(..., description="1-based line number of the record that failed to parse")
+    error: str
+
+
+class StreamScoringSummary(BaseModel):
+    rows: int
+    scored: int
+    errors: int
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+class MicroBatchingStats(BaseModel):
+    batches: int
+    items: int
+    mean_batch_size: float
+    max_batch_size: int
+    batch_size_histogram: Dict[int, int] = Field(
+        ..., description="Number of batches per size bucket, keyed by the bucket's upper bound"
+    )
+
+
+class PredictionCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+
+
+class LoadedModelCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    bytes: int
+    max_bytes: int
+    models: List[str] = Field(..., description="Cached name:version, least recently used first")
+
+
+class ShadowComparisonStats(BaseModel):
+    primary_version: str
+    shadow_version: str
+    rows: int
+    agreements: int = Field(..., description="Rows both models put on the same side of 0.5")
+    agreement_rate: float
+    mean_abs_difference: float
+    max_abs_difference: float
+
+
+class ShadowScoringStats(BaseModel):
+    stage: str
+    submitted: int
+    dropped: int = Field(..., description="Batches skipped because the shadow queue was full")
+    dropped_rows: int
+    queued_bytes: int = Field(..., description="Memory held by batches awaiting shadow scoring")
+    max_queued_bytes: int
+    errors: int
+    comparisons: List[ShadowComparisonStats]
+
+
+class InferenceExecutorStats(BaseModel):
+    workers: int
+    max_in_flight: int
+    max_queue_ms: float
+    in_flight: int
+    queued: int = Field(..., description="Admitted requests waiting for a scoring thread")
+    running: int
+    completed: int
+    rejected_in_flight: int = Field(..., description="Requests rejected with 429")
+    rejected_queue_timeout: int = Field(..., description="Requests rejected with 503")
+
+
+class InferenceStatsResponse(BaseModel):
+    executor: InferenceExecutorStats | None = None
+    micro_batching: MicroBatchingStats | None = None
+    cache: PredictionCacheStats | None = None
+    loaded_models: LoadedModelCacheStats | None = None
+    shadow: ShadowScoringStats | None = None
@@ -1,5 +1,19 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 
 class HealthResponse(BaseModel):
     status: str
+
+
+class ReadinessResponse(BaseModel):
+    status: Literal["loading", "serving_local", "serving_registry"] = Field(
+        description="serving_local means the local artifact is served and has not been "
+        "confirmed as the registry's current version, so it may be stale."
+    )
+    model_version: str | None
+    model_source: Literal["registry", "local_artifact", "training"] | None
+    registry_sync: Literal["pending", "synced", "failed"]
+    startup_mode: str
+    startup_seconds: float | None = None
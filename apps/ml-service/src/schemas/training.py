@@ -1,5 +1,9 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
+from ..services.jobs import TrainingJobStatus
+
 
 class TrainingResponse(BaseModel):
     model_version: str
@@ -7,3 +11,27 @@ class TrainingResponse(BaseModel):
     auc: float = Field(..., ge=0, le=1)
     accuracy: float = Field(..., ge=0, le=1)
     f1: float = Field(..., ge=0, le=1)
+
+
+class TrainingJobRequest(BaseModel):
+    num_samples: int = Field(default=500, ge=10, description="Rows of synthetic training data")
+    random_state: int = Field(default=42, description="Seed for the synthetic dataset")
+    search: bool = Field(
+        default=False,
+        description="Choose hyperparameters by cross-validated search before the final fit",
+    )
+
+
+class TrainingJobResponse(BaseModel):
+    job_id: str
+    status: TrainingJobStatus
+    num_samples: int
+    random_state: int
+    search: bool = False
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: TrainingResponse | None = Field(
+        default=None, description="Model version and metrics once the job has succeeded"
+    )
+    error: str | None = None
@@ -0,0 +1,294 @@
+"""Content-addressed on-disk cache for processed datasets.
+
+Entries are keyed by dataset source, the loader kwargs that shape the data
+(not execution settings such as ``max_workers``) and a fingerprint of the raw
+input files (relative path, size and mtime), so editing or replacing a raw
+file yields a new key and the stale entry simply ages out. Each entry is a
+directory holding one ``.npy`` file per feature column plus the labels, which
+are memory-mapped on load, and a ``metadata.json`` with the DatasetMetadata.
+
+Usage::
+
+    python -m src.services.dataset_cache list
+    python -m src.services.dataset_cache purge [--source nasa_cmapss] [--key KEY]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+import structlog
+
+from .data_loader import TrainingData
+
+if TYPE_CHECKING:
+    from ..core.config import Settings
+    from .dataset_loader import DatasetMetadata, DatasetSource
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the entry layout changes so old entries stop matching.
+DATASET_CACHE_VERSION = "v1"
+# Loader side caches (e.g. the C-MAPSS parquet files) live next to raw files and
+# must not count as raw input, or writing them would invalidate the entry.
+_IGNORED_SUFFIXES = (".parquet", ".tmp")
+_METADATA_FILE = "metadata.json"
+_LABELS_FILE = "labels.npy"
+# Loader kwargs that change how a dataset is loaded but not the loaded arrays.
+_EXECUTION_KWARGS = frozenset({"chunk_rows", "max_workers"})
+
+
+@dataclass(frozen=True)
+class DatasetCacheEntry:
+    """Summary of one cached dataset."""
+
+    key: str
+    source: str
+    kwargs: dict[str, Any]
+    num_samples: int
+    num_features: int
+    size_bytes: int
+    created_at: float
+    last_accessed: float
+
+
+class DatasetCache:
+    """Size-capped, LRU-evicted store of processed TrainingData."""
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> DatasetCache:
+        return cls(Path(settings.dataset_cache_dir), settings.dataset_cache_max_mb * 2**20)
+
+    @staticmethod
+    def key(source: DatasetSource, kwargs: dict[str, Any], raw_path: Path) -> str:
+        """Hash the source, kwargs and raw file metadata under ``raw_path``."""
+        files = []
+        for path in raw_path.rglob("*"):
+            if path.suffix in _IGNORED_SUFFIXES or not path.is_file():
+                continue
+            stat = path.stat()
+            files.append((str(path.relative_to(raw_path)), stat.st_size, stat.st_mtime_ns))
+        files.sort()
+        payload = json.dumps(
+            {
+                "version": DATASET_CACHE_VERSION,
+                "source": source.value,
+                "kwargs": _normalize_kwargs(kwargs),
+                "files": files,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[TrainingData, DatasetMetadata] | None:
+        """Return the memory-mapped entry for ``key`` or None on a miss.
+
+        The metadata's ``load_seconds`` is the time this hit took, not the
+        original load; ``peak_memory_mb`` is not measured for hits.
+        """
+        from .dataset_loader import DatasetMetadata, DatasetSource
+
+        started = time.perf_counter()
+        entry_dir = self.root / key
+        try:
+            stored = json.loads((entry_dir / _METADATA_FILE).read_text())
+            features = pd.DataFrame(
+                {
+                    name: np.load(entry_dir / f"feature_{index}.npy", mmap_mode="r")
+                    for index, name in enumerate(stored["columns"])
+                },
+                copy=False,
+            )
+            labels_array = np.load(entry_dir / _LABELS_FILE, mmap_mode="r")
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if stored["labels_object"]:
+            labels = pd.Series(labels_array.astype(object), name=stored["labels_name"])
+        else:
+            labels = pd.Series(labels_array, name=stored["labels_name"], copy=False)
+        self._touch(entry_dir)
+
+        metadata_fields = dict(stored["metadata"])
+        metadata_fields["source"] = DatasetSource(metadata_fields["source"])
+        metadata_fields["load_seconds"] = time.perf_counter() - started
+        metadata_fields["peak_memory_mb"] = None
+        return (
+            TrainingData(
+                features=features, labels=labels, feature_names=list(stored["feature_names"])
+            ),
+            DatasetMetadata(**metadata_fields),
+        )
+
+    def put(
+        self,
+        key: str,
+        data: TrainingData,
+        metadata: DatasetMetadata,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Store an entry, then evict least recently used entries over the cap."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.root))
+        try:
+            for index, column in enumerate(data.features.columns):
+                np.save(staging / f"feature_{index}.npy", data.features[column].to_numpy())
+            labels_object = data.labels.dtype == object
+            labels = data.labels.to_numpy()
+            np.save(staging / _LABELS_FILE, labels.astype(str) if labels_object else labels)
+
+            now = time.time()
+            stored_metadata = asdict(metadata)
+            stored_metadata["source"] = metadata.source.value
+            (staging / _METADATA_FILE).write_text(
+                json.dumps(
+                    {
+                        "source": metadata.source.value,
+                        "kwargs": _normalize_kwargs(kwargs),
+                        "columns": [str(column) for column in data.features.columns],
+                        "feature_names": list(data.feature_names),
+                        "labels_name": data.labels.name,
+                        "labels_object": bool(labels_object),
+                        "metadata": stored_metadata,
+                        "created_at": now,
+                    },
+                    default=str,
+                )
+            )
+            size = _directory_size(staging)
+            if size > self.max_bytes:
+                logger.info("dataset_cache.skipped", key=key, size_bytes=size)
+                return
+            try:
+                staging.rename(self.root / key)
+            except OSError:
+                # Another writer stored the same key first; its entry is identical.
+                return
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+
+        logger.info("dataset_cache.stored", key=key, source=metadata.source.value, size_bytes=size)
+        self._evict()
+
+    def entries(self) -> list[DatasetCacheEntry]:
+        """List entries, most recently used first."""
+        if not self.root.exists():
+            return []
+        entries = []
+        for entry_dir in self.root.iterdir():
+            metadata_file = entry_dir / _METADATA_FILE
+            if entry_dir.name.startswith(".") or not metadata_file.exists():
+                continue
+            try:
+                stored = json.loads(metadata_file.read_text())
+            except (OSError, ValueError):
+                continue
+            entries.append(
+                DatasetCacheEntry(
+                    key=entry_dir.name,
+                    source=stored["source"],
+                    kwargs=stored["kwargs"],
+                    num_samples=stored["metadata"]["num_samples"],
+                    num_features=stored["metadata"]["num_features"],
+                    size_bytes=_directory_size(entry_dir),
+                    created_at=stored["created_at"],
+                    last_accessed=metadata_file.stat().st_mtime,
+                )
+            )
+        return sorted(entries, key=lambda entry: entry.last_accessed, reverse=True)
+
+    def purge(self, source: str | None = None, key: str | None = None) -> int:
+        """Delete matching entries (all when no filter is given); returns the count.
+
+        ``key`` may be a prefix, as printed by the ``list`` command.
+        """
+        removed = 0
+        with self._lock:
+            for entry in self.entries():
+                if source is not None and entry.source != source:
+                    continue
+                if key is None or entry.key.startswith(key):
+                    shutil.rmtree(self.root / entry.key, ignore_errors=True)
+                    removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _touch(self, entry_dir: Path) -> None:
+        # The metadata file's mtime doubles as the LRU timestamp.
+        try:
+            os.utime(entry_dir / _METADATA_FILE)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = self.entries()
+            total = sum(entry.size_bytes for entry in entries)
+            while total > self.max_bytes and entries:
+                victim = entries.pop()
+                shutil.rmtree(self.root / victim.key, ignore_errors=True)
+                total -= victim.size_bytes
+                logger.info("dataset_cache.evicted", key=victim.key, size_bytes=victim.size_bytes)
+
+
+def _normalize_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    return {
+        name: str(value) if isinstance(value, Path) else value
+        for name, value in sorted(kwargs.items())
+        if name not in _EXECUTION_KWARGS
+    }
+
+
+def _directory_size(path: Path) -> int:
+    return sum(child.stat().st_size for child in path.iterdir() if child.is_file())
+
+
+def main(argv: list[str] | None = None) -> None:
+    from ..core.config import get_settings
+
+    parser = argparse.ArgumentParser(description="Inspect or purge the dataset cache.")
+    parser.add_argument("--cache-dir", help="Cache directory (defaults to DATASET_CACHE_DIR)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List cached datasets, most recently used first")
+    purge = commands.add_parser("purge", help="Delete cached datasets")
+    purge.add_argument("--source", help="Only purge entries for this dataset source")
+    purge.add_argument("--key", help="Only purge the entry whose key starts with this")
+    args = parser.parse_args(argv)
+
+    cache = DatasetCache.from_settings(get_settings())
+    if args.cache_dir:
+        cache = DatasetCache(Path(args.cache_dir), cache.max_bytes)
+    if args.command == "list":
+        for entry in cache.entries():
+            print(
+                f"{entry.key[:16]}  {entry.source:<16} {entry.num_samples:>9} rows  "
+                f"{entry.size_bytes / 2**20:8.1f} MB  {json.dumps(entry.kwargs, default=str)}"
+            )
+    else:
+        print(f"Purged {cache.purge(source=args.source, key=args.key)} entries")
+
+
+if __name__ == "__main__":
+    main()
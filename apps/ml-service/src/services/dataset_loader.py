@@ -10,7 +10,14 @@ See docs/ml-datasets-guide.md for dataset sources and download links.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import multiprocessing
+import os
+import time
+import tracemalloc
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -19,6 +26,26 @@ import numpy as np
 import pandas as pd
 
 from .data_loader import TrainingData
+from .dataset_cache import DatasetCache
+
+CMAPSS_SETTINGS = [f"op_setting_{index}" for index in range(1, 4)]
+CMAPSS_SENSORS = [f"sensor_{index}" for index in range(1, 22)]
+CMAPSS_LABEL = "health_status"
+CMAPSS_DEFAULT_WINDOW = 30
+# Bump when the parsed layout changes so stale parquet caches are ignored.
+CMAPSS_CACHE_VERSION = "v1"
+# Windows processed per step when reducing strided views, bounding temporaries.
+_WINDOW_BLOCK_ROWS = 1024
+
+AZURE_SENSORS = ["volt", "rotate", "pressure", "vibration"]
+AZURE_LABEL = "failure_within_horizon"
+
+CWRU_LABEL = "fault_type"
+CWRU_DEFAULT_WINDOW = 2048
+CWRU_DEFAULT_BANDS = 8
+CWRU_SIGNAL_SUFFIXES = (".npy", ".mat")
+# Windows per batched FFT; 256 x 2048 samples keeps each temporary at a few MB.
+_FFT_BLOCK_WINDOWS = 256
 
 
 class DatasetSource(str, Enum):
@@ -41,6 +68,9 @@ class DatasetMetadata:
     feature_names: list[str]
     label_distribution: dict[str, int]
     description: str
+    load_seconds: float | None = None
+    # Peak allocations traced in this process only (worker processes are not counted)
+    peak_memory_mb: float | None = None
 
 
 class DatasetLoader:
@@ -51,15 +81,28 @@ class DatasetLoader:
     and applies labeling standards from the Telemetry Labeling Guide.
     """
 
-    def __init__(self, data_dir: Path | None = None):
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        cache: DatasetCache | None = None,
+        measure_memory: bool = False,
+    ):
         """
         Initialize dataset loader.
 
         Args:
             data_dir: Optional directory containing downloaded datasets.
                      If None, expects datasets in standard locations.
+            cache: Optional processed-dataset cache consulted before parsing
+                   raw files (the synthetic source is never cached).
+            measure_memory: Trace allocations to report ``peak_memory_mb``
+                   for the Azure PM and CWRU loaders. Tracing slows loading
+                   down, so it is off by default. Only allocations in this
+                   process are traced, not those of CWRU worker processes.
         """
         self.data_dir = data_dir or Path(__file__).parent.parent.parent / "data" / "raw"
+        self.cache = cache
+        self.measure_memory = measure_memory
 
     def load_dataset(
         self,
@@ -79,6 +122,36 @@ class DatasetLoader:
         Raises:
             ValueError: If dataset source is not supported or data not found
         """
+        if self.cache is None or source == DatasetSource.SYNTHETIC:
+            return self._load_uncached(source, **kwargs)
+
+        data_dir: Path | None = kwargs.get("data_dir")
+        raw_path = self._raw_path(source, data_dir)
+        if not raw_path.exists():
+            # Let the source loader raise its download hint.
+            return self._load_uncached(source, **kwargs)
+
+        key = self.cache.key(source, kwargs, raw_path)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        data, metadata = self._load_uncached(source, **kwargs)
+        self.cache.put(key, data, metadata, kwargs)
+        return data, metadata
+
+    def _raw_path(self, source: DatasetSource, data_dir: Path | None) -> Path:
+        """Directory whose files feed ``source`` (fingerprinted for the cache)."""
+        name: str = source.value
+        if source == DatasetSource.NASA_CMAPSS:
+            # C-MAPSS takes the parent data directory, like ``self.data_dir``.
+            return Path(data_dir or self.data_dir) / name
+        return Path(data_dir or self.data_dir / name)
+
+    def _load_uncached(
+        self,
+        source: DatasetSource,
+        **kwargs: Any,
+    ) -> tuple[TrainingData, DatasetMetadata]:
         if source == DatasetSource.NASA_CMAPSS:
             return self._load_nasa_cmapss(**kwargs)
         elif source == DatasetSource.AZURE_PM:
@@ -96,7 +169,7 @@ class DatasetLoader:
                 num_samples=len(data.features),
                 num_features=len(data.feature_names),
                 feature_names=data.feature_names,
-                label_distribution=data.labels.value_counts().to_dict(),
+                label_distribution=_label_distribution(data.labels),
                 description="Synthetic dataset for bootstrap training",
             )
             return data, metadata
@@ -107,13 +180,24 @@ class DatasetLoader:
         self,
         subset: str = "FD001",
         data_dir: Path | None = None,
+        window: int = CMAPSS_DEFAULT_WINDOW,
+        use_cache: bool = True,
     ) -> tuple[TrainingData, DatasetMetadata]:
         """
         Load NASA C-MAPSS turbofan engine degradation dataset.
 
+        Each row of ``train_FDxxx.txt`` is one engine cycle: unit number, cycle,
+        3 operational settings and 21 sensors. Every cycle becomes a sample
+        labeled with the health status of its remaining useful life, featuring
+        the current readings plus the rolling mean and standard deviation of
+        each sensor over the last ``window`` cycles of the same unit (the first
+        ``window - 1`` cycles of each unit are dropped).
+
         Args:
             subset: Dataset subset (FD001, FD002, FD003, or FD004)
             data_dir: Optional directory containing C-MAPSS data
+            window: Number of cycles in the rolling sensor window
+            use_cache: Read/write a parquet cache next to the raw file
 
         Returns:
             Tuple of (TrainingData, DatasetMetadata)
@@ -131,27 +215,30 @@ class DatasetLoader:
                 "6.+Turbofan+Engine+Degradation+Simulation+Data+Set.zip"
             )
 
-        # Load training data (simplified - actual C-MAPSS has complex structure)
-        # This is a placeholder implementation
-        # Full implementation would parse the C-MAPSS text files
         train_file = data_path / f"train_{subset}.txt"
         if not train_file.exists():
             raise FileNotFoundError(f"Training file not found: {train_file}")
+        if window < 1:
+            raise ValueError("window must be at least 1 cycle")
 
-        # Placeholder: actual implementation would parse C-MAPSS format
-        # C-MAPSS has 21 sensor columns + unit ID + cycle number
-        # For now, return empty dataset with expected structure
-        features = pd.DataFrame()
-        labels = pd.Series(dtype=int)
+        cache_file = data_path / f"train_{subset}.w{window}.{CMAPSS_CACHE_VERSION}.parquet"
+        frame = _read_parquet_cache(cache_file, train_file) if use_cache else None
+        if frame is None:
+            frame = _parse_cmapss(train_file, window)
+            if use_cache:
+                _write_parquet_cache(frame, cache_file)
+
+        labels = frame.pop(CMAPSS_LABEL)
+        feature_names = list(frame.columns)
 
         return (
-            TrainingData(features=features, labels=labels, feature_names=[]),
+            TrainingData(features=frame, labels=labels, feature_names=feature_names),
             DatasetMetadata(
                 source=DatasetSource.NASA_CMAPSS,
-                num_samples=0,
-                num_features=0,
-                feature_names=[],
-                label_distribution={},
+                num_samples=len(frame),
+                num_features=len(feature_names),
+                feature_names=feature_names,
+                label_distribution=_label_distribution(labels),
                 description=f"NASA C-MAPSS Turbofan Engine Degradation ({subset})",
             ),
         )
@@ -159,12 +246,29 @@ class DatasetLoader:
     def _load_azure_pm(
         self,
         data_dir: Path | None = None,
+        window_hours: int = 24,
+        horizon_hours: int = 24,
+        sample_hours: int = 3,
+        chunk_rows: int = 200_000,
     ) -> tuple[TrainingData, DatasetMetadata]:
         """
         Load Microsoft Azure Predictive Maintenance dataset.
 
+        Telemetry is streamed in ``chunk_rows`` chunks with float32 sensors and
+        categorical machine IDs. Per-machine rolling sensor mean/std over
+        ``window_hours`` are computed chunk by chunk (carrying each machine's
+        last rows into the next chunk), so rows of one machine must appear in
+        time order, as they do in the published CSV. Error counts, days since
+        maintenance, machine age/model and the label (a failure within
+        ``horizon_hours``) are joined with sorted ``merge_asof`` merges. One
+        sample is kept every ``sample_hours``.
+
         Args:
             data_dir: Optional directory containing Azure PM data
+            window_hours: Rolling window for sensor aggregates and error counts
+            horizon_hours: Look-ahead for the failure label
+            sample_hours: Keep one telemetry row per machine every N hours
+            chunk_rows: Telemetry rows read per chunk
 
         Returns:
             Tuple of (TrainingData, DatasetMetadata)
@@ -183,35 +287,62 @@ class DatasetLoader:
             )
 
         # Load telemetry data
-        telemetry_file = data_path / "telemetry.csv"
+        telemetry_file = _azure_file(data_path, "telemetry")
         if not telemetry_file.exists():
             raise FileNotFoundError(f"Telemetry file not found: {telemetry_file}")
 
-        # Placeholder: actual implementation would load and preprocess CSV
-        features = pd.DataFrame()
-        labels = pd.Series(dtype=int)
+        with _measure_load(self.measure_memory) as measurement:
+            data = _AzureTelemetryPipeline(
+                data_path,
+                window_hours=window_hours,
+                horizon_hours=horizon_hours,
+                sample_hours=sample_hours,
+            ).run(telemetry_file, chunk_rows)
 
         return (
-            TrainingData(features=features, labels=labels, feature_names=[]),
+            data,
             DatasetMetadata(
                 source=DatasetSource.AZURE_PM,
-                num_samples=0,
-                num_features=0,
-                feature_names=[],
-                label_distribution={},
+                num_samples=len(data.features),
+                num_features=len(data.feature_names),
+                feature_names=data.feature_names,
+                label_distribution=_label_distribution(data.labels),
                 description="Microsoft Azure Predictive Maintenance Dataset",
+                load_seconds=measurement.seconds,
+                peak_memory_mb=measurement.peak_mb,
             ),
         )
 
     def _load_cwru_bearing(
         self,
         data_dir: Path | None = None,
+        window_size: int = CWRU_DEFAULT_WINDOW,
+        step: int | None = None,
+        n_bands: int = CWRU_DEFAULT_BANDS,
+        channel: str = "DE",
+        max_workers: int | None = None,
     ) -> tuple[TrainingData, DatasetMetadata]:
         """
         Load CWRU Bearing fault dataset.
 
+        Signal files are expected under one sub-directory per fault type
+        (e.g. ``normal/``, ``inner_race/``, ``outer_race/``, ``ball/``); the
+        directory name is the label. ``.npy`` signals are memory-mapped, while
+        ``.mat`` recordings are read with SciPy (taking the ``*_{channel}_time``
+        variable). Each signal is cut into ``window_size`` windows as strided
+        views and featurized with RMS, kurtosis, crest factor and the energy of
+        ``n_bands`` equal-width bands of the windowed FFT. Files are spread
+        across a process pool. ``peak_memory_mb`` only covers this process:
+        allocations made by the pool's worker processes are not counted, so
+        run with ``max_workers=1`` to measure the featurization itself.
+
         Args:
             data_dir: Optional directory containing CWRU data
+            window_size: Samples per window
+            step: Samples between window starts (defaults to ``window_size``)
+            n_bands: Number of spectral energy bands
+            channel: Accelerometer channel read from ``.mat`` files (DE, FE or BA)
+            max_workers: Worker processes (defaults to the CPU count; 1 runs in-process)
 
         Returns:
             Tuple of (TrainingData, DatasetMetadata)
@@ -228,19 +359,52 @@ class DatasetLoader:
                 "Download from: https://www.kaggle.com/datasets/brjapon/cwru-bearing-datasets"
             )
 
-        # Placeholder: actual implementation would load vibration signals
-        features = pd.DataFrame()
-        labels = pd.Series(dtype=int)
+        signal_files = sorted(
+            path for path in data_path.glob("*/*") if path.suffix.lower() in CWRU_SIGNAL_SUFFIXES
+        )
+        if not signal_files:
+            raise FileNotFoundError(
+                f"No signal files ({', '.join(CWRU_SIGNAL_SUFFIXES)}) found under {data_path}"
+            )
+
+        feature_names = _bearing_feature_names(n_bands)
+        step = step or window_size
+        workers = min(max_workers or os.cpu_count() or 1, len(signal_files))
+
+        with _measure_load(self.measure_memory) as measurement:
+            args = [(path, window_size, step, n_bands, channel) for path in signal_files]
+            if workers == 1:
+                blocks = [_featurize_signal_file(*arg) for arg in args]
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    blocks = list(executor.map(_featurize_signal_file, *zip(*args)))
+
+            features = pd.DataFrame(
+                np.concatenate(blocks) if blocks else np.empty((0, len(feature_names))),
+                columns=feature_names,
+                dtype=np.float32,
+            )
+            labels = pd.Series(
+                np.repeat(
+                    [path.parent.name for path in signal_files],
+                    [len(block) for block in blocks],
+                ),
+                name=CWRU_LABEL,
+            )
 
         return (
-            TrainingData(features=features, labels=labels, feature_names=[]),
+            TrainingData(features=features, labels=labels, feature_names=feature_names),
             DatasetMetadata(
                 source=DatasetSource.CWRU_BEARING,
-                num_samples=0,
-                num_features=0,
-                feature_names=[],
-                label_distribution={},
+                num_samples=len(features),
+                num_features=len(feature_names),
+                feature_names=feature_names,
+                label_distribution=_label_distribution(labels),
                 description="CWRU Bearing Fault Dataset",
+                load_seconds=measurement.seconds,
+                peak_memory_mb=measurement.peak_mb,
             ),
         )
 
@@ -332,3 +496,317 @@ class DatasetLoader:
         else:
             return "excellent"
 
+
+def _label_distribution(labels: pd.Series) -> dict[str, int]:
+    return {str(label): int(count) for label, count in labels.value_counts().items()}
+
+
+def _parse_cmapss(train_file: Path, window: int) -> pd.DataFrame:
+    """Parse one C-MAPSS training file into features plus a health status column."""
+    n_columns = 2 + len(CMAPSS_SETTINGS) + len(CMAPSS_SENSORS)
+    # One bulk C-level parse of the whitespace-separated text; rows end in spaces.
+    raw = np.fromfile(train_file, sep=" ")
+    if raw.size % n_columns:
+        raise ValueError(f"{train_file} does not contain {n_columns} columns per row")
+    table = raw.reshape(-1, n_columns)
+
+    unit = table[:, 0].astype(np.int64)
+    cycle = table[:, 1]
+    settings = table[:, 2 : 2 + len(CMAPSS_SETTINGS)]
+    sensors = np.ascontiguousarray(table[:, 2 + len(CMAPSS_SETTINGS) :])
+
+    # Units are stored as contiguous runs; RUL counts down to each run's last cycle.
+    starts = np.flatnonzero(np.r_[True, unit[1:] != unit[:-1]])
+    run_lengths = np.diff(np.r_[starts, len(unit)])
+    last_cycle = np.repeat(np.maximum.reduceat(cycle, starts), run_lengths)
+    rul = (last_cycle - cycle).astype(np.int64)
+
+    # A window ending at row i is valid when it does not cross into another unit.
+    n_windows = max(0, len(unit) - window + 1)
+    ends = np.arange(window - 1, window - 1 + n_windows)
+    valid = unit[ends] == unit[ends - window + 1]
+    ends = ends[valid]
+
+    # Window i of the view starts at row i. Selecting the valid windows copies
+    # them, so only one block of windows is gathered at a time.
+    views = np.lib.stride_tricks.sliding_window_view(sensors, window, axis=0)
+    window_starts = ends - window + 1
+    means = np.empty((len(ends), sensors.shape[1]))
+    stds = np.empty_like(means)
+    for block in range(0, len(ends), _WINDOW_BLOCK_ROWS):
+        rows = slice(block, block + _WINDOW_BLOCK_ROWS)
+        block_views = views[window_starts[rows]]
+        means[rows] = block_views.mean(axis=-1)
+        stds[rows] = block_views.std(axis=-1)
+
+    statuses, inverse = np.unique(rul[ends], return_inverse=True)
+    health = np.array([DatasetLoader.map_rul_to_health_status(int(value)) for value in statuses])
+    labels = health[inverse]
+
+    columns: dict[str, np.ndarray] = {"cycle": cycle[ends]}
+    columns.update(zip(CMAPSS_SETTINGS, settings[ends].T, strict=True))
+    columns.update(zip(CMAPSS_SENSORS, sensors[ends].T, strict=True))
+    columns.update(zip([f"{name}_mean_{window}" for name in CMAPSS_SENSORS], means.T, strict=True))
+    columns.update(zip([f"{name}_std_{window}" for name in CMAPSS_SENSORS], stds.T, strict=True))
+    columns[CMAPSS_LABEL] = labels
+    return pd.DataFrame(columns)
+
+
+def _read_parquet_cache(cache_file: Path, source: Path) -> pd.DataFrame | None:
+    """Return the cached frame if it exists and is newer than ``source``."""
+    if not cache_file.exists() or cache_file.stat().st_mtime_ns < source.stat().st_mtime_ns:
+        return None
+    try:
+        return pd.read_parquet(cache_file)
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _write_parquet_cache(frame: pd.DataFrame, cache_file: Path) -> None:
+    """Best-effort cache write; needs a parquet engine such as pyarrow."""
+    temporary = cache_file.with_name(cache_file.name + ".tmp")
+    try:
+        frame.to_parquet(temporary, index=False)
+        temporary.replace(cache_file)
+    except (ImportError, OSError):
+        temporary.unlink(missing_ok=True)
+
+
+@dataclass
+class _LoadMeasurement:
+    seconds: float = 0.0
+    peak_mb: float | None = None
+
+
+@contextmanager
+def _measure_load(trace_memory: bool) -> Iterator[_LoadMeasurement]:
+    """Measure wall time and, if asked, peak traced allocations (NumPy/pandas buffers included)."""
+    measurement = _LoadMeasurement()
+    already_tracing = tracemalloc.is_tracing()
+    if trace_memory:
+        if already_tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        yield measurement
+    finally:
+        measurement.seconds = time.perf_counter() - started
+        if trace_memory:
+            measurement.peak_mb = (tracemalloc.get_traced_memory()[1] - baseline) / 2**20
+            if not already_tracing:
+                tracemalloc.stop()
+
+
+def _bearing_feature_names(n_bands: int) -> list[str]:
+    return ["rms", "kurtosis", "crest_factor", *(f"band_energy_{i}" for i in range(n_bands))]
+
+
+def _read_signal(path: Path, channel: str) -> np.ndarray:
+    """Return a 1-D signal, memory-mapped for ``.npy`` files."""
+    if path.suffix.lower() == ".npy":
+        signal: np.ndarray = np.load(path, mmap_mode="r")
+    else:
+        try:
+            from scipy.io import loadmat  # type: ignore[import-untyped]
+        except ImportError as exc:  # pragma: no cover - scipy ships with scikit-learn
+            raise ImportError("Reading CWRU .mat files requires scipy") from exc
+
+        variables = loadmat(path)
+        keys = [key for key in variables if key.endswith(f"_{channel}_time")]
+        if not keys:
+            raise ValueError(f"{path} has no {channel} channel")
+        signal = variables[keys[0]]
+    return signal.reshape(-1)
+
+
+def _featurize_signal_file(
+    path: Path, window_size: int, step: int, n_bands: int, channel: str
+) -> np.ndarray:
+    """Featurize one signal file; runs in pool workers, so it must stay top-level."""
+    signal = _read_signal(path, channel)
+    if len(signal) < window_size:
+        return np.empty((0, 3 + n_bands), dtype=np.float32)
+
+    # Strided views over the mapped file; only one block of windows is ever
+    # copied into memory at a time.
+    windows = np.lib.stride_tricks.sliding_window_view(signal, window_size)[::step]
+    taper = np.hanning(window_size)
+    edges = np.linspace(0, window_size // 2 + 1, n_bands + 1).astype(np.intp)
+    out = np.empty((len(windows), 3 + n_bands), dtype=np.float32)
+
+    for start in range(0, len(windows), _FFT_BLOCK_WINDOWS):
+        block = np.asarray(windows[start : start + _FFT_BLOCK_WINDOWS], dtype=np.float64)
+        centered = block - block.mean(axis=1, keepdims=True)
+        # Products instead of ``** 4`` and einsum row dots keep the moments
+        # several times cheaper than the FFT itself.
+        squared = centered * centered
+        variance = squared.mean(axis=1)
+        fourth = np.einsum("ij,ij->i", squared, squared) / window_size
+        rms = np.sqrt(np.einsum("ij,ij->i", block, block) / window_size)
+        peak = np.maximum(block.max(axis=1), -block.min(axis=1))
+        rows = slice(start, start + len(block))
+        out[rows, 0] = rms
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[rows, 1] = np.where(variance > 0, fourth / variance**2, 0.0)
+            out[rows, 2] = np.where(rms > 0, peak / rms, 0.0)
+
+        spectrum = np.fft.rfft(centered * taper, axis=1)
+        power = (spectrum.real**2 + spectrum.imag**2) / window_size
+        out[rows, 3:] = np.add.reduceat(power, edges[:-1], axis=1)
+    return out
+
+
+def _azure_file(data_path: Path, table: str) -> Path:
+    """Kaggle ships ``PdM_<table>.csv``; the original release used ``<table>.csv``."""
+    prefixed = data_path / f"PdM_{table}.csv"
+    return prefixed if prefixed.exists() else data_path / f"{table}.csv"
+
+
+@dataclass
+class _AzureTelemetryPipeline:
+    data_path: Path
+    window_hours: int
+    horizon_hours: int
+    sample_hours: int
+    feature_names: list[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.feature_names = [
+            *AZURE_SENSORS,
+            *(f"{name}_mean_{self.window_hours}h" for name in AZURE_SENSORS),
+            *(f"{name}_std_{self.window_hours}h" for name in AZURE_SENSORS),
+            f"errors_{self.window_hours}h",
+            "days_since_maintenance",
+            "age",
+            "model",
+        ]
+
+    def run(self, telemetry_file: Path, chunk_rows: int) -> TrainingData:
+        machines = pd.read_csv(_azure_file(self.data_path, "machines"))
+        machine_ids = np.sort(machines["machineID"].to_numpy())
+        self._machine_dtype = pd.CategoricalDtype(categories=machine_ids.tolist())
+        self._machines = machines.assign(
+            machine=self._codes(machines["machineID"]),
+            model=machines["model"].astype("category").cat.codes.astype(np.float32),
+            age=machines["age"].astype(np.float32),
+        ).set_index("machine")[["age", "model"]]
+        self._errors = self._events("errors", cumulative=True)
+        self._maintenance = self._events("maint")
+        self._failures = self._events("failures")
+
+        frames: list[pd.DataFrame] = []
+        tail = pd.DataFrame()
+        dtypes: dict[str, Any] = {"machineID": self._machine_dtype}
+        dtypes.update(dict.fromkeys(AZURE_SENSORS, np.float32))
+        reader = pd.read_csv(
+            telemetry_file, chunksize=chunk_rows, parse_dates=["datetime"], dtype=dtypes
+        )
+        for chunk in reader:
+            features, tail = self._process_chunk(chunk, tail)
+            frames.append(features)
+
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        if frame.empty:
+            frame = pd.DataFrame(
+                {name: pd.Series(dtype=np.float32) for name in self.feature_names}
+            ).assign(**{AZURE_LABEL: pd.Series(dtype=np.int8)})
+        labels = frame.pop(AZURE_LABEL)
+        return TrainingData(features=frame, labels=labels, feature_names=list(self.feature_names))
+
+    def _codes(self, machine_ids: pd.Series) -> np.ndarray:
+        codes: np.ndarray = (
+            pd.Series(machine_ids).astype(self._machine_dtype).cat.codes.to_numpy(np.int16)
+        )
+        return codes
+
+    def _events(self, table: str, cumulative: bool = False) -> pd.DataFrame:
+        """Load a side table sorted by time with int16 machine codes for ``merge_asof``."""
+        events = pd.read_csv(
+            _azure_file(self.data_path, table),
+            usecols=["datetime", "machineID"],
+            parse_dates=["datetime"],
+        )
+        events = pd.DataFrame(
+            {"datetime": events["datetime"], "machine": self._codes(events["machineID"])}
+        ).sort_values(["datetime", "machine"], kind="stable", ignore_index=True)
+        if cumulative:
+            events["count"] = events.groupby("machine").cumcount().astype(np.int32) + 1
+        else:
+            events["event_time"] = events["datetime"]
+        return events
+
+    def _process_chunk(
+        self, chunk: pd.DataFrame, tail: pd.DataFrame
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        window = self.window_hours
+        chunk = chunk.assign(machine=self._codes(chunk["machineID"]), carried=False)
+        combined = pd.concat([tail, chunk], ignore_index=True) if len(tail) else chunk
+        combined = combined.sort_values(["machine", "datetime"], kind="stable", ignore_index=True)
+
+        # Rolling over the machine-sorted frame and masking windows that span two
+        # machines avoids a per-machine groupby.
+        rolling = combined[AZURE_SENSORS].rolling(window, min_periods=window)
+        means = rolling.mean().astype(np.float32)
+        stds = rolling.std(ddof=0).astype(np.float32)
+        machine = combined["machine"].to_numpy()
+        complete = np.zeros(len(combined), dtype=bool)
+        complete[window - 1 :] = machine[window - 1 :] == machine[: len(machine) - window + 1]
+
+        keep = (
+            complete
+            & ~combined["carried"].to_numpy(dtype=bool)
+            & (combined["datetime"].dt.hour.to_numpy() % self.sample_hours == 0)
+        )
+        samples = pd.DataFrame(
+            {
+                "datetime": combined["datetime"].to_numpy()[keep],
+                "machine": machine[keep],
+                **{name: combined[name].to_numpy()[keep] for name in AZURE_SENSORS},
+                **{
+                    f"{name}_mean_{window}h": means[name].to_numpy()[keep] for name in AZURE_SENSORS
+                },
+                **{f"{name}_std_{window}h": stds[name].to_numpy()[keep] for name in AZURE_SENSORS},
+            }
+        )
+
+        next_tail = combined.groupby("machine", sort=False).tail(window - 1)
+        next_tail = next_tail.assign(carried=True)
+        return self._join_side_tables(samples), next_tail
+
+    def _join_side_tables(self, samples: pd.DataFrame) -> pd.DataFrame:
+        window = pd.Timedelta(hours=self.window_hours)
+        samples = samples.sort_values(["datetime", "machine"], kind="stable", ignore_index=True)
+
+        def asof(left_on: pd.Series, right: pd.DataFrame, direction: str) -> pd.DataFrame:
+            left = pd.DataFrame({"datetime": left_on.to_numpy(), "machine": samples["machine"]})
+            merged: pd.DataFrame = pd.merge_asof(
+                left,
+                right,
+                on="datetime",
+                by="machine",
+                direction=direction,  # type: ignore[arg-type]
+            )
+            return merged
+
+        errors_now = asof(samples["datetime"], self._errors, "backward")["count"]
+        errors_before = asof(samples["datetime"] - window, self._errors, "backward")["count"]
+        last_maintenance = asof(samples["datetime"], self._maintenance, "backward")["event_time"]
+        next_failure = asof(samples["datetime"], self._failures, "forward")["event_time"]
+
+        days_since = (samples["datetime"] - last_maintenance).dt.total_seconds() / 86_400
+        horizon = pd.Timedelta(hours=self.horizon_hours)
+        machine_info = self._machines.reindex(samples["machine"].to_numpy())
+
+        features = samples.drop(columns=["datetime", "machine"])
+        features[f"errors_{self.window_hours}h"] = (
+            errors_now.fillna(0) - errors_before.fillna(0)
+        ).to_numpy(np.float32)
+        # -1 marks machines with no maintenance record yet.
+        features["days_since_maintenance"] = days_since.fillna(-1).to_numpy(np.float32)
+        features["age"] = machine_info["age"].to_numpy(np.float32)
+        features["model"] = machine_info["model"].to_numpy(np.float32)
+        features[AZURE_LABEL] = ((next_failure - samples["datetime"]) <= horizon).to_numpy(np.int8)
+        return features
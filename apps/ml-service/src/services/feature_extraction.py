@@ -0,0 +1,345 @@
+"""
+Feature extraction from the BioTrakr operational database.
+
+Builds the model's ``TrainingData`` feature frame from ``assets``,
+``asset_location_pings`` and ``maintenance_tasks`` (see the API's Prisma
+migrations). Rows are streamed through server-side cursors in fixed-size
+chunks into preallocated NumPy columns, and per-asset aggregates are computed
+vectorized, so extraction over months of telemetry never materializes the
+tables as Python objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+import structlog
+from sqlalchemy.engine import Connection, Engine
+
+from ..core.config import Settings
+from .data_loader import TrainingData
+
+logger = structlog.get_logger(__name__)
+
+FEATURE_NAMES = [
+    "usage_hours_last_week",
+    "maintenance_overdue_days",
+    "temperature_avg",
+    "vibration_score",
+    "age_years",
+]
+LABEL_NAME = "failed_within_30d"
+
+# Ping statuses that count towards usage hours.
+IN_USE_STATUSES = ("in_use",)
+# Maintenance task states that no longer count as outstanding work.
+CLOSED_MAINTENANCE_STATUSES = ("completed", "cancelled")
+# Corrective maintenance at these priorities is treated as a failure label.
+FAILURE_PRIORITIES = ("high", "critical")
+
+_MICROS_PER_HOUR = 3_600_000_000
+_MICROS_PER_DAY = 24 * _MICROS_PER_HOUR
+
+metadata = sa.MetaData()
+
+# Only the columns used for feature extraction; the tables are owned by the API.
+assets_table = sa.Table(
+    "assets",
+    metadata,
+    sa.Column("id", sa.Text, primary_key=True),
+    sa.Column("purchaseDate", sa.DateTime),
+    sa.Column("deletedAt", sa.DateTime),
+)
+pings_table = sa.Table(
+    "asset_location_pings",
+    metadata,
+    sa.Column("id", sa.Text, primary_key=True),
+    sa.Column("assetId", sa.Text, nullable=False),
+    sa.Column("status", sa.Text, nullable=False),
+    sa.Column("observedAt", sa.DateTime, nullable=False),
+    sa.Column("metadata", sa.JSON),
+)
+maintenance_table = sa.Table(
+    "maintenance_tasks",
+    metadata,
+    sa.Column("id", sa.Text, primary_key=True),
+    sa.Column("assetId", sa.Text, nullable=False),
+    sa.Column("status", sa.Text, nullable=False),
+    sa.Column("priority", sa.Text, nullable=False),
+    sa.Column("scheduledFor", sa.DateTime),
+    sa.Column("createdAt", sa.DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class ExtractionWindow:
+    """Time bounds for one extraction run (naive UTC, like the Prisma columns)."""
+
+    as_of: datetime
+    lookback: timedelta = timedelta(days=7)
+    label_horizon: timedelta = timedelta(days=30)
+    # Longest gap between pings attributed to the earlier ping's status.
+    max_ping_gap: timedelta = timedelta(hours=1)
+
+
+def create_feature_engine(settings: Settings) -> Engine:
+    """Create a pooled engine for ``settings.database_url``."""
+    options: dict[str, object] = {"pool_pre_ping": True}
+    if not settings.database_url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.feature_db_pool_size,
+            max_overflow=settings.feature_db_pool_size,
+        )
+    return sa.create_engine(settings.database_url, **options)
+
+
+class TelemetryFeatureExtractor:
+    """Extract per-asset model features from TimescaleDB/PostgreSQL.
+
+    Works against any SQLAlchemy engine; SQLite is sufficient for tests.
+    """
+
+    def __init__(self, engine: Engine, chunk_size: int = 10_000) -> None:
+        self._engine = engine
+        self._chunk_size = max(1, chunk_size)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> TelemetryFeatureExtractor:
+        return cls(create_feature_engine(settings), chunk_size=settings.feature_db_chunk_size)
+
+    def extract(self, window: ExtractionWindow) -> tuple[TrainingData, list[str]]:
+        """Build features for every active asset as of ``window.as_of``.
+
+        Returns:
+            Tuple of (TrainingData, asset IDs in row order)
+        """
+        with self._engine.connect() as conn:
+            asset_ids, purchase_dates = self._load_assets(conn)
+            index = {asset_id: position for position, asset_id in enumerate(asset_ids)}
+            n_assets = len(asset_ids)
+
+            usage, temperature, vibration = self._ping_features(conn, window, index, n_assets)
+            overdue = self._overdue_days(conn, window, index, n_assets)
+            labels = self._failure_labels(conn, window, index, n_assets)
+
+        as_of = _epoch_micros([window.as_of])[0]
+        age_years = (as_of - purchase_dates) / _MICROS_PER_DAY / 365.25
+
+        features = pd.DataFrame(
+            {
+                "usage_hours_last_week": usage,
+                "maintenance_overdue_days": overdue,
+                "temperature_avg": _fill_missing(temperature),
+                "vibration_score": _fill_missing(vibration),
+                "age_years": _fill_missing(age_years),
+            },
+            columns=FEATURE_NAMES,
+        )
+
+        logger.info("features.extracted", assets=n_assets, as_of=window.as_of.isoformat())
+        return (
+            TrainingData(
+                features=features,
+                labels=pd.Series(labels, name=LABEL_NAME),
+                feature_names=list(FEATURE_NAMES),
+            ),
+            asset_ids,
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _load_assets(self, conn: Connection) -> tuple[list[str], np.ndarray]:
+        query = (
+            sa.select(assets_table.c.id, assets_table.c.purchaseDate)
+            .where(assets_table.c.deletedAt.is_(None))
+            .order_by(assets_table.c.id)
+        )
+        asset_ids: list[str] = []
+        purchase_dates: list[datetime | None] = []
+        for chunk in self._stream(conn, query):
+            for asset_id, purchased in chunk:
+                asset_ids.append(asset_id)
+                purchase_dates.append(purchased)
+        return asset_ids, _epoch_micros(purchase_dates)
+
+    def _ping_features(
+        self,
+        conn: Connection,
+        window: ExtractionWindow,
+        index: dict[str, int],
+        n_assets: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        start = window.as_of - window.lookback
+        in_window = sa.and_(
+            pings_table.c.observedAt >= start, pings_table.c.observedAt < window.as_of
+        )
+        payload = pings_table.c["metadata"]
+        query = (
+            sa.select(
+                pings_table.c.assetId,
+                pings_table.c.observedAt,
+                pings_table.c.status.in_(IN_USE_STATUSES),
+                payload["temperature_celsius"].as_float(),
+                payload["vibration_rms"].as_float(),
+            )
+            .where(in_window)
+            .order_by(pings_table.c.assetId, pings_table.c.observedAt)
+        )
+        expected = conn.execute(
+            sa.select(sa.func.count()).select_from(pings_table).where(in_window)
+        ).scalar_one()
+
+        columns = _ColumnBuffer(
+            int(expected),
+            codes=np.int64,
+            observed=np.float64,
+            in_use=np.bool_,
+            temperature=np.float64,
+            vibration=np.float64,
+        )
+        for chunk in self._stream(conn, query):
+            asset_col, observed_col, in_use_col, temperature_col, vibration_col = zip(
+                *chunk, strict=True
+            )
+            columns.append(
+                codes=[index.get(asset_id, -1) for asset_id in asset_col],
+                observed=_epoch_micros(observed_col),
+                in_use=np.array(in_use_col, dtype=np.bool_),
+                temperature=np.array(temperature_col, dtype=np.float64),
+                vibration=np.array(vibration_col, dtype=np.float64),
+            )
+
+        codes, observed, in_use, temperature, vibration = columns.view(
+            "codes", "observed", "in_use", "temperature", "vibration"
+        )
+        known = codes >= 0
+        codes, observed, in_use = codes[known], observed[known], in_use[known]
+        temperature, vibration = temperature[known], vibration[known]
+
+        # Rows are ordered by (asset, time): each ping's status holds until the
+        # next ping of the same asset (or the window end), capped at max_ping_gap.
+        as_of_us = _epoch_micros([window.as_of])[0]
+        next_observed = np.append(observed[1:], as_of_us)
+        last_of_asset = np.append(codes[1:] != codes[:-1], True)
+        next_observed[last_of_asset] = as_of_us
+        max_gap_us = window.max_ping_gap / timedelta(microseconds=1)
+        gap_hours = np.minimum(next_observed - observed, max_gap_us) / _MICROS_PER_HOUR
+        usage = np.bincount(codes, weights=gap_hours * in_use, minlength=n_assets)
+
+        return (
+            usage,
+            _grouped_mean(codes, temperature, n_assets),
+            _grouped_mean(codes, vibration, n_assets),
+        )
+
+    def _overdue_days(
+        self,
+        conn: Connection,
+        window: ExtractionWindow,
+        index: dict[str, int],
+        n_assets: int,
+    ) -> np.ndarray:
+        query = sa.select(maintenance_table.c.assetId, maintenance_table.c.scheduledFor).where(
+            maintenance_table.c.status.not_in(CLOSED_MAINTENANCE_STATUSES),
+            maintenance_table.c.scheduledFor < window.as_of,
+        )
+        overdue = np.zeros(n_assets, dtype=np.float64)
+        as_of = _epoch_micros([window.as_of])[0]
+        for chunk in self._stream(conn, query):
+            asset_col, scheduled_col = zip(*chunk, strict=True)
+            codes = np.array([index.get(asset_id, -1) for asset_id in asset_col], dtype=np.int64)
+            days = (as_of - _epoch_micros(scheduled_col)) / _MICROS_PER_DAY
+            known = codes >= 0
+            np.maximum.at(overdue, codes[known], days[known])
+        return np.floor(overdue)
+
+    def _failure_labels(
+        self,
+        conn: Connection,
+        window: ExtractionWindow,
+        index: dict[str, int],
+        n_assets: int,
+    ) -> np.ndarray:
+        query = (
+            sa.select(maintenance_table.c.assetId)
+            .where(
+                maintenance_table.c.priority.in_(FAILURE_PRIORITIES),
+                maintenance_table.c.createdAt >= window.as_of,
+                maintenance_table.c.createdAt < window.as_of + window.label_horizon,
+            )
+            .distinct()
+        )
+        labels = np.zeros(n_assets, dtype=np.int64)
+        for chunk in self._stream(conn, query):
+            codes = [index[asset_id] for (asset_id,) in chunk if asset_id in index]
+            labels[codes] = 1
+        return labels
+
+    def _stream(self, conn: Connection, query: sa.Select[Any]) -> Iterator[Sequence[Any]]:
+        streaming = conn.execution_options(stream_results=True, yield_per=self._chunk_size)
+        result = streaming.execute(query)
+        yield from result.partitions()
+
+
+class _ColumnBuffer:
+    """Preallocated NumPy columns filled chunk by chunk.
+
+    Sized from a ``COUNT(*)`` up front; grows geometrically if rows arrive
+    between the count and the fetch.
+    """
+
+    def __init__(self, capacity: int, **dtypes: type[np.generic]) -> None:
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+        self._size = 0
+
+    def append(self, **values: Sequence[object] | np.ndarray) -> None:
+        count = len(next(iter(values.values())))
+        end = self._size + count
+        capacity = len(next(iter(self._columns.values())))
+        if end > capacity:
+            new_capacity = max(end, capacity * 2)
+            for name, column in self._columns.items():
+                grown = np.empty(new_capacity, dtype=column.dtype)
+                grown[: self._size] = column[: self._size]
+                self._columns[name] = grown
+
+        for name, column in self._columns.items():
+            column[self._size : end] = values[name]
+        self._size = end
+
+    def view(self, *names: str) -> tuple[np.ndarray, ...]:
+        return tuple(self._columns[name][: self._size] for name in names)
+
+
+def _epoch_micros(values: Sequence[datetime | None]) -> np.ndarray:
+    """Naive UTC datetimes as float microseconds since the epoch (NaN when missing)."""
+    stamps = np.array(values, dtype="datetime64[us]")
+    micros = stamps.astype(np.int64).astype(np.float64)
+    micros[np.isnat(stamps)] = np.nan
+    return micros
+
+
+def _grouped_mean(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    present = ~np.isnan(values)
+    totals = np.bincount(codes[present], weights=values[present], minlength=n_groups)
+    counts = np.bincount(codes[present], minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means: np.ndarray = totals / counts
+    return means
+
+
+def _fill_missing(values: np.ndarray) -> np.ndarray:
+    """Replace NaNs with the column median (or 0 if nothing was observed)."""
+    values = np.asarray(values, dtype=np.float64)
+    missing = np.isnan(values)
+    if missing.any():
+        fill = float(np.median(values[~missing])) if (~missing).any() else 0.0
+        values = np.where(missing, fill, values)
+    return values
@@ -0,0 +1,335 @@
+"""
+Incrementally maintained rolling-window asset features.
+
+Keeps the model's per-asset features current as telemetry events arrive
+instead of recomputing them from raw history for every scoring run. Windowed
+aggregates live in per-asset ring buffers of fixed-width time buckets: new
+events are added to their bucket and buckets that fall out of the window are
+subtracted from running totals, so both updates and reads are O(1) per asset.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .feature_extraction import FEATURE_NAMES
+
+_SECONDS_PER_DAY = 86_400.0
+_SECONDS_PER_YEAR = 365.25 * _SECONDS_PER_DAY
+
+# Windowed quantities kept per asset and bucket, in ring-buffer order.
+_WINDOWED = (
+    "usage_seconds",
+    "temperature_sum",
+    "temperature_count",
+    "vibration_sum",
+    "vibration_count",
+)
+
+
+class RollingFeatureMaterializer:
+    """Per-asset sliding-window aggregates backed by NumPy arrays.
+
+    Timestamps are epoch seconds. Events older than the window are ignored;
+    late events that still fall inside the window are added to their bucket.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 7 * _SECONDS_PER_DAY,
+        bucket_seconds: float = 3600.0,
+        max_ping_gap_seconds: float = 3600.0,
+        initial_capacity: int = 1024,
+    ) -> None:
+        self.window_seconds = float(window_seconds)
+        self.bucket_seconds = float(bucket_seconds)
+        self.max_ping_gap_seconds = float(max_ping_gap_seconds)
+        self._n_buckets = max(1, int(np.ceil(self.window_seconds / self.bucket_seconds)))
+        self._index: dict[str, int] = {}
+        self._asset_ids: list[str] = []
+        # Absolute number of the newest bucket; older buckets in the ring are still live.
+        self._head = -1
+        self._latest = np.nan
+
+        capacity = max(1, initial_capacity)
+        self._buckets = {name: np.zeros((capacity, self._n_buckets)) for name in _WINDOWED}
+        self._totals = {name: np.zeros(capacity) for name in _WINDOWED}
+        # Fleet-wide running totals, so that sensor fallbacks need no scan over assets.
+        self._fleet_totals = dict.fromkeys(_WINDOWED, 0.0)
+        self._last_ping = np.full(capacity, np.nan)
+        self._last_in_use = np.zeros(capacity, dtype=bool)
+        self._purchased_at = np.full(capacity, np.nan)
+        self._overdue_since = np.full(capacity, np.nan)
+        # Median purchase date of the assets that have one; recomputed lazily.
+        self._median_purchased_at: float | None = None
+        # Open maintenance tasks per asset (task id -> due timestamp); typically tiny.
+        self._open_tasks: list[dict[str, float]] = []
+
+    @property
+    def asset_ids(self) -> list[str]:
+        return list(self._asset_ids)
+
+    @property
+    def feature_names(self) -> list[str]:
+        return list(FEATURE_NAMES)
+
+    # ------------------------------------------------------------------
+    # Event ingestion
+    # ------------------------------------------------------------------
+    def register_asset(self, asset_id: str, purchased_at: float | None = None) -> None:
+        row = self._row(asset_id)
+        if purchased_at is not None:
+            self._purchased_at[row] = purchased_at
+            self._median_purchased_at = None
+
+    def record_ping(
+        self,
+        asset_id: str,
+        observed_at: float,
+        in_use: bool,
+        temperature: float | None = None,
+        vibration: float | None = None,
+    ) -> None:
+        """Apply one ``asset_location_pings`` event."""
+        row = self._row(asset_id)
+        self.advance_to(observed_at)
+
+        last = self._last_ping[row]
+        if not np.isnan(last) and observed_at >= last:
+            # The previous status held until this ping, up to the gap cap.
+            if self._last_in_use[row]:
+                held = min(observed_at - last, self.max_ping_gap_seconds)
+                self._add(row, last, "usage_seconds", held)
+        if np.isnan(last) or observed_at >= last:
+            self._last_ping[row] = observed_at
+            self._last_in_use[row] = in_use
+
+        if temperature is not None:
+            self._add(row, observed_at, "temperature_sum", temperature)
+            self._add(row, observed_at, "temperature_count", 1.0)
+        if vibration is not None:
+            self._add(row, observed_at, "vibration_sum", vibration)
+            self._add(row, observed_at, "vibration_count", 1.0)
+
+    def record_maintenance(
+        self, asset_id: str, task_id: str, scheduled_for: float | None, closed: bool
+    ) -> None:
+        """Apply a ``maintenance_tasks`` insert or status change."""
+        row = self._row(asset_id)
+        tasks = self._open_tasks[row]
+        if closed or scheduled_for is None:
+            tasks.pop(task_id, None)
+        else:
+            tasks[task_id] = scheduled_for
+        self._overdue_since[row] = min(tasks.values()) if tasks else np.nan
+
+    def advance_to(self, now: float) -> None:
+        """Expire buckets that have left the window ending at ``now``."""
+        if not now <= self._latest:
+            self._latest = now
+        bucket = int(now // self.bucket_seconds)
+        if bucket <= self._head:
+            return
+
+        n_assets = len(self._asset_ids)
+        if self._head < 0 or bucket - self._head >= self._n_buckets:
+            for name in _WINDOWED:
+                self._buckets[name][:n_assets] = 0.0
+                self._totals[name][:n_assets] = 0.0
+                self._fleet_totals[name] = 0.0
+        else:
+            expired = np.arange(self._head + 1, bucket + 1) % self._n_buckets
+            for name in _WINDOWED:
+                buckets = self._buckets[name]
+                removed = buckets[:n_assets, expired].sum(axis=1)
+                self._totals[name][:n_assets] -= removed
+                self._fleet_totals[name] -= float(removed.sum())
+                buckets[:n_assets, expired] = 0.0
+        self._head = bucket
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def features_for(self, asset_id: str, now: float | None = None) -> np.ndarray:
+        """Current feature vector for one asset, in ``FEATURE_NAMES`` order."""
+        row: np.ndarray = self.feature_matrix([asset_id], now=now)[0]
+        return row
+
+    def feature_matrix(self, asset_ids: Sequence[str], now: float | None = None) -> np.ndarray:
+        """Gather current feature rows for ``asset_ids``.
+
+        ``now`` (default: the newest event time) only affects the
+        point-in-time features: the in-use time since each asset's last ping
+        (capped at ``max_ping_gap_seconds``), overdue days and age. Missing
+        sensor averages fall back to the fleet-wide window average and missing
+        purchase dates to the median purchase date, as in
+        :class:`~.feature_extraction.TelemetryFeatureExtractor`.
+        """
+        rows = np.array([self._index[asset_id] for asset_id in asset_ids], dtype=np.intp)
+        reference = self._latest if now is None else now
+        totals = self._totals
+        fleet = self._fleet_totals
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            temperature = totals["temperature_sum"][rows] / totals["temperature_count"][rows]
+            vibration = totals["vibration_sum"][rows] / totals["vibration_count"][rows]
+        fleet_temperature = _ratio(fleet["temperature_sum"], fleet["temperature_count"])
+        fleet_vibration = _ratio(fleet["vibration_sum"], fleet["vibration_count"])
+
+        # The status of the last ping holds until ``reference``, like the window end offline.
+        last_ping = self._last_ping[rows]
+        open_seconds = np.where(
+            self._last_in_use[rows] & (last_ping >= reference - self.window_seconds),
+            np.clip(reference - last_ping, 0.0, self.max_ping_gap_seconds),
+            0.0,
+        )
+
+        overdue = np.floor(
+            np.maximum(reference - self._overdue_since[rows], 0.0) / _SECONDS_PER_DAY
+        )
+        purchased_at = self._purchased_at[rows]
+        age = np.where(
+            np.isnan(purchased_at),
+            (reference - self._median_purchase()) / _SECONDS_PER_YEAR,
+            (reference - purchased_at) / _SECONDS_PER_YEAR,
+        )
+
+        return np.column_stack(
+            [
+                (totals["usage_seconds"][rows] + open_seconds) / 3600.0,
+                np.nan_to_num(overdue, nan=0.0),
+                np.where(np.isnan(temperature), fleet_temperature, temperature),
+                np.where(np.isnan(vibration), fleet_vibration, vibration),
+                np.nan_to_num(age, nan=0.0),
+            ]
+        )
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def snapshot(self, path: Path) -> None:
+        """Write the full state to ``path`` (``.npz``), atomically."""
+        n_assets = len(self._asset_ids)
+        task_rows, task_ids, task_due = [], [], []
+        for row, tasks in enumerate(self._open_tasks):
+            for task_id, due in tasks.items():
+                task_rows.append(row)
+                task_ids.append(task_id)
+                task_due.append(due)
+
+        arrays: dict[str, Any] = {
+            "config": np.array(
+                [
+                    self.window_seconds,
+                    self.bucket_seconds,
+                    self.max_ping_gap_seconds,
+                    self._head,
+                    self._latest,
+                ]
+            ),
+            "asset_ids": np.array(self._asset_ids, dtype=str),
+            "last_ping": self._last_ping[:n_assets],
+            "last_in_use": self._last_in_use[:n_assets],
+            "purchased_at": self._purchased_at[:n_assets],
+            "task_rows": np.array(task_rows, dtype=np.int64),
+            "task_ids": np.array(task_ids, dtype=str),
+            "task_due": np.array(task_due, dtype=np.float64),
+        }
+        for name in _WINDOWED:
+            arrays[f"buckets_{name}"] = self._buckets[name][:n_assets]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        with temporary.open("wb") as handle:
+            np.savez(handle, **arrays)
+        temporary.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> RollingFeatureMaterializer:
+        with np.load(path, allow_pickle=False) as state:
+            window_seconds, bucket_seconds, max_gap, head, latest = state["config"].tolist()
+            asset_ids = state["asset_ids"].tolist()
+            materializer = cls(
+                window_seconds=window_seconds,
+                bucket_seconds=bucket_seconds,
+                max_ping_gap_seconds=max_gap,
+                initial_capacity=len(asset_ids),
+            )
+            for asset_id in asset_ids:
+                materializer._row(asset_id)
+
+            n_assets = len(asset_ids)
+            materializer._head = int(head)
+            materializer._latest = latest
+            materializer._last_ping[:n_assets] = state["last_ping"]
+            materializer._last_in_use[:n_assets] = state["last_in_use"]
+            materializer._purchased_at[:n_assets] = state["purchased_at"]
+            for name in _WINDOWED:
+                buckets = state[f"buckets_{name}"]
+                materializer._buckets[name][:n_assets] = buckets
+                materializer._totals[name][:n_assets] = buckets.sum(axis=1)
+                materializer._fleet_totals[name] = float(buckets.sum())
+            for row, task_id, due in zip(
+                state["task_rows"].tolist(),
+                state["task_ids"].tolist(),
+                state["task_due"].tolist(),
+                strict=True,
+            ):
+                materializer._open_tasks[row][task_id] = due
+            for row, tasks in enumerate(materializer._open_tasks):
+                if tasks:
+                    materializer._overdue_since[row] = min(tasks.values())
+
+        return materializer
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _row(self, asset_id: str) -> int:
+        row = self._index.get(asset_id)
+        if row is not None:
+            return row
+
+        row = len(self._asset_ids)
+        if row == len(self._last_ping):
+            self._grow(2 * row)
+        self._index[asset_id] = row
+        self._asset_ids.append(asset_id)
+        self._open_tasks.append({})
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        def extend(array: np.ndarray, fill: float | bool) -> np.ndarray:
+            grown = np.full((capacity, *array.shape[1:]), fill, dtype=array.dtype)
+            grown[: len(array)] = array
+            return grown
+
+        self._buckets = {name: extend(array, 0.0) for name, array in self._buckets.items()}
+        self._totals = {name: extend(array, 0.0) for name, array in self._totals.items()}
+        self._last_ping = extend(self._last_ping, np.nan)
+        self._last_in_use = extend(self._last_in_use, False)
+        self._purchased_at = extend(self._purchased_at, np.nan)
+        self._overdue_since = extend(self._overdue_since, np.nan)
+
+    def _add(self, row: int, timestamp: float, name: str, amount: float) -> None:
+        bucket = int(timestamp // self.bucket_seconds)
+        if bucket <= self._head - self._n_buckets or bucket > self._head:
+            return
+        self._buckets[name][row, bucket % self._n_buckets] += amount
+        self._totals[name][row] += amount
+        self._fleet_totals[name] += amount
+
+    def _median_purchase(self) -> float:
+        if self._median_purchased_at is None:
+            purchased_at = self._purchased_at[: len(self._asset_ids)]
+            known = purchased_at[~np.isnan(purchased_at)]
+            self._median_purchased_at = float(np.median(known)) if known.size else np.nan
+        return self._median_purchased_at
+
+
+def _ratio(total: float, count: float) -> float:
+    return total / count if count else np.nan
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from functools import partial
+from typing import TYPE_CHECKING
+
+import structlog
+
+from ..core.config import Settings
+from ..core.metrics import TRAINING_JOB_SECONDS
+
+if TYPE_CHECKING:
+    from .trainer import TrainedModelInfo
+
+logger = structlog.get_logger(__name__)
+
+# Finished jobs kept for status queries before the oldest are forgotten.
+MAX_FINISHED_JOBS = 100
+
+
+class TrainingJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class TrainingJobParams:
+    num_samples: int = 500
+    random_state: int = 42
+    search: bool = False
+
+
+@dataclass
+class TrainingJob:
+    job_id: str
+    params: TrainingJobParams
+    status: TrainingJobStatus = TrainingJobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    model_version: str | None = None
+    run_id: str | None = None
+    metrics: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (TrainingJobStatus.SUCCEEDED, TrainingJobStatus.FAILED)
+
+
+class TrainingQueueFullError(RuntimeError):
+    """Raised when no more training jobs can be queued."""
+
+
+def run_training_job(settings: Settings, params: TrainingJobParams) -> TrainedModelInfo:
+    """Entry point executed in a worker process."""
+    from ..core.logging import configure_logging
+    from .data_loader import generate_synthetic_dataset
+    from .hyperparameter_search import SearchConfig
+    from .trainer import train_and_register_model
+
+    configure_logging(settings.log_level)
+    dataset = generate_synthetic_dataset(
+        num_samples=params.num_samples, random_state=params.random_state
+    )
+    search = SearchConfig.from_settings(settings) if params.search else None
+    return train_and_register_model(settings=settings, data=dataset, search=search)
+
+
+class TrainingJobManager:
+    """Run training jobs in a process pool and track their status.
+
+    Training is CPU bound and holds the GIL for long stretches, so it runs in
+    separate processes to keep inference threads responsive. At most
+    ``max_concurrent`` jobs run at once; further jobs wait in a bounded queue,
+    and triggering a job identical to one that has not finished returns the
+    existing job instead of queuing a duplicate.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        on_success: Callable[[TrainedModelInfo], None] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._on_success = on_success
+        self._max_concurrent = max(1, settings.training_max_concurrent_jobs)
+        self._max_queued = max(0, settings.training_max_queued_jobs)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_concurrent,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, TrainingJob] = OrderedDict()
+        self._pending: deque[str] = deque()
+        self._running = 0
+        self._closed = False
+
+    def submit(self, params: TrainingJobParams) -> TrainingJob:
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.finished and job.params == params:
+                    logger.info("training.job_deduplicated", job_id=job.job_id)
+                    return job
+
+            if len(self._pending) >= self._max_queued and self._running >= self._max_concurrent:
+                raise TrainingQueueFullError(
+                    f"Training queue is full ({self._max_queued} jobs waiting)"
+                )
+
+            job = TrainingJob(job_id=uuid.uuid4().hex, params=params)
+            self._jobs[job.job_id] = job
+            self._pending.append(job.job_id)
+            logger.info("training.job_queued", job_id=job.job_id)
+            self._dispatch()
+            return job
+
+    def get(self, job_id: str) -> TrainingJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[TrainingJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _dispatch(self) -> None:
+        """Start queued jobs while capacity allows. Caller must hold the lock."""
+        while not self._closed and self._pending and self._running < self._max_concurrent:
+            job = self._jobs[self._pending.popleft()]
+            job.status = TrainingJobStatus.RUNNING
+            job.started_at = datetime.now(UTC)
+            self._running += 1
+
+            future = self._executor.submit(run_training_job, self._settings, job.params)
+            future.add_done_callback(partial(self._complete, job.job_id))
+
+    def _complete(self, job_id: str, future: Future[TrainedModelInfo]) -> None:
+        info: TrainedModelInfo | None = None
+        error: str | None = None
+        try:
+            info = future.result()
+        except Exception as exc:  # noqa: BLE001
+            error = str(exc) or type(exc).__name__
+
+        # Activate before the job reports success so clients that poll the status
+        # never see a finished job whose model is not yet served.
+        if info is not None and self._on_success is not None:
+            try:
+                self._on_success(info)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("training.job_activation_failed", job_id=job_id, error=str(exc))
+
+        with self._lock:
+            job = self._jobs[job_id]
+            job.finished_at = datetime.now(UTC)
+            self._running -= 1
+
+            if info is None:
+                job.status = TrainingJobStatus.FAILED
+                job.error = error
+                logger.warning("training.job_failed", job_id=job_id, error=error)
+            else:
+                job.status = TrainingJobStatus.SUCCEEDED
+                job.model_version = info.model_version
+                job.run_id = info.run_id
+                job.metrics = dict(info.metrics)
+                logger.info(
+                    "training.job_succeeded",
+                    job_id=job_id,
+                    model_version=info.model_version,
+                    run_id=info.run_id,
+                )
+
+            if job.started_at is not None:
+                TRAINING_JOB_SECONDS.labels(job.status.value).observe(
+                    (job.finished_at - job.started_at).total_seconds()
+                )
+
+            self._forget_finished()
+            self._dispatch()
+
+    def _forget_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
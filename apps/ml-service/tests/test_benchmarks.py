@@ -0,0 +1,39 @@
+import json
+
+from benchmarks.suite import compare, main
+
+
+def _results(**values):
+    return {
+        "results": [
+            {
+                "name": name,
+                "value": value,
+                "unit": "",
+                "lower_is_better": not name.endswith("_per_s"),
+            }
+            for name, value in values.items()
+        ]
+    }
+
+
+def test_compare_flags_only_regressions_beyond_tolerance():
+    baseline = _results(load_ms=100.0, predict_us=50.0, batch_rows_per_s=1000.0, gone_ms=1.0)
+    current = _results(load_ms=120.0, predict_us=70.0, batch_rows_per_s=700.0, new_ms=5.0)
+
+    regressions = compare(current, baseline, tolerance=0.25)
+
+    assert {regression.name for regression in regressions} == {"predict_us", "batch_rows_per_s"}
+    assert compare(baseline, baseline) == []
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(predict_us=50.0)))
+
+    current.write_text(json.dumps(_results(predict_us=52.0)))
+    assert main(["compare", str(current), str(baseline)]) == 0
+
+    current.write_text(json.dumps(_results(predict_us=80.0)))
+    assert main(["compare", str(current), str(baseline)]) == 1
+    assert "predict_us: 50.00 -> 80.00" in capsys.readouterr().out
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from src.models.compiled import CompiledGradientBoosting
+from src.models.registry import ModelRepository
+from src.services.data_loader import generate_synthetic_dataset
+from src.services.trainer import _build_pipeline
+
+
+@pytest.fixture(scope="module")
+def fitted_pipeline():
+    dataset = generate_synthetic_dataset(num_samples=400)
+    pipeline = _build_pipeline()
+    pipeline.fit(dataset.features, dataset.labels)
+    return pipeline, dataset
+
+
+def test_compiled_model_matches_sklearn_pipeline(fitted_pipeline):
+    pipeline, dataset = fitted_pipeline
+    compiled = CompiledGradientBoosting.from_pipeline(pipeline)
+
+    holdout = generate_synthetic_dataset(num_samples=2000, random_state=7).features
+    for frame in (dataset.features, holdout):
+        expected = pipeline.predict_proba(frame)[:, 1]
+        actual = compiled.predict_proba(frame.to_numpy())
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-9)
+
+
+def test_compiled_model_scores_single_row(fitted_pipeline):
+    pipeline, dataset = fitted_pipeline
+    compiled = CompiledGradientBoosting.from_pipeline(pipeline)
+
+    row = dataset.features.iloc[:1]
+    assert compiled.predict_proba(row.to_numpy())[0] == pytest.approx(
+        pipeline.predict_proba(row)[0, 1], abs=1e-9
+    )
+
+
+def test_compile_rejects_unsupported_models():
+    from sklearn.linear_model import LogisticRegression  # type: ignore[import-untyped]
+
+    dataset = generate_synthetic_dataset(num_samples=100)
+    model = LogisticRegression().fit(dataset.features, dataset.labels)
+    with pytest.raises(ValueError, match="GradientBoostingClassifier"):
+        CompiledGradientBoosting.from_pipeline(model)
+
+
+def test_repository_uses_compiled_backend(isolated_settings):
+    settings = isolated_settings.model_copy(update={"inference_backend": "compiled"})
+    repository = ModelRepository(settings=settings)
+    active = repository.active
+    assert active is not None and active.compiled is not None
+
+    rows = generate_synthetic_dataset(num_samples=50, random_state=3).features
+    outcomes = repository.predict_batch(rows.to_numpy().tolist())
+    expected = active.pipeline.predict_proba(rows)[:, 1]
+    actual = [outcome.prediction.probability for outcome in outcomes]
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("backend", ["sklearn", "compiled"])
+def test_single_predictions_reject_non_finite_features(isolated_settings, backend):
+    settings = isolated_settings.model_copy(update={"inference_backend": backend})
+    repository = ModelRepository(settings=settings)
+
+    for value in (float("nan"), float("inf"), float("-inf")):
+        for features in ([value] * 5, [30.0, 1.0, value, 0.3, 4.0]):
+            with pytest.raises(ValueError, match="finite"):
+                repository.predict(features)
+
+
+def test_single_prediction_route_rejects_nan_with_400(client):
+    response = client.post(
+        "/inference/predict-failure",
+        content=b'{"asset_id": "a", "features": [NaN, NaN, NaN, NaN, NaN]}',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Features must be finite numbers"
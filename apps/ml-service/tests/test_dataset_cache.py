@@ -0,0 +1,102 @@
+import os
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.dataset_cache import DatasetCache, main
+from src.services.dataset_loader import DatasetLoader, DatasetSource
+
+
+def _write_signals(root, scale=1.0):
+    rng = np.random.default_rng(0)
+    for fault in ("normal", "ball"):
+        (root / "cwru_bearing" / fault).mkdir(parents=True, exist_ok=True)
+        np.save(root / "cwru_bearing" / fault / "drive_end.npy", scale * rng.normal(size=4096))
+
+
+@pytest.fixture()
+def raw_dir(tmp_path):
+    _write_signals(tmp_path / "raw")
+    return tmp_path / "raw"
+
+
+def _load(loader, **kwargs):
+    return loader.load_dataset(DatasetSource.CWRU_BEARING, window_size=512, max_workers=1, **kwargs)
+
+
+def test_cache_hit_returns_memory_mapped_copy(raw_dir, tmp_path):
+    cache = DatasetCache(tmp_path / "cache", max_bytes=2**30)
+    loader = DatasetLoader(data_dir=raw_dir, cache=cache)
+
+    first, first_metadata = _load(loader)
+    second, second_metadata = _load(loader)
+
+    assert len(cache.entries()) == 1
+    pd.testing.assert_frame_equal(first.features, second.features)
+    pd.testing.assert_series_equal(first.labels, second.labels)
+    assert second.feature_names == first.feature_names
+    # A hit reports its own load time rather than the original load's.
+    assert replace(second_metadata, load_seconds=None) == replace(first_metadata, load_seconds=None)
+    assert second_metadata.load_seconds is not None
+    assert isinstance(second.features["rms"].to_numpy().base, np.memmap)
+
+
+def test_cache_key_tracks_kwargs_and_raw_files(raw_dir, tmp_path):
+    cache = DatasetCache(tmp_path / "cache", max_bytes=2**30)
+    loader = DatasetLoader(data_dir=raw_dir, cache=cache)
+    original, _ = _load(loader)
+    _load(loader, n_bands=4)
+    assert len(cache.entries()) == 2
+
+    signal = raw_dir / "cwru_bearing" / "ball" / "drive_end.npy"
+    stat = signal.stat()
+    _write_signals(raw_dir, scale=2.0)
+    os.utime(signal, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    rescaled, _ = _load(loader)
+    assert len(cache.entries()) == 3
+    # The worker count does not change the loaded arrays.
+    kwargs = {"window_size": 512}
+    assert DatasetCache.key(
+        DatasetSource.CWRU_BEARING, {**kwargs, "max_workers": 1}, raw_dir / "cwru_bearing"
+    ) == DatasetCache.key(
+        DatasetSource.CWRU_BEARING, {**kwargs, "max_workers": 8}, raw_dir / "cwru_bearing"
+    )
+    ball = (rescaled.labels == "ball").to_numpy()
+    np.testing.assert_allclose(
+        rescaled.features["rms"][ball], 2 * original.features["rms"][ball], rtol=1e-5
+    )
+
+
+def test_cache_evicts_least_recently_used(raw_dir, tmp_path):
+    cache = DatasetCache(tmp_path / "cache", max_bytes=2**30)
+    loader = DatasetLoader(data_dir=raw_dir, cache=cache)
+    _load(loader, n_bands=2)
+    _load(loader, n_bands=3)
+    sizes = {entry.kwargs["n_bands"]: entry.size_bytes for entry in cache.entries()}
+
+    # Age n_bands=3 explicitly (mtime granularity can tie), then hit n_bands=2.
+    entries = {entry.kwargs["n_bands"]: entry for entry in cache.entries()}
+    os.utime(cache.root / entries[3].key / "metadata.json", (1, 1))
+    _load(loader, n_bands=2)
+
+    # Room for two entries (n_bands=4 is one small column larger than n_bands=3).
+    cache.max_bytes = sizes[2] + sizes[3] + 1024
+    _load(loader, n_bands=4)
+    assert {entry.kwargs["n_bands"] for entry in cache.entries()} == {2, 4}
+
+
+def test_cache_cli_lists_and_purges(raw_dir, tmp_path, capsys):
+    cache = DatasetCache(tmp_path / "cache", max_bytes=2**30)
+    _load(DatasetLoader(data_dir=raw_dir, cache=cache))
+    key = cache.entries()[0].key
+
+    main(["--cache-dir", str(cache.root), "list"])
+    assert key[:16] in capsys.readouterr().out
+
+    assert cache.purge(source="nasa_cmapss") == 0
+    main(["--cache-dir", str(cache.root), "purge", "--key", key[:16]])
+    assert "Purged 1 entries" in capsys.readouterr().out
+    assert cache.entries() == []
@@ -0,0 +1,208 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.dataset_loader import DatasetLoader, DatasetSource
+
+
+def _write_cmapss(path, lengths, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for unit, length in enumerate(lengths, start=1):
+        for cycle in range(1, length + 1):
+            values = rng.normal(loc=500.0, scale=5.0, size=24)
+            rows.append(" ".join([str(unit), str(cycle), *(f"{v:.4f}" for v in values)]) + " ")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(rows) + "\n")
+
+
+@pytest.fixture()
+def cmapss_dir(tmp_path):
+    _write_cmapss(tmp_path / "nasa_cmapss" / "FD001" / "train_FD001.txt", lengths=[60, 45, 8])
+    return tmp_path
+
+
+def test_load_nasa_cmapss(cmapss_dir):
+    loader = DatasetLoader(data_dir=cmapss_dir)
+    data, metadata = loader.load_dataset(DatasetSource.NASA_CMAPSS, subset="FD001", window=10)
+
+    # Unit 3 is shorter than the window and contributes no samples.
+    assert metadata.num_samples == (60 - 9) + (45 - 9)
+    assert metadata.num_features == len(data.feature_names) == 1 + 3 + 21 * 3
+    assert set(data.labels) <= {"critical", "poor", "fair", "good", "excellent"}
+
+    raw = pd.read_csv(
+        cmapss_dir / "nasa_cmapss" / "FD001" / "train_FD001.txt", sep=r"\s+", header=None
+    )
+    unit_one = raw[raw[0] == 1]
+    expected_mean = unit_one[5].rolling(10).mean().dropna().to_numpy()
+    expected_std = unit_one[5].rolling(10).std(ddof=0).dropna().to_numpy()
+    np.testing.assert_allclose(data.features["sensor_1_mean_10"].to_numpy()[:51], expected_mean)
+    np.testing.assert_allclose(data.features["sensor_1_std_10"].to_numpy()[:51], expected_std)
+
+    # The last cycle of each unit has zero remaining life.
+    first_unit_labels = data.labels.to_numpy()[:51]
+    assert first_unit_labels[-1] == "critical"
+    assert first_unit_labels[0] == DatasetLoader.map_rul_to_health_status(60 - 10)
+
+
+def test_load_nasa_cmapss_uses_parquet_cache(cmapss_dir):
+    loader = DatasetLoader(data_dir=cmapss_dir)
+    first, _ = loader.load_dataset(DatasetSource.NASA_CMAPSS, window=10)
+    cache_files = list((cmapss_dir / "nasa_cmapss" / "FD001").glob("*.parquet"))
+    assert len(cache_files) == 1
+
+    second, _ = loader.load_dataset(DatasetSource.NASA_CMAPSS, window=10)
+    pd.testing.assert_frame_equal(first.features, second.features)
+    pd.testing.assert_series_equal(first.labels, second.labels)
+
+
+def test_cmapss_windows_are_reduced_without_materializing_them(tmp_path):
+    import tracemalloc
+
+    from src.services.dataset_loader import _parse_cmapss
+
+    rows, window = 20_000, 30
+    table = np.random.default_rng(0).normal(500.0, 5.0, size=(rows, 26))
+    table[:, 0] = np.arange(rows) // 250 + 1
+    table[:, 1] = np.arange(rows) % 250 + 1
+    train_file = tmp_path / "train_FD001.txt"
+    np.savetxt(train_file, table, fmt="%.4f")
+
+    tracemalloc.start()
+    try:
+        frame = _parse_cmapss(train_file, window)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(frame) == (rows // 250) * (250 - window + 1)
+    # Gathering every window at once would take rows x 21 sensors x window x 8 bytes.
+    assert peak < rows * 21 * window * 8 / 3
+
+
+def _write_azure_pm(path, machines=3, hours=96, seed=0):
+    rng = np.random.default_rng(seed)
+    path.mkdir(parents=True, exist_ok=True)
+    start = pd.Timestamp("2015-01-01 06:00:00")
+    times = pd.date_range(start, periods=hours, freq="h")
+    pd.DataFrame(
+        {
+            "datetime": np.tile(times, machines),
+            "machineID": np.repeat(np.arange(1, machines + 1), hours),
+            "volt": rng.normal(170, 10, machines * hours),
+            "rotate": rng.normal(450, 50, machines * hours),
+            "pressure": rng.normal(100, 10, machines * hours),
+            "vibration": rng.normal(40, 5, machines * hours),
+        }
+    ).to_csv(path / "PdM_telemetry.csv", index=False)
+    pd.DataFrame(
+        {
+            "datetime": [start + pd.Timedelta(hours=h) for h in (10, 30, 40)],
+            "machineID": [1, 1, 2],
+            "errorID": ["error1", "error2", "error1"],
+        }
+    ).to_csv(path / "PdM_errors.csv", index=False)
+    pd.DataFrame(
+        {"datetime": [start + pd.Timedelta(hours=12)], "machineID": [1], "comp": ["comp1"]}
+    ).to_csv(path / "PdM_maint.csv", index=False)
+    pd.DataFrame(
+        {"datetime": [start + pd.Timedelta(hours=60)], "machineID": [2], "failure": ["comp1"]}
+    ).to_csv(path / "PdM_failures.csv", index=False)
+    pd.DataFrame(
+        {
+            "machineID": np.arange(1, machines + 1),
+            "model": ["model3", "model4", "model3"][:machines],
+            "age": np.arange(machines) + 5,
+        }
+    ).to_csv(path / "PdM_machines.csv", index=False)
+
+
+def test_load_azure_pm_is_chunk_invariant(tmp_path):
+    _write_azure_pm(tmp_path / "azure_pm")
+    loader = DatasetLoader(data_dir=tmp_path)
+
+    data, metadata = loader.load_dataset(DatasetSource.AZURE_PM, chunk_rows=37)
+    whole, traced = DatasetLoader(data_dir=tmp_path, measure_memory=True).load_dataset(
+        DatasetSource.AZURE_PM, chunk_rows=10_000
+    )
+    assert traced.peak_memory_mb is not None and traced.peak_memory_mb > 0
+
+    # Windows start once 24 hours are available; samples are taken every 3 hours.
+    assert metadata.num_samples == 3 * 24
+    assert metadata.load_seconds is not None and metadata.peak_memory_mb is None
+    assert (data.features.dtypes == np.float32).all()
+
+    def ordered(training_data):
+        frame = training_data.features.assign(label=training_data.labels)
+        return frame.sort_values(list(frame.columns), ignore_index=True)
+
+    pd.testing.assert_frame_equal(ordered(data), ordered(whole))
+
+
+def test_load_azure_pm_joins_side_tables(tmp_path):
+    _write_azure_pm(tmp_path / "azure_pm")
+    data, _ = DatasetLoader(data_dir=tmp_path).load_dataset(DatasetSource.AZURE_PM)
+    telemetry = pd.read_csv(tmp_path / "azure_pm" / "PdM_telemetry.csv", parse_dates=["datetime"])
+    frame = data.features.assign(label=data.labels)
+
+    # Locate the machine-1 sample at hour 36 (first complete window is hour 23).
+    machine_one = telemetry[telemetry["machineID"] == 1].reset_index(drop=True)
+    row = frame[np.isclose(frame["volt"], np.float32(machine_one.loc[36, "volt"]))].iloc[0]
+    expected_mean = machine_one["volt"].iloc[13:37].mean()
+    assert row["volt_mean_24h"] == pytest.approx(expected_mean, rel=1e-5)
+    assert row["errors_24h"] == 1  # only the hour-30 error falls within (12, 36]
+    assert row["days_since_maintenance"] == pytest.approx(1.0)
+    assert row["age"] == 5
+
+    # Machine 2 fails at hour 60: samples at hours 36..60 are positive.
+    assert data.labels.sum() == len(range(36, 61, 3))
+
+
+@pytest.fixture()
+def cwru_dir(tmp_path):
+    rng = np.random.default_rng(0)
+    t = np.arange(8 * 1024) / 12_000
+    signals = {
+        "normal": np.sin(2 * np.pi * 300 * t),
+        "inner_race": np.sin(2 * np.pi * 300 * t) + (rng.random(t.size) > 0.995) * 5.0,
+        "ball": 0.5 * np.sin(2 * np.pi * 4_500 * t),
+    }
+    for fault, signal in signals.items():
+        (tmp_path / "cwru_bearing" / fault).mkdir(parents=True)
+        np.save(tmp_path / "cwru_bearing" / fault / "drive_end.npy", signal)
+    return tmp_path
+
+
+def test_load_cwru_bearing_features(cwru_dir):
+    loader = DatasetLoader(data_dir=cwru_dir)
+    data, metadata = loader.load_dataset(
+        DatasetSource.CWRU_BEARING, window_size=1024, n_bands=4, max_workers=1
+    )
+
+    assert metadata.num_samples == 3 * 8
+    assert metadata.label_distribution == {"ball": 8, "inner_race": 8, "normal": 8}
+    features = data.features.assign(label=data.labels)
+
+    normal = features[features["label"] == "normal"]
+    np.testing.assert_allclose(normal["rms"], 1 / np.sqrt(2), rtol=1e-2)
+    np.testing.assert_allclose(normal["kurtosis"], 1.5, rtol=1e-2)
+    np.testing.assert_allclose(normal["crest_factor"], np.sqrt(2), rtol=1e-2)
+
+    # 300 Hz falls in the lowest band, 4.5 kHz in the highest (Nyquist 6 kHz).
+    bands = [f"band_energy_{i}" for i in range(4)]
+    assert (normal[bands].to_numpy().argmax(axis=1) == 0).all()
+    ball = features[features["label"] == "ball"]
+    assert (ball[bands].to_numpy().argmax(axis=1) == 3).all()
+
+    impulsive = features[features["label"] == "inner_race"]
+    assert impulsive["kurtosis"].min() > normal["kurtosis"].max()
+
+
+def test_load_cwru_bearing_process_pool_matches_serial(cwru_dir):
+    loader = DatasetLoader(data_dir=cwru_dir)
+    serial, _ = loader.load_dataset(DatasetSource.CWRU_BEARING, step=512, max_workers=1)
+    parallel, _ = loader.load_dataset(DatasetSource.CWRU_BEARING, step=512, max_workers=2)
+
+    pd.testing.assert_frame_equal(serial.features, parallel.features)
+    pd.testing.assert_series_equal(serial.labels, parallel.labels)
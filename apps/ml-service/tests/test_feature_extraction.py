@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+
+from src.services.feature_extraction import (
+    FEATURE_NAMES,
+    ExtractionWindow,
+    TelemetryFeatureExtractor,
+    assets_table,
+    maintenance_table,
+    metadata,
+    pings_table,
+)
+
+AS_OF = datetime(2025, 11, 10)
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'telemetry.db'}")
+    metadata.create_all(engine)
+
+    pings = []
+    # asset-a is in use for 10 pings 30 minutes apart, then goes idle.
+    for step in range(12):
+        pings.append(
+            {
+                "id": f"a-{step}",
+                "assetId": "asset-a",
+                "status": "in_use" if step < 10 else "available",
+                "observedAt": AS_OF - timedelta(days=2) + timedelta(minutes=30 * step),
+                "metadata": {"temperature_celsius": 20.0 + step, "vibration_rms": 0.5},
+            }
+        )
+    # asset-b has no sensor metadata and an old ping outside the window.
+    pings.append(
+        {
+            "id": "b-0",
+            "assetId": "asset-b",
+            "status": "in_use",
+            "observedAt": AS_OF - timedelta(days=30),
+            "metadata": None,
+        }
+    )
+
+    with engine.begin() as conn:
+        conn.execute(
+            sa.insert(assets_table),
+            [
+                {"id": "asset-a", "purchaseDate": AS_OF - timedelta(days=730), "deletedAt": None},
+                {"id": "asset-b", "purchaseDate": None, "deletedAt": None},
+                {"id": "asset-c", "purchaseDate": AS_OF, "deletedAt": AS_OF},
+            ],
+        )
+        conn.execute(sa.insert(pings_table), pings)
+        conn.execute(
+            sa.insert(maintenance_table),
+            [
+                {
+                    "id": "m-1",
+                    "assetId": "asset-b",
+                    "status": "scheduled",
+                    "priority": "medium",
+                    "scheduledFor": AS_OF - timedelta(days=4, hours=6),
+                    "createdAt": AS_OF - timedelta(days=10),
+                },
+                {
+                    "id": "m-2",
+                    "assetId": "asset-a",
+                    "status": "completed",
+                    "priority": "medium",
+                    "scheduledFor": AS_OF - timedelta(days=20),
+                    "createdAt": AS_OF - timedelta(days=25),
+                },
+                {
+                    "id": "m-3",
+                    "assetId": "asset-a",
+                    "status": "scheduled",
+                    "priority": "critical",
+                    "scheduledFor": AS_OF + timedelta(days=2),
+                    "createdAt": AS_OF + timedelta(days=1),
+                },
+            ],
+        )
+    return engine
+
+
+def test_extracts_features_per_asset(engine):
+    # A tiny chunk size forces several fetches and buffer appends.
+    extractor = TelemetryFeatureExtractor(engine, chunk_size=4)
+    data, asset_ids = extractor.extract(ExtractionWindow(as_of=AS_OF))
+
+    assert asset_ids == ["asset-a", "asset-b"]
+    assert data.feature_names == FEATURE_NAMES
+    frame = data.features.set_axis(asset_ids)
+
+    assert frame.loc["asset-a", "usage_hours_last_week"] == pytest.approx(5.0)
+    assert frame.loc["asset-b", "usage_hours_last_week"] == 0.0
+    assert frame.loc["asset-a", "temperature_avg"] == pytest.approx(25.5)
+    assert frame.loc["asset-b", "temperature_avg"] == pytest.approx(25.5)
+    assert frame.loc["asset-a", "vibration_score"] == pytest.approx(0.5)
+    assert frame.loc["asset-a", "maintenance_overdue_days"] == 0
+    assert frame.loc["asset-b", "maintenance_overdue_days"] == 4
+    assert frame.loc["asset-a", "age_years"] == pytest.approx(730 / 365.25)
+
+    assert data.labels.tolist() == [1, 0]
+
+
+def test_extracted_features_match_model_input(engine, client):
+    data, _ = TelemetryFeatureExtractor(engine).extract(ExtractionWindow(as_of=AS_OF))
+    outcomes = client.app.state.model_repository.predict_batch(data.features.to_numpy().tolist())
+    assert all(outcome.prediction is not None for outcome in outcomes)
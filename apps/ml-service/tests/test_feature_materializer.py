@@ -0,0 +1,161 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+import sqlalchemy as sa
+
+from src.services.feature_extraction import (
+    ExtractionWindow,
+    TelemetryFeatureExtractor,
+    assets_table,
+    maintenance_table,
+    metadata,
+    pings_table,
+)
+from src.services.feature_materializer import RollingFeatureMaterializer
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+
+def _feed(materializer: RollingFeatureMaterializer) -> None:
+    materializer.register_asset("asset-a", purchased_at=0.0)
+    materializer.register_asset("asset-b", purchased_at=2 * 365.25 * DAY)
+    for step in range(10):
+        materializer.record_ping(
+            "asset-a", 10 * DAY + step * 1800, in_use=True, temperature=20.0 + step, vibration=0.5
+        )
+    materializer.record_ping("asset-a", 10 * DAY + 10 * 1800, in_use=False)
+    materializer.record_ping("asset-b", 10 * DAY, in_use=True)
+    materializer.record_maintenance("asset-b", "m-1", scheduled_for=8 * DAY, closed=False)
+
+
+def test_features_track_new_events():
+    materializer = RollingFeatureMaterializer()
+    _feed(materializer)
+
+    features = materializer.feature_matrix(["asset-a", "asset-b"], now=11 * DAY)
+    usage, overdue, temperature, vibration, age = features.T
+
+    # asset-b has been in use since its only ping, credited up to the one-hour gap cap.
+    np.testing.assert_allclose(usage, [5.0, 1.0])
+    np.testing.assert_allclose(overdue, [0.0, 3.0])
+    # asset-b has no sensor readings and falls back to the fleet average.
+    np.testing.assert_allclose(temperature, [24.5, 24.5])
+    np.testing.assert_allclose(vibration, [0.5, 0.5])
+    assert age[0] == pytest.approx(11 / 365.25)
+
+    materializer.record_maintenance("asset-b", "m-1", scheduled_for=8 * DAY, closed=True)
+    assert materializer.features_for("asset-b", now=11 * DAY)[1] == 0.0
+
+
+def test_old_buckets_expire_from_the_window():
+    materializer = RollingFeatureMaterializer()
+    _feed(materializer)
+
+    materializer.record_ping("asset-a", 16 * DAY + 12 * HOUR, in_use=False, temperature=30.0)
+    usage, _, temperature, _, _ = materializer.features_for("asset-a")
+    assert usage == pytest.approx(5.0)
+    assert temperature == pytest.approx((sum(20.0 + s for s in range(10)) + 30.0) / 11)
+
+    materializer.record_ping("asset-a", 18 * DAY, in_use=False)
+    usage, _, temperature, _, _ = materializer.features_for("asset-a")
+    assert usage == 0.0
+    assert temperature == pytest.approx(30.0)
+
+
+def test_snapshot_round_trip(tmp_path):
+    materializer = RollingFeatureMaterializer(initial_capacity=1)
+    _feed(materializer)
+    path = tmp_path / "state" / "features.npz"
+    materializer.snapshot(path)
+
+    restored = RollingFeatureMaterializer.load(path)
+    assert restored.asset_ids == materializer.asset_ids
+    np.testing.assert_allclose(
+        restored.feature_matrix(restored.asset_ids, now=11 * DAY),
+        materializer.feature_matrix(materializer.asset_ids, now=11 * DAY),
+    )
+
+    restored.record_ping("asset-a", 10 * DAY + 11 * 1800, in_use=True)
+    assert restored.features_for("asset-a")[0] == pytest.approx(5.0)
+
+
+def test_features_match_the_offline_extractor(tmp_path):
+    as_of = datetime(2025, 11, 10)
+    assets = [
+        {"id": "asset-a", "purchaseDate": as_of - timedelta(days=730), "deletedAt": None},
+        {"id": "asset-b", "purchaseDate": None, "deletedAt": None},
+        {"id": "asset-c", "purchaseDate": as_of - timedelta(days=100), "deletedAt": None},
+    ]
+    pings = [
+        {
+            "id": f"a-{step}",
+            "assetId": "asset-a",
+            "status": "in_use" if step < 10 else "available",
+            "observedAt": as_of - timedelta(days=2, minutes=-30 * step),
+            "metadata": {"temperature_celsius": 20.0 + step, "vibration_rms": 0.5},
+        }
+        for step in range(12)
+    ]
+    # asset-b has no sensor readings and is still in use at the window end.
+    pings += [
+        {
+            "id": "b-0",
+            "assetId": "asset-b",
+            "status": "in_use",
+            "observedAt": as_of - timedelta(hours=3),
+            "metadata": None,
+        },
+        {
+            "id": "b-1",
+            "assetId": "asset-b",
+            "status": "in_use",
+            "observedAt": as_of - timedelta(minutes=20),
+            "metadata": None,
+        },
+    ]
+    tasks = [
+        {
+            "id": "m-1",
+            "assetId": "asset-c",
+            "status": "scheduled",
+            "priority": "medium",
+            "scheduledFor": as_of - timedelta(days=4, hours=6),
+            "createdAt": as_of - timedelta(days=10),
+        }
+    ]
+
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'telemetry.db'}")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sa.insert(assets_table), assets)
+        conn.execute(sa.insert(pings_table), pings)
+        conn.execute(sa.insert(maintenance_table), tasks)
+    offline, asset_ids = TelemetryFeatureExtractor(engine).extract(ExtractionWindow(as_of=as_of))
+
+    def epoch(moment: datetime) -> float:
+        return moment.replace(tzinfo=UTC).timestamp()
+
+    materializer = RollingFeatureMaterializer()
+    for asset in assets:
+        purchased = asset["purchaseDate"]
+        materializer.register_asset(asset["id"], epoch(purchased) if purchased else None)
+    for ping in sorted(pings, key=lambda ping: ping["observedAt"]):
+        readings = ping["metadata"] or {}
+        materializer.record_ping(
+            ping["assetId"],
+            epoch(ping["observedAt"]),
+            in_use=ping["status"] == "in_use",
+            temperature=readings.get("temperature_celsius"),
+            vibration=readings.get("vibration_rms"),
+        )
+    for task in tasks:
+        materializer.record_maintenance(
+            task["assetId"], task["id"], epoch(task["scheduledFor"]), closed=False
+        )
+
+    np.testing.assert_allclose(
+        materializer.feature_matrix(asset_ids, now=epoch(as_of)),
+        offline.features.to_numpy(),
+    )
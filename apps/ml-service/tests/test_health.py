@@ -2,3 +2,13 @@ def test_health_endpoint(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
+
+
+def test_readiness_reports_registry_model(client):
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "serving_registry"
+    assert body["registry_sync"] == "synced"
+    assert body["model_version"] == client.app.state.model_repository.active.model_version
+    assert body["startup_seconds"] >= 0
@@ -0,0 +1,70 @@
+import json
+
+import mlflow
+import pytest
+
+from src.services.data_loader import generate_synthetic_dataset
+from src.services.hyperparameter_search import SearchConfig, run_search
+from src.services.trainer import train_and_register_model
+
+SMALL_GRID = {"n_estimators": [300], "learning_rate": [0.05, 0.2], "max_depth": [2]}
+
+
+def test_random_search_samples_the_grid():
+    config = SearchConfig(strategy="random", n_iter=5)
+    candidates = config.candidates()
+    assert len(candidates) == 5
+    assert candidates == SearchConfig(strategy="random", n_iter=5).candidates()
+    assert len(SearchConfig().candidates()) == 2 * 3 * 3 * 3
+
+
+def test_search_ranks_candidates_with_early_stopping():
+    data = generate_synthetic_dataset(num_samples=300)
+    config = SearchConfig(param_grid=SMALL_GRID, cv_folds=3, max_workers=1, n_iter_no_change=5)
+
+    result = run_search(data.features, data.labels, config)
+
+    assert len(result.candidates) == 2
+    assert result.best == result.candidates[0]
+    assert result.candidates[0].mean_auc >= result.candidates[1].mean_auc
+    assert all(candidate.fit_seconds > 0 for candidate in result.candidates)
+    # Early stopping leaves most of the 300 requested trees unbuilt.
+    assert all(candidate.mean_estimators < 300 for candidate in result.candidates)
+
+
+def test_search_process_pool_matches_serial():
+    data = generate_synthetic_dataset(num_samples=200)
+    serial = run_search(
+        data.features, data.labels, SearchConfig(param_grid=SMALL_GRID, cv_folds=2, max_workers=1)
+    )
+    parallel = run_search(
+        data.features, data.labels, SearchConfig(param_grid=SMALL_GRID, cv_folds=2, max_workers=2)
+    )
+    assert [c.params for c in parallel.candidates] == [c.params for c in serial.candidates]
+    assert [c.mean_auc for c in parallel.candidates] == pytest.approx(
+        [c.mean_auc for c in serial.candidates]
+    )
+
+
+def test_train_with_search_logs_best_config(isolated_settings):
+    data = generate_synthetic_dataset(num_samples=300)
+    config = SearchConfig(param_grid=SMALL_GRID, cv_folds=3, max_workers=1)
+
+    info = train_and_register_model(isolated_settings, data=data, search=config)
+
+    run = mlflow.get_run(info.run_id)
+    assert run.data.params["holdout_rows"] == "60"
+    assert run.data.params["learning_rate"] in ("0.05", "0.2")
+    assert 0 < run.data.metrics["cv_auc"] <= 1
+    assert run.data.metrics["auc"] == pytest.approx(info.metrics["auc"])
+
+    results = json.loads(mlflow.artifacts.load_text(f"runs:/{info.run_id}/search_results.json"))
+    assert len(results["candidates"]) == 2
+    assert results["best"]["params"]["learning_rate"] == float(run.data.params["learning_rate"])
+
+
+def test_train_skips_holdout_for_tiny_datasets(isolated_settings):
+    info = train_and_register_model(
+        isolated_settings, data=generate_synthetic_dataset(num_samples=10)
+    )
+    assert mlflow.get_run(info.run_id).data.params["holdout_rows"] == "0"
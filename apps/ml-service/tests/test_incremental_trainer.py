@@ -0,0 +1,84 @@
+import tracemalloc
+
+import mlflow
+import numpy as np
+import pytest
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+
+from src.models.registry import ModelRepository
+from src.services.data_loader import generate_synthetic_dataset
+from src.services.incremental_trainer import (
+    StreamingBinaryMetrics,
+    iter_chunks,
+    train_incremental_and_register_model,
+)
+
+
+def _synthetic_chunks(chunks, chunk_rows=2_000):
+    for index in range(chunks):
+        data = generate_synthetic_dataset(num_samples=chunk_rows, random_state=index)
+        yield data.features, data.labels
+
+
+def test_streaming_metrics_match_batch_metrics():
+    rng = np.random.default_rng(0)
+    labels = rng.random(20_000) < 0.3
+    probabilities = np.clip(0.3 * labels + rng.random(20_000) * 0.7, 0, 1)
+
+    metrics = StreamingBinaryMetrics()
+    for start in range(0, len(labels), 3_000):
+        metrics.update(labels[start : start + 3_000], probabilities[start : start + 3_000])
+    result = metrics.compute()
+
+    assert result["auc"] == pytest.approx(roc_auc_score(labels, probabilities), abs=1e-3)
+    assert result["accuracy"] == pytest.approx(accuracy_score(labels, probabilities >= 0.5))
+    assert result["f1"] == pytest.approx(f1_score(labels, probabilities >= 0.5))
+
+
+def test_incremental_training_registers_model(isolated_settings):
+    data = generate_synthetic_dataset(num_samples=6_000)
+
+    info = train_incremental_and_register_model(isolated_settings, iter_chunks(data, 500))
+
+    assert info.feature_names == data.feature_names
+    # Progressive validation includes rows scored by the barely trained early model.
+    assert info.metrics["auc"] > 0.75
+    params = mlflow.get_run(info.run_id).data.params
+    assert params["validation_mode"] == "progressive"
+    assert params["chunks"] == "12"
+
+    repository = ModelRepository(settings=isolated_settings)
+    assert repository.active.model_version == info.model_version
+    assert 0 <= repository.predict([45.0, 8.0, 21.0, 0.8, 9.0]).probability <= 1
+
+
+def test_incremental_training_scores_validation_stream(isolated_settings):
+    validation = generate_synthetic_dataset(num_samples=2_000, random_state=99)
+
+    info = train_incremental_and_register_model(
+        isolated_settings,
+        _synthetic_chunks(5),
+        validation_chunks=iter_chunks(validation, 700),
+    )
+
+    params = mlflow.get_run(info.run_id).data.params
+    assert params["validation_mode"] == "holdout_stream"
+    assert params["validation_rows"] == "2000"
+    assert params["training_rows"] == "10000"
+    probabilities = info.pipeline.predict_proba(validation.features)[:, 1]
+    assert info.metrics["auc"] == pytest.approx(
+        roc_auc_score(validation.labels, probabilities), abs=1e-3
+    )
+
+
+def test_incremental_training_memory_does_not_grow_with_rows(isolated_settings):
+    def peak_mb(chunks):
+        tracemalloc.start()
+        try:
+            train_incremental_and_register_model(isolated_settings, _synthetic_chunks(chunks))
+            return tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak_mb(5), peak_mb(50)
+    assert large < small * 1.5 + 1
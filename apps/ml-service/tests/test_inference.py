@@ -1,5 +1,9 @@
+import json
+
 import pytest
 
+from src.core.config import get_settings
+
 
 @pytest.mark.parametrize(
     "features",
@@ -16,3 +20,102 @@ def test_inference_predict_failure(client, features):
     assert body["asset_id"] == "asset-123"
     assert 0 <= body["prediction"]["probability"] <= 1
     assert body["prediction"]["model_version"]
+
+
+def test_inference_predict_failure_batch(client):
+    payload = {
+        "items": [
+            {"asset_id": "asset-1", "features": [30.0, 1.0, 20.0, 0.3, 4.0]},
+            {"asset_id": "asset-2", "features": [48.0, 6.0, 24.0]},
+            {"asset_id": "asset-3", "features": [48.0, 6.0, 24.0, 0.75, 10.0]},
+        ]
+    }
+    response = client.post("/inference/predict-failure/batch", json=payload)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["asset_id"] for result in results] == ["asset-1", "asset-2", "asset-3"]
+
+    assert 0 <= results[0]["prediction"]["probability"] <= 1
+    assert results[1]["prediction"] is None
+    assert "Expected 5 features" in results[1]["error"]
+    assert 0 <= results[2]["prediction"]["probability"] <= 1
+
+
+def test_inference_batch_matches_single_predictions(client):
+    features = [[30.0, 1.0, 20.0, 0.3, 4.0], [48.0, 6.0, 24.0, 0.75, 10.0]]
+    batch = client.post(
+        "/inference/predict-failure/batch",
+        json={"items": [{"asset_id": f"asset-{i}", "features": f} for i, f in enumerate(features)]},
+    ).json()["results"]
+
+    for row, result in zip(features, batch, strict=True):
+        single = client.post(
+            "/inference/predict-failure", json={"asset_id": "asset", "features": row}
+        ).json()
+        assert result["prediction"]["probability"] == pytest.approx(
+            single["prediction"]["probability"]
+        )
+
+
+def test_inference_batch_rejects_oversized_batches(client):
+    limit = get_settings().inference_max_batch_size
+    items = [{"asset_id": "asset", "features": [30.0, 1.0, 20.0, 0.3, 4.0]}] * (limit + 1)
+    response = client.post("/inference/predict-failure/batch", json={"items": items})
+    assert response.status_code == 413
+
+
+def test_inference_predict_failure_stream(client):
+    records = [
+        '{"asset_id": "asset-1", "features": [30.0, 1.0, 20.0, 0.3, 4.0]}',
+        "not json",
+        "",
+        '{"asset_id": "asset-2", "features": [48.0, 6.0]}',
+        '{"asset_id": "asset-3", "features": [48.0, 6.0, 24.0, 0.75, 10.0]}',
+    ]
+    body = "\n".join(records).encode()
+
+    with client.stream(
+        "POST",
+        "/inference/predict-failure/stream",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    ) as response:
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert lines[0]["asset_id"] == "asset-1"
+    assert 0 <= lines[0]["prediction"]["probability"] <= 1
+    assert lines[1]["line"] == 2
+    assert lines[2]["asset_id"] == "asset-2" and lines[2]["error"]
+    assert lines[3]["asset_id"] == "asset-3" and lines[3]["prediction"]
+
+    summary = lines[-1]["summary"]
+    assert summary["rows"] == 4
+    assert summary["scored"] == 2
+    assert summary["errors"] == 2
+
+
+def test_inference_stream_skips_overlong_lines(client, monkeypatch):
+    from src.core.config import get_settings
+
+    settings = get_settings().model_copy(update={"inference_stream_max_line_bytes": 100})
+    monkeypatch.setitem(client.app.dependency_overrides, get_settings, lambda: settings)
+    record = '{"asset_id": "asset-1", "features": [30.0, 1.0, 20.0, 0.3, 4.0]}'
+
+    def body():
+        yield (record + "\n").encode()
+        # One 10 KB line without a newline until the last chunk.
+        for _ in range(10):
+            yield b"x" * 1000
+        yield b"\n" + record.encode()
+
+    response = client.post(
+        "/inference/predict-failure/stream",
+        content=body(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert lines[0]["prediction"] and lines[2]["prediction"]
+    assert lines[1] == {"line": 2, "error": "Line exceeds 100 bytes"}
+    assert lines[-1]["summary"]["errors"] == 1
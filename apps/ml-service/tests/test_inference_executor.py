@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from src.models.batcher import MicroBatcher
+from src.models.executor import (
+    InferenceExecutor,
+    QueueDeadlineExceededError,
+    TooManyInFlightError,
+)
+
+ROW = [30.0, 1.0, 20.0, 0.3, 4.0]
+
+
+def test_executor_rejects_requests_beyond_max_in_flight():
+    executor = InferenceExecutor(workers=1, max_in_flight=2, max_queue_ms=10_000)
+    release = threading.Event()
+
+    async def scenario() -> list[object]:
+        admitted = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        stats = executor.stats()
+        assert (stats.in_flight, stats.running, stats.queued) == (2, 1, 1)
+
+        with pytest.raises(TooManyInFlightError):
+            await executor.run(release.wait)
+
+        release.set()
+        return list(await asyncio.gather(*admitted))
+
+    try:
+        assert asyncio.run(scenario()) == [True, True]
+    finally:
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats.in_flight, stats.completed, stats.rejected_in_flight) == (0, 2, 1)
+
+
+def test_executor_rejects_requests_queued_past_the_deadline():
+    executor = InferenceExecutor(workers=1, max_in_flight=10, max_queue_ms=20)
+    scored: list[str] = []
+
+    async def scenario() -> None:
+        slow = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+        await asyncio.sleep(0.01)
+        started = time.perf_counter()
+        with pytest.raises(QueueDeadlineExceededError):
+            await executor.run(scored.append, "late")
+        # Rejected at the deadline, not when the busy thread frees up.
+        assert time.perf_counter() - started < 0.15
+        await slow
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert scored == []
+    stats = executor.stats()
+    assert (stats.in_flight, stats.rejected_queue_timeout) == (0, 1)
+
+
+def test_overloaded_prediction_returns_429_with_retry_after(client, monkeypatch):
+    executor = InferenceExecutor(workers=1, max_in_flight=1, max_queue_ms=10_000)
+    monkeypatch.setattr(client.app.state, "inference_executor", executor)
+    release = threading.Event()
+    occupier = threading.Thread(target=asyncio.run, args=(executor.run(release.wait),))
+    occupier.start()
+    try:
+        while executor.stats().in_flight == 0:
+            time.sleep(0.01)
+
+        for path, payload in (
+            ("/inference/predict-failure", {"asset_id": "a", "features": ROW}),
+            ("/inference/predict-failure/batch", {"items": [{"asset_id": "a", "features": ROW}]}),
+        ):
+            response = client.post(path, json=payload)
+            assert response.status_code == 429
+            assert response.headers["retry-after"] == "1"
+    finally:
+        release.set()
+        occupier.join()
+        executor.shutdown()
+
+    stats = client.get("/inference/stats").json()["executor"]
+    assert stats["rejected_in_flight"] == 2
+    assert stats["in_flight"] == 0
+    assert "inference_rejections_total" in client.get("/metrics").text
+
+
+def test_micro_batched_predictions_take_an_in_flight_slot(client, monkeypatch):
+    executor = InferenceExecutor(workers=1, max_in_flight=1, max_queue_ms=10_000)
+    batcher = MicroBatcher(client.app.state.model_repository, max_batch_size=8, max_wait_ms=1)
+    monkeypatch.setattr(client.app.state, "inference_executor", executor)
+    monkeypatch.setattr(client.app.state, "micro_batcher", batcher)
+    batcher.start()
+    payload = {"asset_id": "a", "features": ROW}
+    try:
+        assert client.post("/inference/predict-failure", json=payload).status_code == 200
+        with executor.admit():
+            response = client.post("/inference/predict-failure", json=payload)
+        assert response.status_code == 429
+    finally:
+        batcher.stop()
+        executor.shutdown()
+
+    assert batcher.stats().items == 1
+    assert executor.stats().in_flight == 0
+
+
+def test_streams_take_an_in_flight_slot(client, monkeypatch):
+    executor = InferenceExecutor(workers=1, max_in_flight=1, max_queue_ms=10_000)
+    monkeypatch.setattr(client.app.state, "inference_executor", executor)
+    body = json.dumps({"asset_id": "a", "features": ROW}).encode()
+
+    def stream():
+        return client.post(
+            "/inference/predict-failure/stream",
+            content=body,
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+    try:
+        with executor.admit():
+            response = stream()
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+
+        assert stream().status_code == 200
+    finally:
+        executor.shutdown()
+
+    assert executor.stats().in_flight == 0
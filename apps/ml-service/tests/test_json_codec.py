@@ -0,0 +1,85 @@
+import pytest
+
+from src.schemas.prediction import FailurePredictionRequest
+
+ROW = [30.0, 1.0, 20.0, 0.3, 4.0]
+
+
+@pytest.fixture
+def fast_codec(client, monkeypatch):
+    monkeypatch.setattr(client.app.state, "json_codec", "fast")
+    return client
+
+
+def test_fast_codec_matches_the_standard_codec(client, monkeypatch):
+    single = {"asset_id": "pump-1", "features": ROW}
+    batch = {"items": [{"asset_id": "a", "features": ROW}, {"asset_id": "b", "features": [1.0]}]}
+
+    standard = [
+        client.post("/inference/predict-failure", json=single),
+        client.post("/inference/predict-failure/batch", json=batch),
+    ]
+    monkeypatch.setattr(client.app.state, "json_codec", "fast")
+    fast = [
+        client.post("/inference/predict-failure", json=single),
+        client.post("/inference/predict-failure/batch", json=batch),
+    ]
+
+    for expected, response in zip(standard, fast, strict=True):
+        assert response.status_code == expected.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == expected.json()
+    assert fast[1].json()["results"][1]["error"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'{"asset_id": "a", "features": []}',
+        b'{"asset_id": "a", "features": ["x"]}',
+        b'{"asset_id": "a", "features": [1.0',
+    ],
+)
+def test_fast_codec_rejects_invalid_bodies_with_422(fast_codec, content):
+    response = fast_codec.post(
+        "/inference/predict-failure",
+        content=content,
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
+
+
+def test_fast_codec_keeps_the_openapi_schema(client, monkeypatch):
+    standard = client.app.openapi()
+    monkeypatch.setattr(client.app.state, "json_codec", "fast")
+    monkeypatch.setattr(client.app, "openapi_schema", None)
+    assert client.app.openapi() == standard
+
+    operation = standard["paths"]["/inference/predict-failure"]["post"]
+    body_schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert body_schema == {"$ref": "#/components/schemas/FailurePredictionRequest"}
+
+
+def test_fast_codec_decodes_bodies_into_the_request_model(client, monkeypatch):
+    nan = b'{"asset_id": "a", "features": [NaN, 1.0, 20.0, 0.3, 4.0]}'
+    standard = client.post(
+        "/inference/predict-failure", content=nan, headers={"content-type": "application/json"}
+    )
+    monkeypatch.setattr(client.app.state, "json_codec", "fast")
+    fast = client.post(
+        "/inference/predict-failure", content=nan, headers={"content-type": "application/json"}
+    )
+    assert fast.status_code == standard.status_code == 400
+
+    validated = []
+    original = FailurePredictionRequest.model_validate_json
+
+    def spy(body, *args, **kwargs):
+        validated.append(body)
+        return original(body, *args, **kwargs)
+
+    monkeypatch.setattr(FailurePredictionRequest, "model_validate_json", spy)
+    response = client.post("/inference/predict-failure", json={"asset_id": "a", "features": ROW})
+    assert response.status_code == 200
+    assert len(validated) == 1
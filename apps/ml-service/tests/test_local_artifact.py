@@ -0,0 +1,113 @@
+import json
+
+import joblib
+import numpy as np
+import pytest
+
+from src.models.local_artifact import (
+    FEATURE_NAMES_ARTIFACT,
+    LocalArtifact,
+    flat_artifact_path,
+    load_local_artifact,
+    save_local_artifact,
+)
+from src.models.registry import ModelRepository
+from src.services.data_loader import generate_synthetic_dataset
+from src.services.trainer import _build_pipeline, train_and_register_model
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return generate_synthetic_dataset(num_samples=300)
+
+
+def test_flat_artifact_is_mapped_read_only_and_matches_pipeline(tmp_path, dataset):
+    pipeline = _build_pipeline().fit(dataset.features, dataset.labels)
+    path = tmp_path / "model.joblib"
+    save_local_artifact(
+        path,
+        LocalArtifact(
+            model=pipeline, feature_names=dataset.feature_names, model_version="3", run_id="abc"
+        ),
+    )
+    assert flat_artifact_path(path).exists()
+
+    artifact = load_local_artifact(path, prefer_flat=True)
+    assert artifact is not None and artifact.model is None
+    assert (artifact.feature_names, artifact.model_version, artifact.run_id) == (
+        dataset.feature_names,
+        "3",
+        "abc",
+    )
+    compiled = artifact.compiled
+    assert compiled is not None
+    assert not compiled.threshold.flags.writeable
+    assert not compiled.threshold.flags.owndata
+
+    expected = pipeline.predict_proba(dataset.features)[:, 1]
+    actual = compiled.predict_proba(dataset.features.to_numpy())
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-9)
+
+
+def test_uncompilable_model_replaces_flat_artifact_with_joblib_only(tmp_path, dataset):
+    path = tmp_path / "model.joblib"
+    gradient_boosting = _build_pipeline().fit(dataset.features, dataset.labels)
+    save_local_artifact(path, LocalArtifact(gradient_boosting, dataset.feature_names))
+
+    hist = _build_pipeline(backend="hist_gradient_boosting").fit(dataset.features, dataset.labels)
+    save_local_artifact(path, LocalArtifact(hist, dataset.feature_names))
+
+    assert not flat_artifact_path(path).exists()
+    artifact = load_local_artifact(path, prefer_flat=True)
+    assert artifact is not None and artifact.compiled is None
+    assert list(artifact.model.named_steps) == ["classifier"]
+
+
+def test_corrupt_flat_artifact_falls_back_to_joblib(tmp_path, dataset):
+    path = tmp_path / "model.joblib"
+    pipeline = _build_pipeline().fit(dataset.features, dataset.labels)
+    save_local_artifact(path, LocalArtifact(pipeline, dataset.feature_names))
+    flat_artifact_path(path).write_bytes(b"not a model")
+
+    artifact = load_local_artifact(path, prefer_flat=True)
+    assert artifact is not None and artifact.compiled is None
+    assert artifact.model is not None
+
+
+def test_repository_reuses_local_copy_of_registry_version(isolated_settings):
+    train_and_register_model(isolated_settings)
+    downloaded = ModelRepository(settings=isolated_settings).active
+    assert downloaded is not None and downloaded.pipeline is not None
+
+    # The sklearn backend needs the pipeline, so it unpickles the joblib copy.
+    unpickled = ModelRepository(settings=isolated_settings).active
+    assert unpickled is not None and unpickled.pipeline is not None
+    assert (unpickled.model_version, unpickled.source) == (downloaded.model_version, "registry")
+
+    compiled_settings = isolated_settings.model_copy(update={"inference_backend": "compiled"})
+    mapped = ModelRepository(settings=compiled_settings).active
+    assert mapped is not None
+    assert mapped.pipeline is None and mapped.compiled is not None
+    assert (mapped.model_version, mapped.run_id, mapped.source) == (
+        downloaded.model_version,
+        downloaded.run_id,
+        "registry",
+    )
+
+
+def test_embedded_feature_names_win_over_the_sidecar(tmp_path, dataset):
+    pipeline = _build_pipeline().fit(dataset.features, dataset.labels)
+    path = tmp_path / "model.joblib"
+    save_local_artifact(path, LocalArtifact(model=pipeline, feature_names=dataset.feature_names))
+    # As if another model's sidecar landed between this payload and its own.
+    sidecar = tmp_path / FEATURE_NAMES_ARTIFACT
+    sidecar.write_text(json.dumps(["other"]))
+
+    for prefer_flat in (False, True):
+        artifact = load_local_artifact(path, prefer_flat=prefer_flat)
+        assert artifact is not None and artifact.feature_names == dataset.feature_names
+
+    joblib.dump({"model": pipeline}, path)
+    sidecar.write_text(json.dumps(dataset.feature_names))
+    artifact = load_local_artifact(path)
+    assert artifact is not None and artifact.feature_names == dataset.feature_names
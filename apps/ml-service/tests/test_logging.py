@@ -0,0 +1,67 @@
+import io
+import json
+import logging
+
+import pytest
+import structlog
+
+from src.core.config import get_settings
+from src.core.logging import (
+    LOG_RECORDS_DROPPED,
+    LogWriter,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture()
+def restore_logging():
+    yield
+    settings = get_settings()
+    configure_logging(settings.log_level)
+
+
+def test_queue_mode_samples_prediction_events_but_keeps_warnings(capsys, restore_logging):
+    configure_logging("INFO", mode="queue", prediction_sample_rate=0.0)
+    logger = structlog.get_logger("test")
+
+    logger.info("prediction.success", probability=0.5)
+    logger.info("model.loaded", model_version="3")
+    logger.warning("prediction.failed", asset_id="asset-1")
+    logger.debug("model.debug_detail")
+    logging.getLogger("third_party").info("plain %s", "record")
+    shutdown_logging()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-1] == "plain record"
+    events = [json.loads(line) for line in lines[:-1]]
+    assert [(event["event"], event["level"]) for event in events] == [
+        ("model.loaded", "info"),
+        ("prediction.failed", "warning"),
+    ]
+    assert events[0]["model_version"] == "3"
+    assert "timestamp" in events[0]
+
+
+def test_sampled_prediction_events_record_the_rate(capsys, restore_logging):
+    configure_logging("INFO", mode="sync", prediction_sample_rate=0.999999)
+    structlog.get_logger("test").info("prediction.batch", batch_size=2)
+
+    event = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert event["event"] == "prediction.batch"
+    assert event["sample_rate"] == 0.999999
+
+
+def test_log_writer_drops_and_counts_when_full():
+    stream = io.StringIO()
+    writer = LogWriter(stream, max_queued=2)
+    dropped = LOG_RECORDS_DROPPED.labels("info")
+    before = dropped.value
+
+    for index in range(5):
+        writer.submit({"event": "prediction.success", "index": index}, "info")
+    assert dropped.value - before == 3
+
+    writer.start()
+    writer.stop()
+    assert [json.loads(line)["index"] for line in stream.getvalue().splitlines()] == [0, 1]
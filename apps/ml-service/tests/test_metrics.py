@@ -0,0 +1,116 @@
+import re
+import time
+
+import pytest
+
+from src.core.metrics import MetricsRegistry
+
+ROW = [30.0, 1.0, 20.0, 0.3, 4.0]
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    """Value of the first sample of ``name`` whose labels include ``labels``."""
+    for line in text.splitlines():
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})? (\S+)", line)
+        if match is None or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2) or ""))
+        if all(found.get(key) == value for key, value in labels.items()):
+            return float(match.group(3))
+    raise AssertionError(f"no {name} sample with {labels}")
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", "Jobs run.", ("queue",))
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    counter.labels('de"fault').inc(2)
+    for value in (0.05, 0.5, 5.0):
+        histogram.labels("/a").observe(value)
+
+    text = registry.render()
+    assert "# TYPE jobs counter" in text
+    assert 'jobs_total{queue="de\\"fault"} 2' in text
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+    assert _sample(text, "latency_seconds_sum", route="/a") == pytest.approx(5.55)
+
+    with pytest.raises(ValueError):
+        histogram.labels("/a", "extra")
+    with pytest.raises(ValueError):
+        registry.counter("jobs", "Duplicate.")
+
+
+def test_registry_renders_non_finite_values():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("reading", "Reading.", ("sensor",))
+    histogram = registry.histogram("size", "Size.", buckets=(1.0,))
+
+    for sensor, value in (("hot", float("inf")), ("cold", float("-inf")), ("off", float("nan"))):
+        gauge.labels(sensor).set(value)
+    histogram.labels().observe(float("inf"))
+
+    text = registry.render()
+    assert 'reading{sensor="hot"} +Inf' in text
+    assert 'reading{sensor="cold"} -Inf' in text
+    assert 'reading{sensor="off"} NaN' in text
+    assert 'size_bucket{le="+Inf"} 1' in text
+    assert "size_sum +Inf" in text
+    assert not re.search(r"\b(inf|nan)\b", text)
+
+
+def test_observation_overhead_is_microseconds():
+    histogram = MetricsRegistry().histogram("overhead_seconds", "Overhead.", ("a", "b"))
+    iterations = 20_000
+    started = time.perf_counter()
+    for _ in range(iterations):
+        histogram.labels("x", "y").observe(0.001)
+    per_observation = (time.perf_counter() - started) / iterations
+    # Typically ~1µs; the bound leaves room for slow CI machines.
+    assert per_observation < 50e-6
+
+
+def test_metrics_endpoint_reports_stages_by_route_and_version(client):
+    response = client.post(
+        "/inference/predict-failure", json={"asset_id": "asset-1", "features": ROW}
+    )
+    assert response.status_code == 200
+    version = response.json()["prediction"]["model_version"]
+    client.post(
+        "/inference/predict-failure/batch",
+        json={"items": [{"asset_id": "a", "features": ROW}, {"asset_id": "b", "features": [1.0]}]},
+    )
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    single = "/inference/predict-failure"
+    batch = "/inference/predict-failure/batch"
+    for stage in ("request_validation", "input_checks", "predict_proba", "logging"):
+        assert (
+            _sample(
+                text,
+                "inference_stage_duration_seconds_count",
+                stage=stage,
+                model_version=version,
+                route=single,
+            )
+            >= 1
+        )
+    assert _sample(text, "predictions_total", model_version=version, route=single) >= 1
+    assert _sample(text, "predictions_total", model_version=version, route=batch) >= 1
+    assert _sample(text, "prediction_row_errors_total", model_version=version, route=batch) >= 1
+    assert (
+        _sample(
+            text, "http_request_duration_seconds_count", route=single, method="POST", status="200"
+        )
+        >= 1
+    )
+    # The session's startup loaded (or trained) a model.
+    assert "model_lifecycle_duration_seconds_count" in text
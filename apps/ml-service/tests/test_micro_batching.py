@@ -0,0 +1,107 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.models.batcher import MicroBatcher, MicroBatchQueueFullError
+from src.models.registry import BatchItemResult, PredictionResult
+
+FEATURES = [[30.0, 1.0, 20.0, 0.3, 4.0], [48.0, 6.0, 24.0, 0.75, 10.0]]
+
+
+@pytest.fixture()
+def micro_batcher(client):
+    batcher = MicroBatcher(client.app.state.model_repository, max_batch_size=16, max_wait_ms=20)
+    batcher.start()
+    yield batcher
+    batcher.stop()
+
+
+def test_micro_batcher_coalesces_concurrent_requests(client, micro_batcher):
+    repository = client.app.state.model_repository
+    rows = [FEATURES[i % 2] for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        futures = list(pool.map(micro_batcher.submit, rows))
+    results = [future.result(timeout=5) for future in futures]
+
+    for row, result in zip(rows, results, strict=True):
+        assert result.probability == pytest.approx(repository.predict(row).probability)
+
+    stats = micro_batcher.stats()
+    assert stats.items == 64
+    assert stats.batches < 64
+    assert sum(stats.batch_size_histogram.values()) == stats.batches
+    assert max(stats.batch_size_histogram) == 16
+
+
+def test_micro_batcher_reports_per_item_errors(micro_batcher):
+    good = micro_batcher.submit(FEATURES[0])
+    bad = micro_batcher.submit([1.0, 2.0])
+
+    assert 0 <= good.result(timeout=5).probability <= 1
+    with pytest.raises(ValueError, match="Expected 5 features"):
+        bad.result(timeout=5)
+
+
+class _BlockingRepository:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.calls = 0
+
+    def predict_batch(self, rows):
+        self.calls += 1
+        self.release.wait()
+        prediction = PredictionResult(probability=0.5, model_version="1", run_id=None)
+        return [BatchItemResult(prediction=prediction) for _ in rows]
+
+
+def test_micro_batcher_rejects_submissions_beyond_its_queue():
+    repository = _BlockingRepository()
+    batcher = MicroBatcher(repository, max_batch_size=1, max_wait_ms=0, max_queue_size=1)
+    batcher.start()
+    try:
+        scoring = batcher.submit(FEATURES[0])
+        while repository.calls == 0:
+            time.sleep(0.001)
+        queued = batcher.submit(FEATURES[0])
+
+        with pytest.raises(MicroBatchQueueFullError):
+            batcher.submit(FEATURES[0]).result(timeout=0)
+
+        repository.release.set()
+        assert scoring.result(timeout=5).probability == queued.result(timeout=5).probability
+    finally:
+        repository.release.set()
+        batcher.stop()
+
+
+def test_stop_resolves_every_concurrently_submitted_prediction(client):
+    batcher = MicroBatcher(client.app.state.model_repository, max_batch_size=8, max_wait_ms=1)
+    batcher.start()
+    submitted = threading.Event()
+
+    def submit_many():
+        futures = []
+        for _ in range(500):
+            futures.append(batcher.submit(FEATURES[0]))
+            submitted.set()
+        return futures
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pending = [pool.submit(submit_many) for _ in range(4)]
+        submitted.wait()
+        batcher.stop()
+        futures = [future for result in pending for future in result.result()]
+
+    for future in futures:
+        # Scored, or failed by the shutdown; never left unresolved.
+        if future.exception(timeout=5) is not None:
+            assert isinstance(future.exception(), RuntimeError)
+
+
+def test_inference_stats_endpoint(client):
+    response = client.get("/inference/stats")
+    assert response.status_code == 200
+    assert response.json()["micro_batching"] is None
@@ -0,0 +1,99 @@
+from src.models.registry import LoadedModel, ModelRepository
+from src.services.trainer import train_and_register_model
+
+
+def test_repository_is_shared_across_requests(client):
+    repository = client.app.state.model_repository
+    assert repository.active is not None
+
+    response = client.post(
+        "/inference/predict-failure",
+        json={"asset_id": "asset-1", "features": [30.0, 1.0, 20.0, 0.3, 4.0]},
+    )
+    assert response.status_code == 200
+    assert client.app.state.model_repository is repository
+
+
+def test_refresh_swaps_in_newer_registry_version(isolated_settings):
+    repository = ModelRepository(settings=isolated_settings)
+    initial = repository.active
+    assert initial is not None
+
+    assert repository.refresh() is False
+
+    train_and_register_model(isolated_settings)
+    assert repository.refresh() is True
+
+    active = repository.active
+    assert active is not None
+    assert active.model_version != initial.model_version
+    assert repository.predict([30.0, 1.0, 20.0, 0.3, 4.0]).model_version == active.model_version
+
+
+def test_activate_replaces_snapshot(isolated_settings):
+    repository = ModelRepository(settings=isolated_settings)
+    current = repository.active
+    assert current is not None
+
+    replacement = LoadedModel(
+        pipeline=current.pipeline,
+        feature_names=current.feature_names,
+        model_version="pinned",
+        run_id=None,
+    )
+    repository.activate(replacement)
+
+    assert repository.predict([30.0, 1.0, 20.0, 0.3, 4.0]).model_version == "pinned"
+
+
+def test_local_first_bootstraps_in_background_without_any_model(isolated_settings):
+    settings = isolated_settings.model_copy(update={"model_startup_mode": "local_first"})
+    repository = ModelRepository(settings=settings)
+
+    assert repository.wait_until_synced(timeout=120)
+    assert repository.sync_state == "synced"
+    active = repository.active
+    assert active is not None
+    assert active.source == "training"
+
+
+def test_local_first_confirms_local_copy_of_registry_version(isolated_settings):
+    train_and_register_model(isolated_settings)
+    # Loading from the registry rewrites the local artifact with its version.
+    registry_model = ModelRepository(settings=isolated_settings).active
+    assert registry_model is not None and registry_model.source == "registry"
+
+    settings = isolated_settings.model_copy(update={"model_startup_mode": "local_first"})
+    repository = ModelRepository(settings=settings)
+    local = repository.active
+    assert local is not None
+    assert local.source == "local_artifact"
+    assert local.model_version == registry_model.model_version
+
+    assert repository.wait_until_synced(timeout=60)
+    active = repository.active
+    assert active is not None
+    assert active.source == "registry"
+    # Confirmed in place rather than downloaded again.
+    assert active.pipeline is local.pipeline
+
+
+def test_local_first_replaces_stale_local_copy(isolated_settings):
+    train_and_register_model(isolated_settings)
+    stale = ModelRepository(settings=isolated_settings).active
+    assert stale is not None
+    # Registered from elsewhere: the local artifact still holds the older version.
+    elsewhere = isolated_settings.model_copy(
+        update={"model_local_artifact": isolated_settings.model_local_artifact + ".other"}
+    )
+    newer = train_and_register_model(elsewhere)
+
+    settings = isolated_settings.model_copy(update={"model_startup_mode": "local_first"})
+    repository = ModelRepository(settings=settings)
+    assert repository.active is not None
+    assert repository.active.model_version == stale.model_version
+
+    assert repository.wait_until_synced(timeout=60)
+    assert repository.active is not None
+    assert repository.active.model_version == newer.model_version
+    assert repository.active.source == "registry"
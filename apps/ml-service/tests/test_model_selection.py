@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from mlflow.tracking import MlflowClient
+
+from src.models.model_cache import LoadedModelCache
+from src.models.registry import LoadedModel, ModelNotFoundError, ModelRepository
+from src.services.trainer import train_and_register_model
+
+ROW = [30.0, 1.0, 20.0, 0.3, 4.0]
+
+
+def _model(version: str) -> LoadedModel:
+    return LoadedModel(pipeline=None, feature_names=[], model_version=version, run_id=None)
+
+
+def test_loaded_model_cache_evicts_least_recently_used_within_budget():
+    cache = LoadedModelCache(max_bytes=100)
+    cache.put(("m", "1"), _model("1"), 40)
+    cache.put(("m", "2"), _model("2"), 40)
+    assert cache.get(("m", "1")) is not None
+
+    cache.put(("m", "3"), _model("3"), 40)
+    cache.put(("m", "4"), _model("4"), 500)  # over the whole budget: never cached
+
+    stats = cache.stats()
+    assert stats.models == ["m:1", "m:3"]
+    assert (stats.bytes, stats.evictions) == (80, 1)
+    assert cache.get(("m", "2")) is None and cache.get(("m", "4")) is None
+
+
+def test_resolve_pins_versions_and_stages(isolated_settings):
+    first = train_and_register_model(isolated_settings)
+    second = train_and_register_model(isolated_settings)
+    repository = ModelRepository(settings=isolated_settings)
+    assert repository.active.model_version == second.model_version
+
+    assert repository.resolve() is repository.active
+    assert repository.resolve(version=second.model_version) is repository.active
+
+    pinned = repository.resolve(version=first.model_version)
+    assert pinned.model_version == first.model_version
+    assert repository.resolve(version=first.model_version) is pinned
+    assert repository.predict(ROW, pinned).model_version == first.model_version
+    outcomes = repository.predict_batch([ROW, ROW], pinned)
+    assert {outcome.prediction.model_version for outcome in outcomes} == {first.model_version}
+    # The served model is unaffected.
+    assert repository.predict(ROW).model_version == second.model_version
+
+    MlflowClient().transition_model_version_stage(
+        isolated_settings.model_name, first.model_version, stage="Staging"
+    )
+    assert repository.resolve(stage="Staging") is pinned
+    assert repository.models.stats().models == [
+        f"{isolated_settings.model_name}:{first.model_version}"
+    ]
+
+
+def test_resolve_rejects_unknown_models(isolated_settings):
+    repository = ModelRepository(settings=isolated_settings)
+
+    with pytest.raises(ModelNotFoundError):
+        repository.resolve(version="999")
+    with pytest.raises(ModelNotFoundError):
+        repository.resolve(stage="Staging")
+    with pytest.raises(ModelNotFoundError):
+        repository.resolve(name="no-such-model")
+
+
+def test_predict_endpoint_selects_model(client):
+    active = client.app.state.model_repository.active
+
+    response = client.post(
+        "/inference/predict-failure",
+        json={"asset_id": "a", "features": ROW, "model": {"version": active.model_version}},
+    )
+    assert response.status_code == 200
+    assert response.json()["prediction"]["model_version"] == active.model_version
+
+    response = client.post(
+        "/inference/predict-failure/batch",
+        json={"items": [{"asset_id": "a", "features": ROW}], "model": {"version": "999"}},
+    )
+    assert response.status_code == 404
+
+    response = client.post(
+        "/inference/predict-failure",
+        json={"asset_id": "a", "features": ROW, "model": {"version": "1", "stage": "Staging"}},
+    )
+    assert response.status_code == 422
+
+    stats = client.get("/inference/stats").json()
+    assert stats["loaded_models"]["max_bytes"] > 0
+    assert stats["shadow"] is None
+
+
+def test_pinned_model_bypasses_prediction_cache(isolated_settings):
+    first = train_and_register_model(isolated_settings)
+    train_and_register_model(isolated_settings)
+    settings = isolated_settings.model_copy(update={"prediction_cache_enabled": True})
+    repository = ModelRepository(settings=settings)
+
+    pinned = repository.resolve(version=first.model_version)
+    served = repository.predict(ROW).probability
+    assert repository.predict(ROW, pinned).probability == pytest.approx(
+        float(repository.predict_proba(pinned, np.asarray([ROW]))[0])
+    )
+    assert repository.predict(ROW).probability == served
+    assert repository.cache.stats().size == 1
@@ -0,0 +1,84 @@
+import time
+
+import numpy as np
+
+from src.models.cache import PredictionCache
+from src.models.registry import LoadedModel, ModelRepository
+
+ROW = [30.0, 1.0, 20.0, 0.3, 4.0]
+
+
+def test_cache_counts_hits_misses_and_evictions():
+    cache = PredictionCache(max_entries=2, ttl_seconds=60)
+    matrix = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    keys = cache.keys("1", matrix)
+
+    assert cache.get_many(keys[:1]) == [None]
+    cache.put_many(keys, np.array([0.1, 0.2, 0.3]))
+    assert cache.get_many(keys) == [None, 0.2, 0.3]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 2, 1, 2)
+
+
+def test_cache_keys_include_model_version():
+    matrix = np.array([ROW])
+    assert PredictionCache.keys("1", matrix) != PredictionCache.keys("2", matrix)
+
+
+def test_cache_entries_expire():
+    cache = PredictionCache(max_entries=10, ttl_seconds=0.01)
+    keys = cache.keys("1", np.array([ROW]))
+    cache.put_many(keys, np.array([0.5]))
+    time.sleep(0.02)
+
+    assert cache.get_many(keys) == [None]
+    assert cache.stats().expirations == 1
+
+
+def test_repository_serves_repeated_rows_from_cache(isolated_settings):
+    settings = isolated_settings.model_copy(update={"prediction_cache_enabled": True})
+    repository = ModelRepository(settings=settings)
+    assert repository.cache is not None
+
+    first = repository.predict(ROW)
+    second = repository.predict(ROW)
+    assert first == second
+    assert repository.cache.stats().hits == 1
+
+    current = repository.active
+    repository.activate(
+        LoadedModel(
+            pipeline=current.pipeline,
+            feature_names=current.feature_names,
+            model_version="next",
+            run_id=None,
+        )
+    )
+    assert repository.cache.stats().size == 0
+    assert repository.predict(ROW).model_version == "next"
+
+
+def test_cache_drops_probabilities_computed_across_a_swap(isolated_settings, monkeypatch):
+    settings = isolated_settings.model_copy(update={"prediction_cache_enabled": True})
+    repository = ModelRepository(settings=settings)
+    current = repository.active
+    # Same version string, different snapshot: only the generation tells them apart.
+    replacement = LoadedModel(
+        pipeline=current.pipeline,
+        feature_names=current.feature_names,
+        model_version=current.model_version,
+        run_id=None,
+    )
+    predict_proba = ModelRepository._predict_proba
+
+    def swap_after_scoring(model, matrix):
+        probabilities = predict_proba(model, matrix)
+        repository.activate(replacement)
+        return probabilities
+
+    monkeypatch.setattr(repository, "_predict_proba", swap_after_scoring)
+    repository.predict(ROW)
+
+    assert repository.active is not current
+    assert repository.cache.stats().size == 0
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from mlflow.tracking import MlflowClient
+
+from src.models.registry import ModelRepository
+from src.models.shadow import ShadowScorer
+from src.services.data_loader import generate_synthetic_dataset
+from src.services.trainer import train_and_register_model
+
+
+def test_shadow_scorer_compares_staging_with_served_model(isolated_settings):
+    candidate = train_and_register_model(isolated_settings)
+    served = train_and_register_model(isolated_settings)
+    MlflowClient().transition_model_version_stage(
+        isolated_settings.model_name, candidate.model_version, stage="Staging"
+    )
+    repository = ModelRepository(settings=isolated_settings)
+    scorer = ShadowScorer(repository, stage="Staging", max_queued=100)
+    scorer.start()
+    repository.set_shadow_scorer(scorer)
+
+    rows = generate_synthetic_dataset(num_samples=40, random_state=5).features.to_numpy()
+    outcomes = repository.predict_batch(rows.tolist())
+    repository.predict(rows[0].tolist())
+    scorer.stop()
+
+    stats = scorer.stats()
+    assert (stats.submitted, stats.dropped, stats.errors) == (2, 0, 0)
+    [comparison] = stats.comparisons
+    assert (comparison.primary_version, comparison.shadow_version) == (
+        served.model_version,
+        candidate.model_version,
+    )
+    assert comparison.rows == 41
+
+    served_probabilities = np.array([outcome.prediction.probability for outcome in outcomes])
+    shadow_probabilities = repository.predict_proba(repository.resolve(stage="Staging"), rows)
+    agree = (served_probabilities >= 0.5) == (shadow_probabilities >= 0.5)
+    # The single prediction repeated the first row.
+    assert comparison.agreements == agree.sum() + agree[0]
+    assert comparison.max_abs_difference == pytest.approx(
+        np.abs(served_probabilities - shadow_probabilities).max()
+    )
+
+
+def test_shadow_scorer_drops_when_queue_is_full(isolated_settings):
+    repository = ModelRepository(settings=isolated_settings)
+    # Not started, so nothing drains the single queue slot.
+    scorer = ShadowScorer(repository, stage="Staging", max_queued=1)
+    matrix, probabilities = np.zeros((1, 5)), np.zeros(1)
+
+    scorer.submit("1", matrix, probabilities)
+    scorer.submit("1", matrix, probabilities)
+
+    stats = scorer.stats()
+    assert (stats.submitted, stats.dropped, stats.comparisons) == (1, 1, [])
+
+
+def test_shadow_scorer_drops_batches_beyond_its_memory_budget(isolated_settings):
+    repository = ModelRepository(settings=isolated_settings)
+    scorer = ShadowScorer(repository, stage="Staging", max_queued=100, max_queued_bytes=10_000)
+    small, large = np.zeros((10, 5)), np.zeros((1000, 5))
+
+    scorer.submit("1", small, np.zeros(10))
+    scorer.submit("1", large, np.zeros(1000))
+    scorer.submit("1", small, np.zeros(10))
+
+    stats = scorer.stats()
+    assert (stats.submitted, stats.dropped, stats.dropped_rows) == (2, 1, 1000)
+    assert stats.queued_bytes == 2 * (small.nbytes + 10 * 8)
+
+    scorer.start()
+    scorer.stop()
+    assert scorer.stats().queued_bytes == 0
@@ -0,0 +1,84 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.api.tensor import (
+    TENSOR_MEDIA_TYPE,
+    TensorPayloadError,
+    decode_tensor_batch,
+    read_tensor,
+    write_tensor,
+)
+
+# Exactly representable in float32, so both routes score identical values.
+ROW = [30.0, 1.0, 20.0, 0.25, 4.0]
+PATH = "/inference/predict-failure/tensor"
+
+
+def _payload(asset_ids, matrix, **header):
+    matrix = np.asarray(matrix, dtype=np.float32)
+    rows, features = matrix.shape
+    header.update(asset_ids=asset_ids, rows=rows, features=features)
+    return write_tensor(header, matrix)
+
+
+def test_decoded_matrix_is_a_view_of_the_body():
+    body = _payload(["a", "b"], [ROW, [0.5] * 5])
+    batch = decode_tensor_batch(body)
+
+    assert batch.asset_ids == ["a", "b"]
+    assert batch.matrix.dtype == np.dtype("<f4")
+    assert batch.matrix.shape == (2, 5)
+    assert np.shares_memory(batch.matrix, np.frombuffer(body, dtype=np.uint8))
+    assert (len(body) - batch.matrix.nbytes) % 8 == 0
+    np.testing.assert_array_equal(batch.matrix[0], np.asarray(ROW, dtype=np.float32))
+
+    for malformed in (b"nope", body[:-1], _payload(["a"], [ROW, ROW])):
+        with pytest.raises(TensorPayloadError):
+            decode_tensor_batch(malformed)
+
+
+def test_tensor_request_matches_json_batch(client):
+    rows = [ROW, [float("nan")] * 5, [10.0, 0.0, 5.0, 0.125, 1.0]]
+    body = _payload(["a", "b", "c"], rows)
+
+    json_response = client.post(PATH, content=body, headers={"content-type": TENSOR_MEDIA_TYPE})
+    assert json_response.status_code == 200
+    results = json_response.json()["results"]
+    assert [result["asset_id"] for result in results] == ["a", "b", "c"]
+    assert results[1]["prediction"] is None
+    assert results[1]["error"] == "Features must be finite numbers"
+
+    expected = client.post(
+        "/inference/predict-failure/batch",
+        json={
+            "items": [{"asset_id": "a", "features": ROW}, {"asset_id": "c", "features": rows[2]}]
+        },
+    ).json()["results"]
+    assert [results[0], results[2]] == expected
+
+    packed = client.post(
+        PATH,
+        content=body,
+        headers={"content-type": TENSOR_MEDIA_TYPE, "accept": TENSOR_MEDIA_TYPE},
+    )
+    assert packed.headers["content-type"] == TENSOR_MEDIA_TYPE
+    header, probabilities = read_tensor(packed.content)
+    assert header["asset_ids"] == ["a", "b", "c"]
+    assert (header["rows"], header["features"]) == (3, 1)
+    assert header["errors"] == {"1": "Features must be finite numbers"}
+    assert header["model_version"] == results[0]["prediction"]["model_version"]
+    assert math.isnan(probabilities[1, 0])
+    assert probabilities[0, 0] == pytest.approx(results[0]["prediction"]["probability"], rel=1e-6)
+
+
+def test_tensor_route_rejects_bad_requests(client):
+    headers = {"content-type": TENSOR_MEDIA_TYPE}
+
+    assert client.post(PATH, json={"items": []}).status_code == 415
+    assert client.post(PATH, content=b"BTTENS01", headers=headers).status_code == 422
+    assert client.post(PATH, content=_payload(["a"], [ROW[:3]]), headers=headers).status_code == 400
+
+    too_many = _payload([str(index) for index in range(1001)], [ROW] * 1001)
+    assert client.post(PATH, content=too_many, headers=headers).status_code == 413
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from mlflow.tracking import MlflowClient
+
+from src.models.local_artifact import flat_artifact_path, load_local_artifact
+from src.models.registry import ModelRepository
+from src.services.data_loader import TrainingData, generate_synthetic_dataset
+from src.services.hyperparameter_search import SearchConfig, run_search
+from src.services.trainer import train_and_register_model
+
+
+def test_hist_backend_trains_without_scaler_and_with_missing_values(isolated_settings):
+    settings = isolated_settings.model_copy(update={"training_backend": "hist_gradient_boosting"})
+    data = generate_synthetic_dataset(num_samples=400)
+    features = data.features.copy()
+    features.loc[::7, "temperature_avg"] = np.nan
+
+    info = train_and_register_model(
+        settings, data=TrainingData(features, data.labels, data.feature_names)
+    )
+
+    assert list(info.pipeline.named_steps) == ["classifier"]
+    assert 0.5 < info.metrics["auc"] <= 1
+
+    repository = ModelRepository(settings=settings)
+    assert repository.active.model_version == info.model_version
+    prediction = repository.predict([30.0, 1.0, 20.0, 0.3, 4.0])
+    assert 0 <= prediction.probability <= 1
+
+
+def test_search_supports_hist_backend():
+    data = generate_synthetic_dataset(num_samples=300)
+    config = SearchConfig(
+        backend="hist_gradient_boosting",
+        param_grid={"max_iter": [200], "max_leaf_nodes": [7, 15]},
+        cv_folds=3,
+        max_workers=1,
+    )
+
+    result = run_search(data.features, data.labels, config)
+
+    assert len(result.candidates) == 2
+    assert all(candidate.mean_estimators < 200 for candidate in result.candidates)
+
+
+def test_local_artifact_records_the_promoted_version(isolated_settings):
+    data = generate_synthetic_dataset(num_samples=200)
+    info = train_and_register_model(isolated_settings, data=data)
+
+    for prefer_flat in (False, True):
+        artifact = load_local_artifact(isolated_settings.model_local_artifact, prefer_flat)
+        assert (artifact.model_version, artifact.run_id) == (info.model_version, info.run_id)
+
+
+def test_failed_registration_writes_no_local_artifact(isolated_settings, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("registry unavailable")
+
+    monkeypatch.setattr(MlflowClient, "transition_model_version_stage", fail)
+    data = generate_synthetic_dataset(num_samples=200)
+    with pytest.raises(RuntimeError, match="registry unavailable"):
+        train_and_register_model(isolated_settings, data=data)
+
+    path = Path(isolated_settings.model_local_artifact)
+    assert not path.exists()
+    assert not flat_artifact_path(path).exists()
@@ -1,6 +1,42 @@
+import time
+
+
+def _wait_for_job(client, job_id, timeout=180.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        body = client.get(f"/training/jobs/{job_id}").json()
+        if body["status"] in ("succeeded", "failed"):
+            return body
+        time.sleep(0.5)
+    raise AssertionError(f"Training job {job_id} did not finish within {timeout}s")
+
+
 def test_training_trigger(client):
     response = client.post("/training/trigger")
-    assert response.status_code == 200
-    body = response.json()
-    assert body["model_version"]
-    assert body["run_id"]
+    assert response.status_code == 202
+    job = response.json()
+    assert job["job_id"]
+    assert job["status"] in ("queued", "running")
+
+    body = _wait_for_job(client, job["job_id"])
+    assert body["status"] == "succeeded", body["error"]
+    assert body["result"]["model_version"]
+    assert body["result"]["run_id"]
+
+    repository = client.app.state.model_repository
+    assert repository.active.model_version == body["result"]["model_version"]
+
+
+def test_training_trigger_deduplicates_pending_jobs(client):
+    payload = {"num_samples": 300, "random_state": 7}
+    first = client.post("/training/trigger", json=payload).json()
+    second = client.post("/training/trigger", json=payload).json()
+    assert first["job_id"] == second["job_id"]
+
+    assert _wait_for_job(client, first["job_id"])["status"] == "succeeded"
+    listed = client.get("/training/jobs").json()
+    assert first["job_id"] in {job["job_id"] for job in listed}
+
+
+def test_training_job_not_found(client):
+    assert client.get("/training/jobs/missing").status_code == 404